@@ -0,0 +1,104 @@
+"""
+Offline benchmarks of derpibooru. Responses are replayed from cassette, so
+results don't depend on network and can be compared between commits:
+
+  python benchmarks/run.py [--latency 0.02] [--cassette path] [--json]
+
+Without existing cassette it's recorded from synthetic booru first.
+"""
+import os
+import sys
+import tracemalloc
+from argparse import ArgumentParser
+from json import dumps
+from tempfile import mkdtemp
+from time import perf_counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from derpibooru import Search, Comments, Tags, Forums, Topics, Posts, Image, Session, ReplayTransport
+from synthetic import record
+
+LIMIT = 10000
+
+def search(session, limit=LIMIT):
+  return sum(1 for image in Search(session=session, per_page=50, limit=limit))
+
+def search_prefetch(session):
+  return sum(1 for image in Search(session=session, per_page=50, limit=2000).prefetch(2))
+
+def search_parallel(session):
+  return sum(1 for image in Search(session=session, per_page=50, limit=2000).parallel(8))
+
+def search_sequential(session):
+  return search(session, limit=2000)
+
+def comments(session):
+  return sum(1 for comment in Comments(session=session, per_page=50, limit=LIMIT))
+
+def tags(session):
+  return sum(1 for tag in Tags(session=session, per_page=50, limit=LIMIT))
+
+def forums(session):
+  return sum(1 for forum in Forums(session=session))
+
+def topics(session):
+  return sum(1 for topic in Topics("dis", session=session, per_page=50, limit=LIMIT))
+
+def posts(session):
+  return sum(1 for post in Posts("dis", "topic-1", session=session, per_page=50, limit=LIMIT))
+
+THROUGHPUT = [search, comments, tags, forums, topics, posts]
+CONCURRENCY = [search_sequential, search_prefetch, search_parallel]
+
+def measure(name, scenario, session):
+  started = perf_counter()
+  items = scenario(session)
+  seconds = perf_counter() - started
+  return {"name": name, "items": items, "seconds": round(seconds, 4),
+          "items_per_second": round(items / seconds, 1) if seconds else None}
+
+def construction(session):
+  data = [image.data for image in Search(session=session, per_page=50, limit=LIMIT)]
+  started = perf_counter()
+  for image in data:
+    Image(image, session=session)
+  seconds = perf_counter() - started
+  return {"name": "Image() construction", "items": len(data), "seconds": round(seconds, 4),
+          "items_per_second": round(len(data) / seconds, 1)}
+
+def memory(session):
+  tracemalloc.start()
+  before = tracemalloc.get_traced_memory()[0]
+  images = list(Search(session=session, per_page=50, limit=LIMIT))
+  used = tracemalloc.get_traced_memory()[0] - before
+  tracemalloc.stop()
+  return {"name": "memory per 10k Image()", "items": len(images), "bytes": used * 10000 // len(images)}
+
+def main():
+  parser = ArgumentParser(description=__doc__.strip().splitlines()[0])
+  parser.add_argument("--cassette", help="cassette file; recorded from synthetic booru if absent")
+  parser.add_argument("--latency", type=float, default=0.02,
+                      help="seconds of replayed latency for prefetch and parallel runs")
+  parser.add_argument("--json", action="store_true", help="print results as JSON")
+  args = parser.parse_args()
+
+  cassette = args.cassette or os.path.join(mkdtemp(), "cassette.jsonl")
+  if not os.path.exists(cassette):
+    record(cassette, THROUGHPUT + CONCURRENCY)
+  replay = lambda latency=0.0: Session(transport=ReplayTransport(cassette, latency=latency), cache=None)
+
+  results = [measure(scenario.__name__, scenario, replay()) for scenario in THROUGHPUT]
+  results += [measure(f"{scenario.__name__} (latency {args.latency}s)", scenario, replay(args.latency))
+              for scenario in CONCURRENCY]
+  results += [construction(replay()), memory(replay())]
+
+  if args.json:
+    print(dumps(results, indent=2))
+  else:
+    for result in results:
+      values = ", ".join(f"{name}={value}" for name, value in result.items() if name != "name")
+      print(f"{result['name']:<40} {values}")
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,92 @@
+"""
+Synthetic booru for offline benchmarks: SyntheticTransport() answers API
+requests with generated but realistic JSON, and record() writes cassette of
+every benchmark scenario with it, so runs need no network.
+"""
+from json import dumps
+from random import Random
+from urllib.parse import urlsplit
+
+from derpibooru import Transport, Response, RecordingTransport, Session
+
+TOTAL = 20000
+TAG_NAMES = ["safe", "solo", "pony", "mare", "twilight sparkle", "rarity", "applejack",
+             "fluttershy", "pinkie pie", "rainbow dash", "artist:example", "smiling",
+             "looking at you", "cute", "simple background", "white background", "horn",
+             "wings", "open mouth", "eyes closed", "species:unicorn", "oc", "oc:example"]
+
+def image_data(id_number):
+  random = Random(id_number)
+  tags = sorted(random.sample(TAG_NAMES, random.randint(5, 15)))
+  path = f"/img/2020/1/1/{id_number}"
+  return {
+    "id": id_number, "aspect_ratio": 1.5, "comment_count": random.randint(0, 30),
+    "created_at": f"2020-01-01T00:00:{id_number % 60:02d}Z", "deletion_reason": None,
+    "description": "Description " * random.randint(0, 20), "downvotes": random.randint(0, 20),
+    "duplicate_of": None, "duration": 0.0, "faves": random.randint(0, 500),
+    "first_seen_at": "2020-01-01T00:00:00Z", "format": "png", "height": 1000, "hidden_from_users": False,
+    "intensities": {"ne": 1.0, "nw": 1.0, "se": 1.0, "sw": 1.0}, "mime_type": "image/png",
+    "name": f"{id_number}.png", "orig_sha512_hash": "0" * 128, "processed": True,
+    "representations": {size: f"{path}/{size}.png" for size in
+                        ("full", "large", "medium", "small", "tall", "thumb", "thumb_small", "thumb_tiny")},
+    "score": random.randint(0, 500), "sha512_hash": "0" * 128, "size": 100000, "source_url": "",
+    "spoilered": False, "tag_count": len(tags), "tag_ids": [TAG_NAMES.index(tag) + 1 for tag in tags],
+    "tags": tags, "thumbnails_generated": True, "updated_at": "2020-01-01T00:00:00Z",
+    "uploader": "Uploader", "uploader_id": 1, "upvotes": random.randint(0, 500),
+    "view_url": f"{path}/full.png", "width": 1500, "wilson_score": 0.9
+  }
+
+def comment_data(id_number):
+  return {"id": id_number, "author": "Commenter", "avatar": "/avatar.png", "body": "Comment " * 10,
+          "created_at": "2020-01-01T00:00:00Z", "edit_reason": None, "edited_at": None,
+          "image_id": id_number // 3 + 1, "updated_at": "2020-01-01T00:00:00Z", "user_id": 1}
+
+def tag_data(id_number):
+  name = f"tag {id_number}"
+  return {"id": id_number, "name": name, "slug": name.replace(" ", "+"), "aliased_tag": None,
+          "aliases": [], "category": "character", "description": "", "dnp_entries": [],
+          "images": id_number * 10, "implied_by_tags": [], "implied_tags": [], "name_in_namespace": name,
+          "namespace": None, "short_description": "", "spoiler_image_uri": None}
+
+def topic_data(id_number):
+  return {"slug": f"topic-{id_number}", "title": f"Topic {id_number}", "post_count": 100,
+          "view_count": 1000, "sticky": False, "last_replied_to_at": "2020-01-01T00:00:00Z",
+          "locked": False, "user_id": 1, "author": "Author"}
+
+def post_data(id_number):
+  return {"id": id_number, "author": "Poster", "avatar": "/avatar.png", "body": "Post " * 20,
+          "created_at": "2020-01-01T00:00:00Z", "edit_reason": None, "edited_at": None,
+          "updated_at": "2020-01-01T00:00:00Z", "user_id": 1}
+
+LISTS = {"search/images": ("images", image_data), "search/comments": ("comments", comment_data),
+         "search/tags": ("tags", tag_data), "topics": ("topics", topic_data), "posts": ("posts", post_data)}
+
+class SyntheticTransport(Transport):
+  """
+  Serves TOTAL items for every list, newest first, by page and per_page.
+  """
+  def send(self, method, url, params=None, headers=None, json=None, proxies=None, timeout=None):
+    path = urlsplit(url).path.split("/api/v1/json/", 1)[-1]
+    params = params or {}
+    if path == "forums":
+      body = {"forums": [{"name": "General", "short_name": "dis", "description": "",
+                          "topic_count": 100, "post_count": 10000}], "total": 1}
+    else:
+      endpoint = "search/" + path.split("/")[1] if path.startswith("search/") else path.rsplit("/", 1)[-1]
+      if endpoint not in LISTS:
+        return Response(404, {}, b"{}", url)
+      items_name, item = LISTS[endpoint]
+      per_page, page = int(params.get("per_page", 25)), int(params.get("page", 1))
+      first = TOTAL - (page - 1) * per_page
+      body = {items_name: [item(id_number) for id_number in range(first, max(first - per_page, 0), -1)],
+              "total": TOTAL}
+    return Response(200, {"Content-Type": "application/json"}, dumps(body).encode("utf-8"), url)
+
+def record(path, scenarios):
+  """
+  Runs every scenario with recording of synthetic responses to cassette.
+  """
+  transport = RecordingTransport(path, SyntheticTransport())
+  for scenario in scenarios:
+    scenario(Session(transport=transport))
+  return transport.recorded
@@ -41,6 +41,22 @@ from .forums import Forums, Forum, Topics, Topic, Posts
 from .query import query
 from .sort import sort
 from .user import user
+from .session import Session
+from .cache import Cache
+from .httpcache import HTTPCache
+from .ratelimit import RateLimiter
+from .retry import Retry, RetryError
+from .concurrency import AdaptiveConcurrency
+from .breaker import CircuitBreaker, CircuitOpenError
+from .proxies import ProxyPool
+from .transport import Transport, RequestsTransport, HTTP2Transport, Response
+from .cassette import RecordingTransport, ReplayTransport, CassetteError
+from .metrics import Metrics, RequestEvent
+from .tracing import Tracer, Span, SpanExporter, JSONLinesExporter, MemoryExporter
+from .profiling import Profiler, profile
+from .checkpoint import Checkpoint
+from .categories import TagCategories
+from .vocabulary import TagVocabulary
 
 __all__ = [
   "Search", "Related",
@@ -59,5 +75,34 @@ __all__ = [
   "Forums", "Forum", "Topics", "Topic", "Posts",
   "query",
   "sort",
-  "user"
+  "user",
+  "Session",
+  "Checkpoint",
+  "TagCategories",
+  "TagVocabulary",
+  "Cache",
+  "HTTPCache",
+  "RateLimiter",
+  "Retry",
+  "RetryError",
+  "AdaptiveConcurrency",
+  "CircuitBreaker",
+  "CircuitOpenError",
+  "ProxyPool",
+  "Transport",
+  "RequestsTransport",
+  "HTTP2Transport",
+  "Response",
+  "RecordingTransport",
+  "ReplayTransport",
+  "CassetteError",
+  "Metrics",
+  "RequestEvent",
+  "Tracer",
+  "Span",
+  "SpanExporter",
+  "JSONLinesExporter",
+  "MemoryExporter",
+  "Profiler",
+  "profile"
 ]
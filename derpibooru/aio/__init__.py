@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2014, Joshua Stone
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Asyncio bindings for Philomena API. Requires aiohttp.
+
+Typical usage:
+
+>>> from derpibooru.aio import AsyncSearch, AsyncSession
+>>> async with AsyncSession() as session:
+...   async for image in AsyncSearch(session=session).query("rarity").limit(100):
+...     print(image.url)
+
+Returned objects keep data of a response only. Their methods and properties
+which request more (e.g. update(), comments(), faved_by) raise RuntimeError
+inside event loop, coroutines like get_image_data() should be awaited instead.
+
+"""
+
+from .session import AsyncSession
+from .search import AsyncSearch
+from .comments import AsyncComments
+from .tags import AsyncTags
+from .galleries import AsyncGalleries
+from .posts import AsyncSearchPosts
+from .forums import AsyncForums, AsyncTopics, AsyncPosts
+from .request import get_image_data, get_comment_data, get_tag_data, get_user_data, \
+                     get_filter_data, get_forum_data, get_topic_data, get_post_data
+
+__all__ = [
+  "AsyncSession",
+  "AsyncSearch",
+  "AsyncComments",
+  "AsyncTags",
+  "AsyncGalleries",
+  "AsyncSearchPosts",
+  "AsyncForums", "AsyncTopics", "AsyncPosts",
+  "get_image_data", "get_comment_data", "get_tag_data", "get_user_data",
+  "get_filter_data", "get_forum_data", "get_topic_data", "get_post_data"
+]
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2014, Joshua Stone
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from ..comments import Comments
+from ..comment import Comment
+from .session import blocking_guard
+from .request import get_comments
+
+__all__ = [
+  "AsyncComments"
+]
+
+class AsyncComments(Comments):
+  """
+  AsyncComments() is Comments() which is consumed with "async for" instead of "for".
+  Every method returns a new instance of AsyncComments(), and pages of comments are
+  requested through AsyncSession() connection pool. prefetch() and parallel()
+  set number of pages requested concurrently ahead of current one.
+  """
+  def __init__(self, *args, **kwargs):
+    super().__init__(*args, **kwargs)
+    self._search = get_comments(self._params, self._limit + self._skip if self._limit else self._limit,
+                                url_domain=self.url_domain, proxies=self.proxies, session=self.session,
+                                ahead=max(self._prefetch, self._parallel))
+
+  def __iter__(self):
+    raise TypeError(f"{self.__class__.__name__}() should be iterated with async for")
+
+  def __aiter__(self):
+    return self
+
+  async def __anext__(self):
+    """
+    Returns a result wrapped in a new instance of Comment().
+    """
+    self._save_checkpoint()
+    try:
+      while self._skipped < self._skip:
+        await self._search.__anext__()
+        self._skipped += 1
+      data = await self._search.__anext__()
+    except StopAsyncIteration:
+      self._save_checkpoint(done=True)
+      raise
+    return Comment(self._next_data(data), url_domain=self.url_domain, proxies=self.proxies, session=blocking_guard)
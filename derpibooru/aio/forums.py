@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2014, Joshua Stone
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from ..forums import Forums, Forum, Topics, Topic, Posts
+from ..post import Post
+from .session import blocking_guard
+from .request import get_forums, get_topics, get_posts
+
+__all__ = [
+  "AsyncForums",
+  "AsyncTopics",
+  "AsyncPosts"
+]
+
+class AsyncForums(Forums):
+  """
+  AsyncForums() is Forums() which is consumed with "async for" instead of "for".
+  """
+  def __init__(self, *args, **kwargs):
+    super().__init__(*args, **kwargs)
+    self._search = get_forums(self._params, self._limit,
+                              url_domain=self.url_domain, proxies=self.proxies, session=self.session)
+
+  def __iter__(self):
+    raise TypeError(f"{self.__class__.__name__}() should be iterated with async for")
+
+  def __aiter__(self):
+    return self
+
+  async def __anext__(self):
+    """
+    Returns a result wrapped in a new instance of Forum().
+    """
+    return Forum(await self._search.__anext__(), url_domain=self.url_domain, proxies=self.proxies, session=blocking_guard)
+
+class AsyncTopics(Topics):
+  """
+  AsyncTopics() is Topics() which is consumed with "async for" instead of "for".
+  """
+  def __init__(self, *args, **kwargs):
+    super().__init__(*args, **kwargs)
+    self._search = get_topics(self.forum_short_name, self._params, self._limit,
+                              url_domain=self.url_domain, proxies=self.proxies, session=self.session)
+
+  def __iter__(self):
+    raise TypeError(f"{self.__class__.__name__}() should be iterated with async for")
+
+  def __aiter__(self):
+    return self
+
+  async def __anext__(self):
+    """
+    Returns a result wrapped in a new instance of Topic().
+    """
+    return Topic(await self._search.__anext__(), forum_short_name=self.forum_short_name,
+                 url_domain=self.url_domain, proxies=self.proxies, session=blocking_guard)
+
+class AsyncPosts(Posts):
+  """
+  AsyncPosts() is Posts() which is consumed with "async for" instead of "for".
+  """
+  def __init__(self, *args, **kwargs):
+    super().__init__(*args, **kwargs)
+    self._search = get_posts(self._params, forum_short_name=self.forum_short_name,
+                             topic_slug=self.topic_slug, limit=self._limit,
+                             url_domain=self.url_domain, proxies=self.proxies, session=self.session)
+
+  def __iter__(self):
+    raise TypeError(f"{self.__class__.__name__}() should be iterated with async for")
+
+  def __aiter__(self):
+    return self
+
+  async def __anext__(self):
+    """
+    Returns a result wrapped in a new instance of Post().
+    """
+    return Post(await self._search.__anext__(), url_domain=self.url_domain, proxies=self.proxies, session=blocking_guard)
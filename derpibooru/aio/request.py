@@ -0,0 +1,285 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2014, Joshua Stone
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from asyncio import ensure_future
+from collections import deque
+from math import ceil
+from ..helpers import format_params, keyset_position, keyset_query
+from .session import get_session
+from ..cache import cached
+
+__all__ = [
+  "request", "get_images", "get_image_data",
+  "request_comments", "get_comments", "get_comment_data",
+  "request_tags", "get_tags", "get_tag_data",
+  "get_user_data",
+  "get_filter_data",
+  "request_galleries", "get_galleries",
+  "request_forums", "get_forums", "get_forum_data",
+  "request_topics", "get_topics", "get_topic_data",
+  "request_posts", "get_posts", "get_post_data"
+]
+
+async def request_page(search, p, post_request=False, proxies={}, session=None):
+  if post_request:
+    request = await get_session(session).post(search, params=p, proxies=proxies)
+  else:
+    request = await get_session(session).get(search, params=p, proxies=proxies)
+  if request.status_code == 200:
+    return request.json()
+
+async def request_content(search, p, items_name, post_request=False, proxies={}, session=None,
+                          limit=None, ahead=0):
+  """
+  With ahead > 0 up to that number of next pages are requested concurrently
+  while current page is iterated. Planning uses total count from first page.
+  """
+  p = dict(p)
+  data = await request_page(search, p, post_request=post_request, proxies=proxies, session=session)
+  if "per_page" not in p:
+    p["per_page"] = 50
+  per_page, page = p["per_page"], p.get("page", 1)
+  last_page = ceil(data["total"] / per_page) if data and "total" in data else None
+  if last_page is not None and limit is not None:
+    last_page = min(last_page, page + ceil(limit / per_page) - 1)
+  pending, item_count = deque(), 0
+
+  def schedule():
+    next_page = page + len(pending) + 1
+    if last_page is None or next_page <= last_page:
+      pending.append(ensure_future(request_page(search, {**p, "page": next_page},
+                                                post_request=post_request,
+                                                proxies=proxies, session=session)))
+
+  try:
+    while data is not None:
+      items = data[items_name]
+      item_count += len(items)
+      if len(items) < per_page or (limit is not None and item_count >= limit):
+        ahead = 0
+      while len(pending) < ahead:
+        length = len(pending)
+        schedule()
+        if len(pending) == length:
+          break
+      for item in items:
+        yield item
+      if len(items) < per_page or (limit is not None and item_count >= limit):
+        break
+      if not pending:
+        schedule()
+        if not pending:
+          break
+      page += 1
+      data = await pending.popleft()
+  finally:
+    for task in pending:
+      task.cancel()
+
+async def keyset_content(search, p, items_name, keyset, after=None, proxies={}, session=None,
+                         limit=None):
+  """
+  Pages are selected by sort value and id of the last item instead of page number.
+  """
+  p = dict(p)
+  q, sd = p.get("q", "*"), p.get("sd", "desc")
+  if "per_page" not in p:
+    p["per_page"] = 50
+  item_count = 0
+  while True:
+    if after is not None:
+      p["q"], p["page"] = f"({q}),{keyset_query(keyset, sd, after)}", 1
+    data = await request_page(search, p, proxies=proxies, session=session)
+    if data is None or not data[items_name]:
+      break
+    items = data[items_name]
+    for item in items:
+      yield item
+    item_count += len(items)
+    if len(items) < p["per_page"] or (limit is not None and item_count >= limit):
+      break
+    after = keyset_position(items[-1], keyset)
+
+async def get_content(request_func, *request_args, limit=50, **request_kwargs):
+  if limit is not None:
+    if limit > 0:
+      index = 0
+      async for content_item in request_func(*request_args, limit=limit, **request_kwargs):
+        yield content_item
+        index += 1
+        if index >= limit:
+          break
+  else:
+    async for content_item in request_func(*request_args, **request_kwargs):
+      yield content_item
+
+async def get_data(url, name, proxies={}, session=None):
+  request = await get_session(session).get(url, proxies=proxies)
+
+  if request.status_code == 200:
+    data = request.json()
+    return data[name]
+
+async def request(params, url_domain="https://derpibooru.org", proxies={}, session=None,
+                  limit=None, ahead=0, keyset=False, after=None):
+  if "reverse_url" in params and params["reverse_url"]:
+    search, p = f"{url_domain}/api/v1/json/search/reverse", format_params(params)
+    p = {i:p[i] for i in p if i in ('url','distance')}
+    post_request = True
+  else:
+    search, p = f"{url_domain}/api/v1/json/search/images", format_params(params)
+    p = {i:p[i] for i in p if i not in ('url','distance')}
+    post_request = False
+  if keyset and not post_request:
+    images = keyset_content(search, p, "images", params["sf"], after=after,
+                            proxies=proxies, session=session, limit=limit)
+  else:
+    images = request_content(search, p, "images", post_request=post_request,
+                             proxies=proxies, session=session, limit=limit, ahead=ahead)
+  async for image in images:
+    yield image
+
+def get_images(params, limit=50, url_domain="https://derpibooru.org", proxies={}, session=None,
+               ahead=0, keyset=False, after=None):
+  return get_content(request, params, limit=limit, url_domain=url_domain,
+                     proxies=proxies, session=session, ahead=ahead, keyset=keyset, after=after)
+
+@cached("images", get_session)
+async def get_image_data(id_number, url_domain="https://derpibooru.org", proxies={}, session=None):
+  '''id_number can be "featured"'''
+  data = await get_data(f"{url_domain}/api/v1/json/images/{id_number}", "image",
+                        proxies=proxies, session=session)
+
+  if data and data["duplicate_of"]:
+    return await get_image_data(data["duplicate_of"], url_domain=url_domain,
+                                proxies=proxies, session=session)
+  return data
+
+def request_comments(params, url_domain="https://derpibooru.org", proxies={}, session=None,
+                     limit=None, ahead=0):
+  search, p = f"{url_domain}/api/v1/json/search/comments", format_params(params)
+  return request_content(search, p, "comments", proxies=proxies, session=session,
+                         limit=limit, ahead=ahead)
+
+def get_comments(params, limit=50, url_domain="https://derpibooru.org", proxies={}, session=None,
+                 ahead=0):
+  return get_content(request_comments, params, limit=limit, url_domain=url_domain,
+                     proxies=proxies, session=session, ahead=ahead)
+
+@cached("comments", get_session)
+async def get_comment_data(id_number, url_domain="https://derpibooru.org", proxies={}, session=None):
+  return await get_data(f"{url_domain}/api/v1/json/comments/{id_number}", "comment",
+                        proxies=proxies, session=session)
+
+def request_tags(params, url_domain="https://derpibooru.org", proxies={}, session=None,
+                 limit=None, ahead=0):
+  search, p = f"{url_domain}/api/v1/json/search/tags", format_params(params)
+  return request_content(search, p, "tags", proxies=proxies, session=session,
+                         limit=limit, ahead=ahead)
+
+def get_tags(params, limit=50, url_domain="https://derpibooru.org", proxies={}, session=None,
+             ahead=0):
+  return get_content(request_tags, params, limit=limit, url_domain=url_domain,
+                     proxies=proxies, session=session, ahead=ahead)
+
+@cached("tags", get_session)
+async def get_tag_data(tag, url_domain="https://derpibooru.org", proxies={}, session=None):
+  return await get_data(f"{url_domain}/api/v1/json/tags/{tag}", "tag",
+                        proxies=proxies, session=session)
+
+@cached("profiles", get_session)
+async def get_user_data(user_id, url_domain="https://derpibooru.org", proxies={}, session=None):
+  return await get_data(f"{url_domain}/api/v1/json/profiles/{user_id}", "user",
+                        proxies=proxies, session=session)
+
+@cached("filters", get_session)
+async def get_filter_data(filter_id, url_domain="https://derpibooru.org", proxies={}, session=None):
+  return await get_data(f"{url_domain}/api/v1/json/filters/{filter_id}", "filter",
+                        proxies=proxies, session=session)
+
+def request_galleries(params, url_domain="https://derpibooru.org", proxies={}, session=None,
+                      limit=None, ahead=0):
+  search, p = f"{url_domain}/api/v1/json/search/galleries", format_params(params)
+  return request_content(search, p, "galleries", proxies=proxies, session=session,
+                         limit=limit, ahead=ahead)
+
+def get_galleries(params, limit=50, url_domain="https://derpibooru.org", proxies={}, session=None,
+                  ahead=0):
+  return get_content(request_galleries, params, limit=limit, url_domain=url_domain,
+                     proxies=proxies, session=session, ahead=ahead)
+
+def request_forums(params, url_domain="https://derpibooru.org", proxies={}, session=None,
+                   limit=None, ahead=0):
+  search, p = f"{url_domain}/api/v1/json/forums", format_params(params)
+  return request_content(search, p, "forums", proxies=proxies, session=session,
+                         limit=limit, ahead=ahead)
+
+def get_forums(params, limit=50, url_domain="https://derpibooru.org", proxies={}, session=None,
+               ahead=0):
+  return get_content(request_forums, params, limit=limit, url_domain=url_domain,
+                     proxies=proxies, session=session, ahead=ahead)
+
+@cached("forums", get_session)
+async def get_forum_data(short_name, url_domain="https://derpibooru.org", proxies={}, session=None):
+  return await get_data(f"{url_domain}/api/v1/json/forums/{short_name}", "forum",
+                        proxies=proxies, session=session)
+
+def request_topics(forum_short_name, params, url_domain="https://derpibooru.org", proxies={},
+                   session=None, limit=None, ahead=0):
+  search = f"{url_domain}/api/v1/json/forums/{forum_short_name}/topics"
+  return request_content(search, format_params(params), "topics", proxies=proxies,
+                         session=session, limit=limit, ahead=ahead)
+
+def get_topics(forum_short_name, params, limit=50, url_domain="https://derpibooru.org", proxies={},
+               session=None, ahead=0):
+  return get_content(request_topics, forum_short_name, params, limit=limit,
+                     url_domain=url_domain, proxies=proxies, session=session, ahead=ahead)
+
+@cached("topics", get_session)
+async def get_topic_data(forum_short_name, topic_slug, url_domain="https://derpibooru.org",
+                         proxies={}, session=None):
+  return await get_data(f"{url_domain}/api/v1/json/forums/{forum_short_name}/topics/{topic_slug}",
+                        "topic", proxies=proxies, session=session)
+
+def request_posts(params, forum_short_name="", topic_slug="", url_domain="https://derpibooru.org",
+                  proxies={}, session=None, limit=None, ahead=0):
+  if forum_short_name and topic_slug:
+    search = f"{url_domain}/api/v1/json/forums/{forum_short_name}/topics/{topic_slug}/posts"
+  else:
+    search = f"{url_domain}/api/v1/json/search/posts"
+  return request_content(search, format_params(params), "posts", proxies=proxies,
+                         session=session, limit=limit, ahead=ahead)
+
+def get_posts(params, forum_short_name="", topic_slug="", limit=50,
+              url_domain="https://derpibooru.org", proxies={}, session=None, ahead=0):
+  return get_content(request_posts, params, limit=limit, forum_short_name=forum_short_name,
+                     topic_slug=topic_slug, url_domain=url_domain, proxies=proxies,
+                     session=session, ahead=ahead)
+
+@cached("posts", get_session)
+async def get_post_data(id_number, url_domain="https://derpibooru.org", proxies={}, session=None):
+  return await get_data(f"{url_domain}/api/v1/json/posts/{id_number}", "post",
+                        proxies=proxies, session=session)
@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2014, Joshua Stone
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from asyncio import get_running_loop, sleep, TimeoutError
+from json import loads
+from aiohttp import ClientSession, TCPConnector, ClientConnectionError, ClientPayloadError, \
+                    ClientTimeout
+
+from ..cache import set_cache
+from ..session import get_session as get_sync_session
+from ..retry import Retry, RetryError
+from ..breaker import set_breaker
+
+__all__ = [
+  "errors",
+  "AsyncSession",
+  "AsyncResponse",
+  "default_session",
+  "get_session",
+  "BlockingGuard",
+  "blocking_guard"
+]
+
+# Exceptions of failed connection
+errors = (ClientConnectionError, ClientPayloadError, TimeoutError)
+
+class AsyncResponse(object):
+  """
+  Body of response read while connection was held, with requests-like
+  status_code, headers, text and json().
+  """
+  def __init__(self, status_code, headers, content):
+    self.status_code = status_code
+    self.headers = headers
+    self.content = content
+
+  @property
+  def text(self):
+    return self.content.decode("utf-8", errors="replace")
+
+  def json(self):
+    return loads(self.content)
+
+class AsyncSession(object):
+  """
+  AsyncSession() owns aiohttp connection pool which is reused by every request
+  made with it. limit is total number of connections, limit_per_host is number
+  of connections for every booru (0 means no own limit).
+
+  Pool is created lazily in running event loop and created again if session
+  is used from another loop.
+  Single objects requested by id are kept by cache like in Session().
+  Every request waits for rate_limiter (RateLimiter()) without blocking loop.
+  Failed requests are sent again by retry like in Session().
+  breaker and timeout (connect, read) are the same as in Session().
+  concurrency (AdaptiveConcurrency()) isn't supported, because it blocks
+  threads; limit and limit_per_host bound requests in flight instead.
+  """
+  def __init__(self, limit=100, limit_per_host=0, cache=True, rate_limiter=None, retry=True,
+               breaker=True, timeout=(5, 30), concurrency=None):
+    if concurrency is not None:
+      raise TypeError("AsyncSession() doesn't support concurrency, use limit_per_host")
+    self.limit = limit
+    self.limit_per_host = limit_per_host
+    self.cache = set_cache(cache)
+    self.rate_limiter = rate_limiter
+    if retry is True:
+      retry = Retry(exceptions=errors)
+    self.retry = retry or None
+    self.breaker = set_breaker(breaker)
+    self.timeout = timeout
+    self._client = None
+    self._loop = None
+
+  async def __aenter__(self):
+    return self
+
+  async def __aexit__(self, *exc_info):
+    await self.close()
+
+  def client(self):
+    loop = get_running_loop()
+    if self._client is None or self._client.closed or self._loop is not loop:
+      connector = TCPConnector(limit=self.limit, limit_per_host=self.limit_per_host)
+      connect, read = self.timeout if isinstance(self.timeout, tuple) else (self.timeout, self.timeout)
+      timeout = ClientTimeout(sock_connect=connect, sock_read=read)
+      self._client, self._loop = ClientSession(connector=connector, timeout=timeout), loop
+    return self._client
+
+  async def request_once(self, method, url, params=None, json=None, proxies={}):
+    if self.rate_limiter is not None:
+      wait = self.rate_limiter.reserve(url)
+      if wait > 0:
+        await sleep(wait)
+    pool = proxies if hasattr(proxies, "acquire") else None
+    if pool is not None:
+      token = pool.acquire(url)
+      proxies = token[0].proxies
+    proxy = proxies.get(url.split(":", 1)[0]) if proxies else None
+    status_code, failed = None, False
+    try:
+      async with self.client().request(method, url, params=params, json=json,
+                                       proxy=proxy) as response:
+        content = await response.read()
+        status_code = response.status
+        return AsyncResponse(response.status, response.headers, content)
+    except errors:
+      failed = True
+      raise
+    finally:
+      # Cancelled prefetch or exception of caller says nothing about proxy
+      if pool is not None and (failed or status_code is not None):
+        pool.release(token, status_code)
+      elif pool is not None:
+        pool.cancel(token)
+
+  async def _attempts(self, method, url, params=None, json=None, proxies={}):
+    if self.retry is None:
+      return await self.request_once(method, url, params=params, json=json, proxies=proxies)
+    attempt = 0
+    while True:
+      attempt += 1
+      try:
+        response = await self.request_once(method, url, params=params, json=json, proxies=proxies)
+      except Exception as error:
+        wait = self.retry.delay(method, url, attempt, error=error)
+      else:
+        wait = self.retry.delay(method, url, attempt, response=response)
+        if wait is None:
+          return response
+      await sleep(wait)
+
+  async def request(self, method, url, params=None, json=None, proxies={}):
+    if self.breaker is None:
+      return await self._attempts(method, url, params=params, json=json, proxies=proxies)
+    self.breaker.before(url)
+    status_code, failed = None, False
+    try:
+      response = await self._attempts(method, url, params=params, json=json, proxies=proxies)
+      status_code = response.status_code
+      return response
+    except RetryError as error:
+      status_code = error.status_code
+      raise
+    except errors:
+      failed = True
+      raise
+    finally:
+      # Request counts once for breaker after all attempts; cancelled one
+      # and exceptions of caller say nothing about booru
+      if failed or status_code is not None:
+        self.breaker.record(url, status_code)
+      else:
+        self.breaker.cancel(url)
+
+  async def get(self, url, params=None, proxies={}):
+    return await self.request("GET", url, params=params, proxies=proxies)
+
+  async def post(self, url, params=None, json=None, proxies={}):
+    return await self.request("POST", url, params=params, json=json, proxies=proxies)
+
+  async def close(self):
+    """
+    Closes all pooled connections.
+    """
+    if self._client is not None and not self._client.closed:
+      await self._client.close()
+    self._client = None
+
+default_session = AsyncSession()
+
+def get_session(session=None):
+  """
+  Returns given session or shared default one.
+  """
+  return session if session is not None else default_session
+
+class BlockingGuard(object):
+  """
+  BlockingGuard() is the session of Image(), Comment() and other objects
+  returned by async searches. Their methods and properties which request more
+  data (e.g. update(), comments(), faved_by) use synchronous default Session(),
+  so they raise RuntimeError inside running event loop instead of blocking it;
+  get_image_data() and other coroutines should be awaited there.
+  """
+  def _check(self, url):
+    try:
+      get_running_loop()
+    except RuntimeError:
+      return
+    raise RuntimeError(f"blocking request of {url} inside event loop, await get_*_data() instead")
+
+  def __getattr__(self, name):
+    if name.startswith("__"):
+      raise AttributeError(name)
+    return getattr(get_sync_session(), name)
+
+  def get(self, url, **kwargs):
+    self._check(url)
+    return get_sync_session().get(url, **kwargs)
+
+  def post(self, url, **kwargs):
+    self._check(url)
+    return get_sync_session().post(url, **kwargs)
+
+blocking_guard = BlockingGuard()
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2014, Joshua Stone
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from threading import Lock
+from time import monotonic
+
+from .ratelimit import url_domain_of
+
+__all__ = [
+  "CircuitBreaker",
+  "CircuitOpenError",
+  "set_breaker"
+]
+
+class Circuit(object):
+  """
+  State of requests to one booru.
+  """
+  def __init__(self):
+    self.failures = 0
+    self.opened = None
+    self.probing = False
+
+class CircuitBreaker(object):
+  """
+  CircuitBreaker() stops sending requests to booru after failures failed
+  requests in a row (connection error, timeout or one of statuses) and
+  raises CircuitOpenError() at once instead. After reset seconds one request
+  is let through as a probe: success closes the circuit, failure opens it
+  for reset seconds again. Other boorus aren't affected.
+  """
+  def __init__(self, failures=5, reset=30, statuses=(500, 502, 503, 504)):
+    self.failures = failures
+    self.reset = reset
+    self.statuses = set(statuses)
+    self._circuits = {}
+    self._lock = Lock()
+
+  @property
+  def states(self):
+    """
+    Returns "closed", "open" or "half-open" for every booru.
+    """
+    with self._lock:
+      return {url_domain: self._state(circuit) for url_domain, circuit in self._circuits.items()}
+
+  def _state(self, circuit):
+    if circuit.opened is None:
+      return "closed"
+    elif circuit.probing or monotonic() - circuit.opened >= self.reset:
+      return "half-open"
+    else:
+      return "open"
+
+  def before(self, url):
+    """
+    Raises CircuitOpenError() if request to url shouldn't be sent.
+    """
+    url_domain = url_domain_of(url)
+    with self._lock:
+      circuit = self._circuits.setdefault(url_domain, Circuit())
+      if circuit.opened is None:
+        return
+      retry_in = self.reset - (monotonic() - circuit.opened)
+      if retry_in > 0 or circuit.probing:
+        raise CircuitOpenError(url_domain, max(retry_in, 0))
+      circuit.probing = True
+
+  def cancel(self, url):
+    """
+    Lets next probe through if request to url ended without result.
+    """
+    with self._lock:
+      self._circuits.setdefault(url_domain_of(url), Circuit()).probing = False
+
+  def record(self, url, status_code=None):
+    """
+    Takes result of request: status_code, or None for failed connection.
+    """
+    with self._lock:
+      circuit = self._circuits.setdefault(url_domain_of(url), Circuit())
+      if status_code is None or status_code in self.statuses:
+        circuit.failures += 1
+        if circuit.probing or circuit.failures >= self.failures:
+          circuit.opened = monotonic()
+      else:
+        circuit.failures, circuit.opened = 0, None
+      circuit.probing = False
+
+class CircuitOpenError(Exception):
+  """
+  Requests to booru are stopped after failures in a row.
+  """
+  def __init__(self, url_domain, retry_in):
+    self.url_domain = url_domain
+    self.retry_in = retry_in
+
+  def __str__(self):
+    return f"{self.url_domain} is unavailable, next attempt in {self.retry_in:.1f} seconds"
+
+def set_breaker(breaker):
+  """
+  Returns given CircuitBreaker(), a new one for True, or None.
+  """
+  if breaker is True:
+    return CircuitBreaker()
+  elif breaker is False:
+    return None
+  else:
+    return breaker
@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2014, Joshua Stone
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from collections import OrderedDict
+from functools import wraps
+from inspect import iscoroutinefunction
+from threading import Lock
+from time import monotonic
+
+__all__ = [
+  "Cache",
+  "default_ttl",
+  "set_cache",
+  "cache_key",
+  "cached"
+]
+
+# Seconds single objects are kept by endpoint
+default_ttl = {
+  "images": 60,
+  "comments": 300,
+  "tags": 3600,
+  "filters": 3600,
+  "profiles": 600,
+  "forums": 3600,
+  "topics": 60,
+  "posts": 300
+}
+
+class Cache(object):
+  """
+  Cache() keeps single objects (image, tag, filter, profile etc.) requested
+  by id for some seconds set for every endpoint by ttl, e.g.
+  Cache(ttl={"tags": 86400}). When maxsize objects are kept, the least
+  recently used one is dropped.
+
+  Any object with get(key), set(key, value), invalidate(key) and clear()
+  methods can be passed to Session(cache=...) instead.
+  """
+  def __init__(self, maxsize=1024, ttl={}, default=60):
+    self.maxsize = maxsize
+    self.ttl = {**default_ttl, **ttl}
+    self.default = default
+    self.hits = 0
+    self.misses = 0
+    self._items = OrderedDict()
+    self._lock = Lock()
+
+  def __len__(self):
+    return len(self._items)
+
+  @property
+  def stats(self):
+    """
+    Returns counters of hits and misses and number of kept objects.
+    """
+    return {"hits": self.hits, "misses": self.misses, "size": len(self._items)}
+
+  def get(self, key):
+    """
+    Returns kept object or None if it's absent or expired.
+    """
+    with self._lock:
+      item = self._items.get(key)
+      if item is not None and item[0] > monotonic():
+        self._items.move_to_end(key)
+        self.hits += 1
+        return item[1]
+      elif item is not None:
+        del self._items[key]
+      self.misses += 1
+
+  def set(self, key, value):
+    ttl = self.ttl.get(key[1], self.default)
+    if ttl <= 0:
+      return
+    with self._lock:
+      self._items[key] = (monotonic() + ttl, value)
+      self._items.move_to_end(key)
+      while len(self._items) > self.maxsize:
+        self._items.popitem(last=False)
+
+  def invalidate(self, key):
+    with self._lock:
+      self._items.pop(key, None)
+
+  def clear(self):
+    """
+    Drops all kept objects; counters are kept.
+    """
+    with self._lock:
+      self._items.clear()
+
+def set_cache(cache):
+  """
+  Returns given cache, a new Cache() for True, or None.
+  """
+  if cache is True:
+    return Cache()
+  elif cache is False:
+    return None
+  else:
+    return cache
+
+def cache_key(url_domain, endpoint, *ids):
+  return (url_domain.rstrip("/"), endpoint, "/".join(str(id_part) for id_part in ids))
+
+def cached(endpoint, get_session):
+  """
+  Makes get_***_data function return objects kept by cache of session.
+  Objects not found aren't kept.
+  """
+  def decorator(func):
+    if iscoroutinefunction(func):
+      @wraps(func)
+      async def wrapper(*ids, url_domain="https://derpibooru.org", proxies={}, session=None):
+        cache = get_session(session).cache
+        if cache is None:
+          return await func(*ids, url_domain=url_domain, proxies=proxies, session=session)
+        key = cache_key(url_domain, endpoint, *ids)
+        data = cache.get(key)
+        if data is None:
+          data = await func(*ids, url_domain=url_domain, proxies=proxies, session=session)
+          if data is not None:
+            cache.set(key, data)
+        return dict(data) if data is not None else None
+    else:
+      @wraps(func)
+      def wrapper(*ids, url_domain="https://derpibooru.org", proxies={}, session=None):
+        cache = get_session(session).cache
+        if cache is None:
+          return func(*ids, url_domain=url_domain, proxies=proxies, session=session)
+        key = cache_key(url_domain, endpoint, *ids)
+        data = cache.get(key)
+        if data is not None and hasattr(get_session(session), "cache_hit"):
+          get_session(session).cache_hit(url_domain, endpoint)
+        if data is None:
+          data = func(*ids, url_domain=url_domain, proxies=proxies, session=session)
+          if data is not None:
+            cache.set(key, data)
+        return dict(data) if data is not None else None
+    return wrapper
+  return decorator
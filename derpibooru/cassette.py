@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2014, Joshua Stone
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from base64 import b64decode, b64encode
+from json import dumps, loads
+from threading import Lock
+from time import sleep
+
+from .transport import Transport, RequestsTransport, Response
+
+__all__ = [
+  "RecordingTransport",
+  "ReplayTransport",
+  "CassetteError",
+  "interaction_key"
+]
+
+def interaction_key(method, url, params=None, json=None):
+  """
+  Returns key of request in cassette; API key isn't a part of it.
+  """
+  params = sorted((str(name), str(value)) for name, value in (params or {}).items()
+                  if name != "key")
+  return dumps([method.upper(), url, params, json], sort_keys=True)
+
+def encode_body(content):
+  try:
+    return {"body": content.decode("utf-8")}
+  except UnicodeDecodeError:
+    return {"body": b64encode(content).decode("ascii"), "base64": True}
+
+def decode_body(record):
+  if record.get("base64"):
+    return b64decode(record["body"])
+  return record["body"].encode("utf-8")
+
+class RecordingTransport(Transport):
+  """
+  RecordingTransport() sends requests with transport (RequestsTransport() by
+  default) and appends every request and response to cassette file at path,
+  one JSON object per line. API key isn't written.
+  """
+  def __init__(self, path, transport=None):
+    self.path = path
+    self.transport = transport if transport is not None else RequestsTransport()
+    self.errors = self.transport.errors
+    self.recorded = 0
+    self._lock = Lock()
+
+  @property
+  def pool_sizes(self):
+    return self.transport.pool_sizes
+
+  def pool_size(self, url_domain, maxsize):
+    self.transport.pool_size(url_domain, maxsize)
+
+  def send(self, method, url, params=None, headers=None, json=None, proxies=None, timeout=None):
+    response = self.transport.send(method, url, params=params, headers=headers, json=json,
+                                   proxies=proxies, timeout=timeout)
+    record = {"key": interaction_key(method, url, params, json), "status": response.status_code,
+              "headers": dict(response.headers), **encode_body(response.content)}
+    with self._lock, open(self.path, "a", encoding="utf-8") as cassette:
+      cassette.write(dumps(record) + "\n")
+      self.recorded += 1
+    return response
+
+  def close(self):
+    self.transport.close()
+
+class ReplayTransport(Transport):
+  """
+  ReplayTransport() serves responses from cassette file written by
+  RecordingTransport() without network, waiting latency seconds for every
+  one. Repeated request gets recorded responses in order, then the last one
+  again. Request absent in cassette raises CassetteError().
+  """
+  def __init__(self, path, latency=0.0):
+    self.path = path
+    self.latency = latency
+    self.replayed = 0
+    self._records = {}
+    self._served = {}
+    self._lock = Lock()
+    with open(path, encoding="utf-8") as cassette:
+      for line in cassette:
+        if line.strip():
+          record = loads(line)
+          self._records.setdefault(record["key"], []).append(record)
+
+  def __len__(self):
+    return sum(len(records) for records in self._records.values())
+
+  def send(self, method, url, params=None, headers=None, json=None, proxies=None, timeout=None):
+    key = interaction_key(method, url, params, json)
+    with self._lock:
+      records = self._records.get(key)
+      if not records:
+        raise CassetteError(method, url, params)
+      served = self._served.get(key, 0)
+      self._served[key] = served + 1
+      self.replayed += 1
+    record = records[min(served, len(records) - 1)]
+    if self.latency:
+      sleep(self.latency)
+    return Response(record["status"], record["headers"], decode_body(record), url)
+
+class CassetteError(Exception):
+  """
+  Request wasn't recorded in cassette.
+  """
+  def __init__(self, method, url, params=None):
+    self.method = method
+    self.url = url
+    self.params = params
+
+  def __str__(self):
+    return f"{self.method} {self.url} {self.params or ''} isn't recorded in cassette"
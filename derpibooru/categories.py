@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2014, Joshua Stone
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from itertools import islice
+from threading import Lock
+
+from .request import get_tags_by_names
+
+__all__ = [
+  "TagCategories",
+  "set_categories",
+  "with_categories"
+]
+
+artist_names = {"artist needed", "anonymous artist", "kotobukiya"}
+species_names = {"humanized", "anthro centaur", "bat alicorn"}
+character_categories = {"character", "oc"}
+character_exclude = {"oc", "oc only"}
+
+class TagCategories(object):
+  """
+  TagCategories() is a cache of tag data which serves artists, species,
+  characters and spoiler of images from memory. Unknown tags are requested
+  by 50 names with one search query, and every tag is requested only once,
+  so one instance can be shared by many images, searches and threads.
+  """
+  def __init__(self, url_domain="https://derpibooru.org", proxies={}, session=None):
+    self.proxies = proxies
+    self.session = session
+    self.url_domain = url_domain
+    self._tags = {}
+    self._slugs = {}
+    self._lock = Lock()
+
+  def __len__(self):
+    return len(self._tags)
+
+  def __contains__(self, name):
+    return name in self._tags
+
+  def clear(self):
+    """
+    Forgets all cached tags.
+    """
+    with self._lock:
+      self._tags.clear()
+      self._slugs.clear()
+
+  def resolve(self, names, field="name"):
+    """
+    Requests tags which aren't cached yet; field is "name" or "slug".
+    Names of failed requests aren't cached, so they are requested again.
+    """
+    index = self._tags if field == "name" else self._slugs
+    with self._lock:
+      unknown = [name for name in dict.fromkeys(names) if name not in index]
+    if not unknown:
+      return
+    failed = []
+    found = list(get_tags_by_names(unknown, field=field, url_domain=self.url_domain,
+                                   proxies=self.proxies, session=self.session, failed=failed))
+    failed = set(failed)
+    with self._lock:
+      for name, tag in found:
+        if tag:
+          self._tags[tag["name"]] = tag
+          self._slugs[tag["slug"]] = tag
+        elif name not in failed:
+          index[name] = None
+
+  def tags(self, names, field="name"):
+    """
+    Returns list of tag data for names (or slugs) in the same order.
+    """
+    names = list(names)
+    self.resolve(names, field=field)
+    index = self._tags if field == "name" else self._slugs
+    return [index[name] for name in names if index.get(name)]
+
+  def artists(self, names):
+    return [tag["name_in_namespace"] for tag in self.tags(names)
+            if (tag["category"] == "origin" and tag["namespace"]) or tag["name"] in artist_names]
+
+  def species(self, names):
+    return [tag["name_in_namespace"] for tag in self.tags(names)
+            if tag["category"] == "species" or tag["name"] in species_names]
+
+  def characters(self, names):
+    return [tag["name_in_namespace"] for tag in self.tags(names)
+            if tag["category"] in character_categories and tag["name"] not in character_exclude]
+
+  def spoiler(self, names):
+    spoiler_tags, aliases = set(), []
+    for tag in self.tags(names):
+      if tag["category"] == "spoiler" and tag["name"] != "leak":
+        spoiler_tags.add(tag["name_in_namespace"])
+      elif tag["category"] == "content-official" and tag["aliases"]:
+        aliases.extend(tag["aliases"])
+      elif tag["category"] == "content-official":
+        spoiler_tags.add(tag["name_in_namespace"])
+    for tag in self.tags(aliases, field="slug"):
+      if tag["category"] == "spoiler" and tag["name"] != "leak":
+        spoiler_tags.add(tag["name_in_namespace"])
+    return sorted(spoiler_tags)
+
+def set_categories(categories, url_domain="https://derpibooru.org", proxies={}, session=None):
+  """
+  Returns given TagCategories(), a new one for True, or None.
+  """
+  if categories is True:
+    return TagCategories(url_domain=url_domain, proxies=proxies, session=session)
+  elif categories is False:
+    return None
+  else:
+    return categories
+
+def with_categories(images, categories, per_page=50):
+  """
+  Yields image data by pages, requesting tags of the whole page at once
+  before the first image of it.
+  """
+  images = iter(images)
+  while True:
+    page = list(islice(images, per_page or 25))
+    if not page:
+      return
+    categories.resolve(tag for image in page for tag in image["tags"])
+    for image in page:
+      yield image
@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2014, Joshua Stone
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import json
+import os
+from tempfile import NamedTemporaryFile
+
+from .helpers import join_params
+
+__all__ = [
+  "Checkpoint",
+  "Resumable",
+  "set_checkpoint",
+  "load_checkpoint",
+  "canonical_parameters",
+  "page_position"
+]
+
+class Checkpoint(object):
+  """
+  Checkpoint() saves position of Search(), Comments() or SearchPosts()
+  iteration to JSON file every N items, so a long crawl can be continued with
+  resume() after crash or restart. Items returned before the last save are
+  considered processed. File is replaced atomically and doesn't contain API key.
+  """
+  def __init__(self, path, every=100):
+    self.path = os.fspath(path)
+    self.every = int(every) if every and int(every) > 0 else 1
+
+  def __str__(self):
+    return f"Checkpoint({self.path})"
+
+  def due(self, count):
+    return count > 0 and count % self.every == 0
+
+  def save(self, state):
+    directory = os.path.dirname(os.path.abspath(self.path))
+    with NamedTemporaryFile("w", dir=directory, prefix=".checkpoint-",
+                            suffix=".tmp", delete=False) as tmp:
+      json.dump(state, tmp)
+      tmp.flush()
+      os.fsync(tmp.fileno())
+    os.replace(tmp.name, self.path)
+
+  def load(self):
+    return load_checkpoint(self.path)
+
+def set_checkpoint(checkpoint):
+  if checkpoint is None or isinstance(checkpoint, Checkpoint):
+    return checkpoint
+  else:
+    return Checkpoint(checkpoint)
+
+def load_checkpoint(path):
+  with open(path) as checkpoint_file:
+    return json.load(checkpoint_file)
+
+def canonical_parameters(parameters):
+  """
+  Returns JSON-compatible parameters without API key.
+  """
+  return {name: sorted(value) if isinstance(value, (set, frozenset)) else value
+          for name, value in parameters.items() if name != "key"}
+
+def page_position(page, per_page, offset):
+  """
+  Returns page and number of items to skip on it for offset counted from
+  start of page.
+  """
+  per_page = per_page or 25
+  return page + offset // per_page, offset % per_page
+
+class Resumable(object):
+  """
+  Resumable() is the mixin of Search(), Comments() and SearchPosts() which saves
+  position of iteration with checkpoint() and continues it with resume().
+  Builders pass skip and count, so methods chained after resume() keep position.
+  """
+  checkpoint_name = None
+
+  def _position(self, parameters):
+    """
+    Returns page and number of items to skip on it for saved state.
+    """
+    return page_position(parameters["page"] or 1, parameters["per_page"],
+                         self._skip + self._yielded)
+
+  def _extra_state(self):
+    return {}
+
+  @classmethod
+  def _extra_params(cls, state):
+    return {}
+
+  @property
+  def state(self):
+    """
+    Returns position of current iteration in form saved by checkpoint().
+    """
+    parameters = canonical_parameters(self.parameters)
+    parameters["page"], skip = self._position(parameters)
+    return {
+      "class": self.checkpoint_name,
+      "url_domain": self.url_domain,
+      "parameters": parameters,
+      "limit": self._limit - self._yielded if self._limit is not None else None,
+      "skip": skip,
+      "count": self._count + self._yielded,
+      "every": self._checkpoint.every if self._checkpoint else None,
+      **self._extra_state()
+    }
+
+  @classmethod
+  def resume(cls, checkpoint, **kwargs):
+    """
+    Continues iteration saved by checkpoint(). API key isn't saved, so it
+    should be given again; other keyword arguments (e.g. session, prefetch)
+    are passed to a new instance. Position is saved to the same file further.
+    """
+    if not isinstance(checkpoint, Checkpoint):
+      checkpoint = Checkpoint(checkpoint)
+    state = checkpoint.load()
+    if state["class"] != cls.checkpoint_name:
+      raise ValueError(state["class"])
+    if state["every"]:
+      checkpoint.every = state["every"]
+    params = join_params(state["parameters"], {"limit": state["limit"],
+                                               "url_domain": state["url_domain"],
+                                               "skip": state["skip"],
+                                               "count": state["count"],
+                                               "checkpoint": checkpoint,
+                                               **cls._extra_params(state),
+                                               **kwargs})
+
+    return cls(**params)
+
+  def _next_data(self, data):
+    """
+    Counts returned result for state.
+    """
+    self._yielded += 1
+    self._last = data
+    return data
+
+  def _save_checkpoint(self, done=False):
+    if self._checkpoint and (done or self._checkpoint.due(self._yielded)):
+      self._checkpoint.save(self.state)
+
+  def _next_result(self):
+    """
+    Returns raw data of the next result after skipped ones.
+    """
+    self._save_checkpoint()
+    try:
+      while self._skipped < self._skip:
+        next(self._search)
+        self._skipped += 1
+      data = next(self._search)
+    except StopIteration:
+      self._save_checkpoint(done=True)
+      raise
+    return self._next_data(data)
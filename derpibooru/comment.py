@@ -24,23 +24,24 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-from .request import get_comment_data
+from .request import get_comment_data, invalidate_data
+from .record import Record
 
 __all__ = [
   "Comment"
 ]
 
-class Comment(object):
-  def __init__(self, data, comment_id=None, url_domain="https://derpibooru.org", proxies={}):
+class Comment(Record):
+  __slots__ = ("proxies", "session", "url_domain")
+
+  def __init__(self, data, comment_id=None, url_domain="https://derpibooru.org", proxies={}, session=None):
     self.proxies = proxies
+    self.session = session
     self.url_domain = url_domain
     if data is None and comment_id:
-      self._data = data = get_comment_data(comment_id, url_domain=url_domain, proxies=proxies)
+      self._data = data = get_comment_data(comment_id, url_domain=url_domain, proxies=proxies, session=session)
     else:
       self._data = data
-    for field, body in self.data.items():
-      if not hasattr(self, field):
-        setattr(self, field, body)
 
   def __str__(self):
     if self.author:
@@ -61,7 +62,8 @@ class Comment(object):
     return f"{self.url_domain}/images/{self.image_id}#comment_{self.id}"
 
   def update(self):
-    data = get_comment_data(self.id, url_domain=self.url_domain, proxies=self.proxies)
+    invalidate_data("comments", self.id, url_domain=self.url_domain, session=self.session)
+    data = get_comment_data(self.id, url_domain=self.url_domain, proxies=self.proxies, session=self.session)
 
     if data:
       self._data = data
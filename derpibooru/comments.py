@@ -26,13 +26,15 @@
 
 from .request import get_comments, url_comments
 from .comment import Comment
-from .helpers import search_comments_fields, api_key, join_params, set_limit, validate_filter
+from .helpers import search_comments_fields, api_key, join_params, set_limit, validate_filter, \
+                     set_depth
+from .checkpoint import Checkpoint, Resumable, set_checkpoint
 
 __all__ = [
   "Comments"
 ]
 
-class Comments(object):
+class Comments(Resumable):
   """
   Comments() is the interface for interacting with Derpibooru's API similar on Search().
 
@@ -41,15 +43,19 @@ class Comments(object):
   interactions predictable as well as making versioning of searches relatively
   easy.
   """
+  checkpoint_name = "Comments"
+
   def __init__(self, key="", q=set(), limit=50, filter_id="",
                author="", body="", created_at="", comment_id="", image_id="",
                my=None, user_id="", per_page=25, page=1,
-               url_domain="https://derpibooru.org", proxies={}):
+               url_domain="https://derpibooru.org", proxies={}, session=None,
+               prefetch=0, parallel=0, checkpoint=None, skip=0, count=0):
     """
     By default initializes an instance of Comments with the parameters to get
     the first 25 comments on Derpibooru's comments activity page.
     """
     self.proxies = proxies
+    self.session = session
     self.url_domain = url_domain
     self._params = {
       "key": api_key(key),
@@ -61,7 +67,14 @@ class Comments(object):
       "page": set_limit(page)
     }
     self._limit = set_limit(limit)
-    self._search = get_comments(self._params, self._limit, url_domain=self.url_domain, proxies=self.proxies)
+    self._prefetch = set_depth(prefetch)
+    self._parallel = set_depth(parallel)
+    self._checkpoint = set_checkpoint(checkpoint)
+    self._skip, self._skipped = set_depth(skip), 0
+    self._yielded, self._count, self._last = 0, set_depth(count), None
+    self._search = get_comments(self._params, self._limit + self._skip if self._limit else self._limit,
+                                url_domain=self.url_domain, proxies=self.proxies, session=self.session,
+                                prefetch=self._prefetch, parallel=self._parallel)
   
   def __iter__(self):
     """
@@ -96,7 +109,13 @@ class Comments(object):
     params = join_params(self.parameters, {"key": key,
                                            "limit": self._limit,
                                            "url_domain": self.url_domain,
-                                           "proxies": self.proxies}
+                                           "proxies": self.proxies,
+                                           "session": self.session,
+                                           "prefetch": self._prefetch,
+                                           "parallel": self._parallel,
+                                           "checkpoint": self._checkpoint,
+                                           "skip": self._skip,
+                                           "count": self._count}
                         )
 
     return self.__class__(**params)
@@ -108,7 +127,13 @@ class Comments(object):
     params = join_params(self.parameters, {"q": q,
                                            "limit": self._limit,
                                            "url_domain": self.url_domain,
-                                           "proxies": self.proxies}
+                                           "proxies": self.proxies,
+                                           "session": self.session,
+                                           "prefetch": self._prefetch,
+                                           "parallel": self._parallel,
+                                           "checkpoint": self._checkpoint,
+                                           "skip": self._skip,
+                                           "count": self._count}
                         )
 
     return self.__class__(**params)
@@ -120,7 +145,65 @@ class Comments(object):
     """
     params = join_params(self.parameters, {"limit": limit, 
                                            "url_domain": self.url_domain,
-                                           "proxies": self.proxies})
+                                           "proxies": self.proxies,
+                                           "session": self.session,
+                                           "prefetch": self._prefetch,
+                                           "parallel": self._parallel,
+                                           "checkpoint": self._checkpoint,
+                                           "skip": self._skip,
+                                           "count": self._count})
+
+    return self.__class__(**params)
+
+  def prefetch(self, depth):
+    """
+    Set number of next pages of comments requested in background while current
+    page is iterated, or set to 0 to request pages on demand; default 0.
+    """
+    params = join_params(self.parameters, {"limit": self._limit,
+                                           "url_domain": self.url_domain,
+                                           "proxies": self.proxies,
+                                           "session": self.session,
+                                           "prefetch": depth,
+                                           "parallel": self._parallel,
+                                           "checkpoint": self._checkpoint,
+                                           "skip": self._skip,
+                                           "count": self._count})
+
+    return self.__class__(**params)
+
+  def parallel(self, workers):
+    """
+    Set number of threads requesting pages of comments concurrently, planned
+    by total count from first page, or set to 0 to request pages one by one;
+    default 0. Session pool size should be not less than workers.
+    """
+    params = join_params(self.parameters, {"limit": self._limit,
+                                           "url_domain": self.url_domain,
+                                           "proxies": self.proxies,
+                                           "session": self.session,
+                                           "prefetch": self._prefetch,
+                                           "parallel": workers,
+                                           "checkpoint": self._checkpoint,
+                                           "skip": self._skip,
+                                           "count": self._count})
+
+    return self.__class__(**params)
+
+  def checkpoint(self, path, every=100):
+    """
+    Save position of iteration to file every N comments, so it can be continued
+    by Comments.resume(path) after crash or restart.
+    """
+    params = join_params(self.parameters, {"limit": self._limit,
+                                           "url_domain": self.url_domain,
+                                           "proxies": self.proxies,
+                                           "session": self.session,
+                                           "prefetch": self._prefetch,
+                                           "parallel": self._parallel,
+                                           "checkpoint": Checkpoint(path, every),
+                                           "skip": self._skip,
+                                           "count": self._count})
 
     return self.__class__(**params)
 
@@ -134,7 +217,13 @@ class Comments(object):
     params = join_params(self.parameters, {"filter_id": validate_filter(filter_id),
                                            "limit": self._limit,
                                            "url_domain": self.url_domain,
-                                           "proxies": self.proxies}
+                                           "proxies": self.proxies,
+                                           "session": self.session,
+                                           "prefetch": self._prefetch,
+                                           "parallel": self._parallel,
+                                           "checkpoint": self._checkpoint,
+                                           "skip": self._skip,
+                                           "count": self._count}
                         )
 
     return self.__class__(**params)
@@ -207,7 +296,13 @@ class Comments(object):
      params = join_params(self.parameters, {"q": query,
                                            "limit": self._limit,
                                            "url_domain": self.url_domain,
-                                           "proxies": self.proxies}
+                                           "proxies": self.proxies,
+                                           "session": self.session,
+                                           "prefetch": self._prefetch,
+                                           "parallel": self._parallel,
+                                           "checkpoint": self._checkpoint,
+                                           "skip": self._skip,
+                                           "count": self._count}
                          )
 
      return self.__class__(**params)
@@ -220,7 +315,13 @@ class Comments(object):
      params = join_params(self.parameters, {"q": query,
                                            "limit": self._limit,
                                            "url_domain": self.url_domain,
-                                           "proxies": self.proxies}
+                                           "proxies": self.proxies,
+                                           "session": self.session,
+                                           "prefetch": self._prefetch,
+                                           "parallel": self._parallel,
+                                           "checkpoint": self._checkpoint,
+                                           "skip": self._skip,
+                                           "count": self._count}
                          )
 
      return self.__class__(**params)
@@ -232,7 +333,13 @@ class Comments(object):
     params = join_params(self.parameters, {"page": set_limit(page),
                                            "limit": self._limit,
                                            "url_domain": self.url_domain,
-                                           "proxies": self.proxies}
+                                           "proxies": self.proxies,
+                                           "session": self.session,
+                                           "prefetch": self._prefetch,
+                                           "parallel": self._parallel,
+                                           "checkpoint": self._checkpoint,
+                                           "skip": self._skip,
+                                           "count": self._count}
                         )
 
     return self.__class__(**params)
@@ -245,7 +352,13 @@ class Comments(object):
     params = join_params(self.parameters, {"per_page": set_limit(limit),
                                            "limit": self._limit,
                                            "url_domain": self.url_domain,
-                                           "proxies": self.proxies}
+                                           "proxies": self.proxies,
+                                           "session": self.session,
+                                           "prefetch": self._prefetch,
+                                           "parallel": self._parallel,
+                                           "checkpoint": self._checkpoint,
+                                           "skip": self._skip,
+                                           "count": self._count}
                         )
 
     return self.__class__(**params)
@@ -254,4 +367,4 @@ class Comments(object):
     """
     Returns a result wrapped in a new instance of Comment().
     """
-    return Comment(next(self._search), url_domain=self.url_domain, proxies=self.proxies)
+    return Comment(self._next_result(), url_domain=self.url_domain, proxies=self.proxies, session=self.session)
\ No newline at end of file
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2014, Joshua Stone
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from threading import Condition, Lock
+from time import monotonic
+
+from .ratelimit import url_domain_of
+
+__all__ = [
+  "AdaptiveConcurrency"
+]
+
+class DomainLimit(object):
+  """
+  Limit of requests in flight to one booru.
+  """
+  def __init__(self, initial):
+    self.limit = float(initial)
+    self.inflight = 0
+    self.latency = None
+    self.decreased = 0.0
+    self.condition = Condition()
+
+class AdaptiveConcurrency(object):
+  """
+  AdaptiveConcurrency() limits number of requests in flight to every booru
+  and adjusts it AIMD way: the limit grows by increase for every limit of
+  successful responses, and is multiplied by decrease after 429 or 5xx
+  status, connection error or response slower than spike times average
+  latency. The limit stays between minimum and maximum and is decreased at
+  most once per average latency, so one burst of errors counts once.
+
+  Threads started by parallel() or prefetch() wait for free slot, so number
+  of workers can be set high and actual concurrency follows the booru.
+  """
+  def __init__(self, initial=4, minimum=1, maximum=32, increase=1, decrease=0.5, spike=3,
+               statuses=(429, 500, 502, 503, 504)):
+    self.initial = initial
+    self.minimum = minimum
+    self.maximum = maximum
+    self.increase = increase
+    self.decrease = decrease
+    self.spike = spike
+    self.statuses = set(statuses)
+    self._domains = {}
+    self._lock = Lock()
+
+  @property
+  def limits(self):
+    """
+    Returns current limit of requests in flight for every booru.
+    """
+    return {url_domain: int(domain.limit) for url_domain, domain in self._domains.items()}
+
+  def _domain(self, url):
+    url_domain = url_domain_of(url)
+    with self._lock:
+      domain = self._domains.get(url_domain)
+      if domain is None:
+        domain = self._domains[url_domain] = DomainLimit(self.initial)
+      return domain
+
+  def acquire(self, url):
+    """
+    Blocks until request to url can be sent; returns token for release().
+    """
+    domain = self._domain(url)
+    with domain.condition:
+      while domain.inflight >= int(domain.limit):
+        domain.condition.wait()
+      domain.inflight += 1
+    return domain, monotonic()
+
+  def cancel(self, token):
+    """
+    Frees slot of request which wasn't sent.
+    """
+    domain = token[0]
+    with domain.condition:
+      domain.inflight -= 1
+      domain.condition.notify_all()
+
+  def release(self, token, status_code=None):
+    """
+    Takes result of request: status_code, or None for failed connection.
+    """
+    domain, started = token
+    now = monotonic()
+    latency = now - started
+    with domain.condition:
+      domain.inflight -= 1
+      average = domain.latency
+      failed = status_code is None or status_code in self.statuses
+      slow = average is not None and latency > self.spike * average
+      if not failed:
+        # Slow responses move average too, so it follows lasting change of latency
+        domain.latency = latency if average is None else 0.9 * average + 0.1 * latency
+      if failed or slow:
+        if now - domain.decreased > (average or 0):
+          domain.limit = max(self.minimum, domain.limit * self.decrease)
+          domain.decreased = now
+      else:
+        domain.limit = min(self.maximum, domain.limit + self.increase / domain.limit)
+      domain.condition.notify_all()
@@ -24,8 +24,9 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-from .request import get_filters, get_filter_data
+from .request import get_filters, get_filter_data, invalidate_data
 from .helpers import api_key, join_params, set_limit, validate_filter
+from .record import Record
 
 __all__ = [
   "Filters",
@@ -41,8 +42,9 @@ system_filters = {"default": 100073,
 
 class Filters(object):
   def __init__(self, key="", filters_id="", limit=50, per_page=25, page=1,
-               url_domain="https://derpibooru.org", proxies={}):
+               url_domain="https://derpibooru.org", proxies={}, session=None):
     self.proxies = proxies
+    self.session = session
     self.url_domain = url_domain
     self._params = {
       "key": api_key(key),
@@ -58,7 +60,7 @@ class Filters(object):
       
     self._limit = set_limit(limit)
     self._search = get_filters(filters_id, self._params, 
-                               self._limit, url_domain=self.url_domain, proxies=self.proxies)
+                               self._limit, url_domain=self.url_domain, proxies=self.proxies, session=self.session)
   
   def __iter__(self):
     """
@@ -90,7 +92,8 @@ class Filters(object):
     params = join_params(self.parameters, {"key": key,
                                            "limit": self._limit,
                                            "url_domain": self.url_domain,
-                                           "proxies": self.proxies}
+                                           "proxies": self.proxies,
+                                           "session": self.session}
                         )
 
     return self.__class__(**params)
@@ -102,7 +105,8 @@ class Filters(object):
     """
     params = join_params(self.parameters, {"limit": limit,
                                            "url_domain": self.url_domain,
-                                           "proxies": self.proxies})
+                                           "proxies": self.proxies,
+                                           "session": self.session})
 
     return self.__class__(**params)
 
@@ -113,7 +117,8 @@ class Filters(object):
     params = join_params(self.parameters, {"page": set_limit(page),
                                            "limit": self._limit,
                                            "url_domain": self.url_domain,
-                                           "proxies": self.proxies}
+                                           "proxies": self.proxies,
+                                           "session": self.session}
                         )
 
     return self.__class__(**params)
@@ -126,7 +131,8 @@ class Filters(object):
     params = join_params(self.parameters, {"per_page": set_limit(limit),
                                            "limit": self._limit,
                                            "url_domain": self.url_domain,
-                                           "proxies": self.proxies}
+                                           "proxies": self.proxies,
+                                           "session": self.session}
                         )
 
     return self.__class__(**params)
@@ -135,16 +141,19 @@ class Filters(object):
     """
     Returns a result wrapped in a new instance of Filter().
     """
-    return Filter(None, data=next(self._search), url_domain=self.url_domain, proxies=self.proxies)
+    return Filter(None, data=next(self._search), url_domain=self.url_domain, proxies=self.proxies, session=self.session)
 
-class Filter(object):
+class Filter(Record):
   """
-  This class provides a thin wrapper around JSON data, mapping each value to
-  its own property. Once instantiated the data is immutable so as to reflect
-  the stateless nature of a REST API.
+  This class provides a thin wrapper around JSON data, resolving each value as
+  its own attribute on access. Once instantiated the data is immutable so as
+  to reflect the stateless nature of a REST API.
   """
-  def __init__(self, filter_id, data=None, url_domain="https://derpibooru.org", proxies={}):
+  __slots__ = ("proxies", "session", "url_domain")
+
+  def __init__(self, filter_id, data=None, url_domain="https://derpibooru.org", proxies={}, session=None):
     self.proxies = proxies
+    self.session = session
     self.url_domain = url_domain
 
     if filter_id is None and data:
@@ -154,11 +163,7 @@ class Filter(object):
       if norm_str_filter_id in system_filters:
         filter_id = system_filters[norm_str_filter_id]
       self._data = data = get_filter_data(validate_filter(filter_id),
-                                          url_domain=url_domain, proxies=proxies)
-
-    for field, body in data.items():
-      if not hasattr(self, field):
-        setattr(self, field, body) 
+                                          url_domain=url_domain, proxies=proxies, session=session)
 
   def __str__(self):
     return f"Filter({self.name})"
@@ -168,7 +173,8 @@ class Filter(object):
     return self._data
 
   def update(self):
-    data = get_image_data(self.id, proxies=self.proxies)
+    invalidate_data("filters", self.id, url_domain=self.url_domain, session=self.session)
+    data = get_filter_data(self.id, url_domain=self.url_domain, proxies=self.proxies, session=self.session)
 
     if data:
       self._data = data
\ No newline at end of file
@@ -26,9 +26,10 @@
 
 from .request import get_forums, get_forum_data, \
                      get_topics, url_topics, get_topic_data, \
-                     get_posts, url_posts
+                     get_posts, url_posts, invalidate_data
 from .helpers import join_params, set_limit, destructive_slug
 from .post import Post
+from .record import Record
 
 __all__ = [
   "Forums",
@@ -40,15 +41,16 @@ __all__ = [
 
 class Forums(object):
   def __init__(self, limit=50, per_page=25, page=1,
-               url_domain="https://derpibooru.org", proxies={}):
+               url_domain="https://derpibooru.org", proxies={}, session=None):
     self.proxies = proxies
+    self.session = session
     self.url_domain = url_domain
     self._params = {
       "per_page": set_limit(per_page),
       "page": set_limit(page)
     }      
     self._limit = set_limit(limit)
-    self._search = get_forums(self._params, self._limit, url_domain=self.url_domain, proxies=self.proxies)
+    self._search = get_forums(self._params, self._limit, url_domain=self.url_domain, proxies=self.proxies, session=self.session)
   
   def __iter__(self):
     """
@@ -79,7 +81,8 @@ class Forums(object):
     """
     params = join_params(self.parameters, {"limit": limit,
                                            "url_domain": self.url_domain,
-                                           "proxies": self.proxies})
+                                           "proxies": self.proxies,
+                                           "session": self.session})
 
     return self.__class__(**params)
 
@@ -90,7 +93,8 @@ class Forums(object):
     params = join_params(self.parameters, {"page": set_limit(page),
                                            "limit": self._limit,
                                            "url_domain": self.url_domain,
-                                           "proxies": self.proxies}
+                                           "proxies": self.proxies,
+                                           "session": self.session}
                         )
 
     return self.__class__(**params)
@@ -103,7 +107,8 @@ class Forums(object):
     params = join_params(self.parameters, {"per_page": set_limit(limit),
                                            "limit": self._limit,
                                            "url_domain": self.url_domain,
-                                           "proxies": self.proxies}
+                                           "proxies": self.proxies,
+                                           "session": self.session}
                         )
 
     return self.__class__(**params)
@@ -112,28 +117,27 @@ class Forums(object):
     """
     Returns a result wrapped in a new instance of Forum().
     """
-    return Forum(next(self._search), url_domain=self.url_domain, proxies=self.proxies)
+    return Forum(next(self._search), url_domain=self.url_domain, proxies=self.proxies, session=self.session)
 
-class Forum(object):
+class Forum(Record):
   """
-  This class provides a thin wrapper around JSON data, mapping each value to
-  its own property. Once instantiated the data is immutable so as to reflect
-  the stateless nature of a REST API.
+  This class provides a thin wrapper around JSON data, resolving each value as
+  its own attribute on access. Once instantiated the data is immutable so as
+  to reflect the stateless nature of a REST API.
   """
+  __slots__ = ("proxies", "session", "url_domain")
+
   def __init__(self, data, short_name=None,
-               url_domain="https://derpibooru.org", proxies={}):
+               url_domain="https://derpibooru.org", proxies={}, session=None):
     self.proxies = proxies
+    self.session = session
     self.url_domain = url_domain
 
     if data is None and short_name:
-      self._data = data = get_forum_data(short_name, url_domain=url_domain, proxies=proxies)
+      self._data = data = get_forum_data(short_name, url_domain=url_domain, proxies=proxies, session=session)
     else:
       self._data = data
 
-    for field, body in data.items():
-      if not hasattr(self, field):
-        setattr(self, field, body) 
-
   def __str__(self):
     return f"Forum({self.name})"
        
@@ -146,19 +150,21 @@ class Forum(object):
     return self._data
 
   def update(self):
-    data = get_forum_data(self.short_name, url_domain=self.url_domain, proxies=self.proxies)
+    invalidate_data("forums", self.short_name, url_domain=self.url_domain, session=self.session)
+    data = get_forum_data(self.short_name, url_domain=self.url_domain, proxies=self.proxies, session=self.session)
 
     if data:
       self._data = data
 
   def topics(self, limit=50, per_page=25, page=1):
     return Topics(self.short_name, limit=limit, per_page=per_page, page=page,
-                  url_domain=self.url_domain, proxies=self.proxies)
+                  url_domain=self.url_domain, proxies=self.proxies, session=self.session)
 
 class Topics(object):
   def __init__(self, forum_short_name, limit=50, per_page=25, page=1,
-               url_domain="https://derpibooru.org", proxies={}):
+               url_domain="https://derpibooru.org", proxies={}, session=None):
     self.proxies = proxies
+    self.session = session
     self.url_domain = url_domain
     self.forum_short_name = forum_short_name
     self._params = {
@@ -167,7 +173,7 @@ class Topics(object):
     }      
     self._limit = set_limit(limit)
     self._search = get_topics(forum_short_name, self._params, self._limit,
-                              url_domain=self.url_domain, proxies=self.proxies)
+                              url_domain=self.url_domain, proxies=self.proxies, session=self.session)
   
   def __iter__(self):
     """
@@ -201,7 +207,8 @@ class Topics(object):
     """
     params = join_params(self.parameters, {"limit": limit,
                                            "url_domain": self.url_domain,
-                                           "proxies": self.proxies})
+                                           "proxies": self.proxies,
+                                           "session": self.session})
 
     return self.__class__(**params)
 
@@ -212,7 +219,8 @@ class Topics(object):
     params = join_params(self.parameters, {"page": set_limit(page),
                                            "limit": self._limit,
                                            "url_domain": self.url_domain,
-                                           "proxies": self.proxies}
+                                           "proxies": self.proxies,
+                                           "session": self.session}
                         )
 
     return self.__class__(**params)
@@ -225,7 +233,8 @@ class Topics(object):
     params = join_params(self.parameters, {"per_page": set_limit(limit),
                                            "limit": self._limit,
                                            "url_domain": self.url_domain,
-                                           "proxies": self.proxies}
+                                           "proxies": self.proxies,
+                                           "session": self.session}
                         )
 
     return self.__class__(**params)
@@ -235,17 +244,20 @@ class Topics(object):
     Returns a result wrapped in a new instance of Topic().
     """
     return Topic(next(self._search), forum_short_name=self.forum_short_name,
-                 url_domain=self.url_domain, proxies=self.proxies)
+                 url_domain=self.url_domain, proxies=self.proxies, session=self.session)
 
-class Topic(object):
+class Topic(Record):
   """
-  This class provides a thin wrapper around JSON data, mapping each value to
-  its own property. Once instantiated the data is immutable so as to reflect
-  the stateless nature of a REST API.
+  This class provides a thin wrapper around JSON data, resolving each value as
+  its own attribute on access. Once instantiated the data is immutable so as
+  to reflect the stateless nature of a REST API.
   """
+  __slots__ = ("proxies", "session", "url_domain", "forum_short_name")
+
   def __init__(self, data, forum_short_name=None, topic_name=None, slug=True,
-               url_domain="https://derpibooru.org", proxies={}):
+               url_domain="https://derpibooru.org", proxies={}, session=None):
     self.proxies = proxies
+    self.session = session
     self.url_domain = url_domain
     self.forum_short_name = forum_short_name
 
@@ -255,14 +267,10 @@ class Topic(object):
       else:
         topic_slug = topic_name
       self._data = data = get_topic_data(forum_short_name, topic_slug,
-                                         url_domain=self.url_domain, proxies=proxies)
+                                         url_domain=self.url_domain, proxies=proxies, session=session)
     else:
       self._data = data
 
-    for field, body in data.items():
-      if not hasattr(self, field):
-        setattr(self, field, body) 
-
   def __str__(self):
     return f"Topic({self.title})"
        
@@ -277,8 +285,10 @@ class Topic(object):
 
   def update(self):
     if self.forum_short_name:
+      invalidate_data("topics", self.forum_short_name, self.slug, url_domain=self.url_domain,
+                      session=self.session)
       data = get_topic_data(self.forum_short_name, self.slug,
-                            url_domain=self.url_domain, proxies=self.proxies)
+                            url_domain=self.url_domain, proxies=self.proxies, session=self.session)
       if data:
         self._data = data
 
@@ -287,12 +297,13 @@ class Topic(object):
       forum_short_name = self.forum_short_name
     return Posts(forum_short_name, self.slug, slug=False, limit=limit,
                  per_page=per_page, page=page,
-                 url_domain=self.url_domain, proxies=self.proxies)
+                 url_domain=self.url_domain, proxies=self.proxies, session=self.session)
 
 class Posts(object):
   def __init__(self, forum_short_name, topic_name, slug=True, limit=50,
-               per_page=25, page=1, url_domain="https://derpibooru.org", proxies={}):
+               per_page=25, page=1, url_domain="https://derpibooru.org", proxies={}, session=None):
     self.proxies = proxies
+    self.session = session
     self.url_domain = url_domain
     self.forum_short_name = forum_short_name
     if slug:
@@ -306,7 +317,7 @@ class Posts(object):
     self._limit = set_limit(limit)
     self._search = get_posts(self._params, forum_short_name=self.forum_short_name,
                              topic_slug=self.topic_slug, limit=self._limit,
-                             url_domain=self.url_domain, proxies=self.proxies)
+                             url_domain=self.url_domain, proxies=self.proxies, session=self.session)
   
   def __iter__(self):
     """
@@ -340,7 +351,8 @@ class Posts(object):
     """
     params = join_params(self.parameters, {"limit": limit,
                                            "url_domain": self.url_domain,
-                                           "proxies": self.proxies})
+                                           "proxies": self.proxies,
+                                           "session": self.session})
 
     return self.__class__(**params)
 
@@ -351,7 +363,8 @@ class Posts(object):
     params = join_params(self.parameters, {"page": set_limit(page),
                                            "limit": self._limit,
                                            "url_domain": self.url_domain,
-                                           "proxies": self.proxies}
+                                           "proxies": self.proxies,
+                                           "session": self.session}
                         )
 
     return self.__class__(**params)
@@ -364,7 +377,8 @@ class Posts(object):
     params = join_params(self.parameters, {"per_page": set_limit(limit),
                                            "limit": self._limit,
                                            "url_domain": self.url_domain,
-                                           "proxies": self.proxies}
+                                           "proxies": self.proxies,
+                                           "session": self.session}
                         )
 
     return self.__class__(**params)
@@ -373,4 +387,4 @@ class Posts(object):
     """
     Returns a result wrapped in a new instance of Post().
     """
-    return Post(next(self._search), url_domain=self.url_domain, proxies=self.proxies)
\ No newline at end of file
+    return Post(next(self._search), url_domain=self.url_domain, proxies=self.proxies, session=self.session)
\ No newline at end of file
@@ -26,7 +26,7 @@
 
 from .request import get_galleries, url_galleries
 from .gallery import Gallery
-from .helpers import tags, api_key, join_params, set_limit
+from .helpers import tags, api_key, join_params, set_limit, set_depth
 
 __all__ = [
   "Galleries"
@@ -41,12 +41,14 @@ class Galleries(object):
   """
   def __init__(self, key="", q=set(), limit=50,
                per_page=25, page=1,
-               url_domain="https://derpibooru.org", proxies={}):
+               url_domain="https://derpibooru.org", proxies={}, session=None,
+               prefetch=0, parallel=0):
     """
     By default initializes an instance of Galleries with the parameters to get
     the first 25 galleries on Derpibooru's galleries page.
     """
     self.proxies = proxies
+    self.session = session
     self.url_domain = url_domain
     self._params = {
       "key": api_key(key),
@@ -55,8 +57,11 @@ class Galleries(object):
       "page": set_limit(page)
     }
     self._limit = set_limit(limit)
+    self._prefetch = set_depth(prefetch)
+    self._parallel = set_depth(parallel)
     self._search = get_galleries(self._params, self._limit,
-                                 url_domain=self.url_domain, proxies=self.proxies)
+                                 url_domain=self.url_domain, proxies=self.proxies, session=self.session,
+                                 prefetch=self._prefetch, parallel=self._parallel)
   
   def __iter__(self):
     """
@@ -91,7 +96,10 @@ class Galleries(object):
     params = join_params(self.parameters, {"key": key,
                                            "limit": self._limit,
                                            "url_domain": self.url_domain,
-                                           "proxies": self.proxies}
+                                           "proxies": self.proxies,
+                                           "session": self.session,
+                                           "prefetch": self._prefetch,
+                                           "parallel": self._parallel}
                         )
 
     return self.__class__(**params)
@@ -103,7 +111,10 @@ class Galleries(object):
     params = join_params(self.parameters, {"q": q,
                                            "limit": self._limit,
                                            "url_domain": self.url_domain,
-                                           "proxies": self.proxies}
+                                           "proxies": self.proxies,
+                                           "session": self.session,
+                                           "prefetch": self._prefetch,
+                                           "parallel": self._parallel}
                         )
 
     return self.__class__(**params)
@@ -115,7 +126,39 @@ class Galleries(object):
     """
     params = join_params(self.parameters, {"limit": limit,
                                            "url_domain": self.url_domain,
-                                           "proxies": self.proxies})
+                                           "proxies": self.proxies,
+                                           "session": self.session,
+                                           "prefetch": self._prefetch,
+                                           "parallel": self._parallel})
+
+    return self.__class__(**params)
+
+  def prefetch(self, depth):
+    """
+    Set number of next pages of galleries requested in background while current
+    page is iterated, or set to 0 to request pages on demand; default 0.
+    """
+    params = join_params(self.parameters, {"limit": self._limit,
+                                           "url_domain": self.url_domain,
+                                           "proxies": self.proxies,
+                                           "session": self.session,
+                                           "prefetch": depth,
+                                           "parallel": self._parallel})
+
+    return self.__class__(**params)
+
+  def parallel(self, workers):
+    """
+    Set number of threads requesting pages of galleries concurrently, planned
+    by total count from first page, or set to 0 to request pages one by one;
+    default 0. Session pool size should be not less than workers.
+    """
+    params = join_params(self.parameters, {"limit": self._limit,
+                                           "url_domain": self.url_domain,
+                                           "proxies": self.proxies,
+                                           "session": self.session,
+                                           "prefetch": self._prefetch,
+                                           "parallel": workers})
 
     return self.__class__(**params)
 
@@ -127,7 +170,10 @@ class Galleries(object):
      params = join_params(self.parameters, {"q": query,
                                            "limit": self._limit,
                                            "url_domain": self.url_domain,
-                                           "proxies": self.proxies}
+                                           "proxies": self.proxies,
+                                           "session": self.session,
+                                           "prefetch": self._prefetch,
+                                           "parallel": self._parallel}
                          )
 
      return self.__class__(**params)
@@ -140,7 +186,10 @@ class Galleries(object):
      params = join_params(self.parameters, {"q": query,
                                            "limit": self._limit,
                                            "url_domain": self.url_domain,
-                                           "proxies": self.proxies}
+                                           "proxies": self.proxies,
+                                           "session": self.session,
+                                           "prefetch": self._prefetch,
+                                           "parallel": self._parallel}
                          )
 
      return self.__class__(**params)
@@ -152,7 +201,10 @@ class Galleries(object):
     params = join_params(self.parameters, {"page": set_limit(page),
                                            "limit": self._limit,
                                            "url_domain": self.url_domain,
-                                           "proxies": self.proxies}
+                                           "proxies": self.proxies,
+                                           "session": self.session,
+                                           "prefetch": self._prefetch,
+                                           "parallel": self._parallel}
                         )
 
     return self.__class__(**params)
@@ -165,7 +217,10 @@ class Galleries(object):
     params = join_params(self.parameters, {"per_page": set_limit(limit),
                                            "limit": self._limit,
                                            "url_domain": self.url_domain,
-                                           "proxies": self.proxies}
+                                           "proxies": self.proxies,
+                                           "session": self.session,
+                                           "prefetch": self._prefetch,
+                                           "parallel": self._parallel}
                         )
 
     return self.__class__(**params)
@@ -175,4 +230,4 @@ class Galleries(object):
     Returns a result wrapped in a new instance of Gallery().
     """
     return Gallery(next(self._search), search_params=self.parameters,
-                   url_domain=self.url_domain, proxies=self.proxies)
\ No newline at end of file
+                   url_domain=self.url_domain, proxies=self.proxies, session=self.session)
\ No newline at end of file
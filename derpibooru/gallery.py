@@ -27,34 +27,34 @@
 from .request import get_galleries
 from .search import Search
 from .image import Image
+from .record import Record
 
 __all__ = [
   "Gallery"
 ]
 
-class Gallery(object):
+class Gallery(Record):
   """
-  This class provides a thin wrapper around JSON data, mapping each value to
-  its own property. Once instantiated the data is immutable so as to reflect
-  the stateless nature of a REST API.
+  This class provides a thin wrapper around JSON data, resolving each value as
+  its own attribute on access. Once instantiated the data is immutable so as
+  to reflect the stateless nature of a REST API.
   """
+  __slots__ = ("proxies", "session", "url_domain", "_params")
+
   def __init__(self, data, gallery_id=None, search_params={},
-               url_domain="https://derpibooru.org", proxies={}):
+               url_domain="https://derpibooru.org", proxies={}, session=None):
     self.proxies = proxies
+    self.session = session
     self.url_domain = url_domain
     self._params = search_params
 
     if data is None and gallery_id:
       search_params['q'] = (f"id:{gallery_id}",)
       self._data = data = next(get_galleries(search_params, limit=1,
-                                             url_domain=url_domain, proxies=proxies))
+                                             url_domain=url_domain, proxies=proxies, session=session))
     else:
       self._data = data
 
-    for field, body in data.items():
-      if not hasattr(self, field):
-        setattr(self, field, body) 
-
   def __str__(self):
     return f"Gallery({self.id})"
        
@@ -68,7 +68,7 @@ class Gallery(object):
 
   def update(self):
     data = next(get_galleries(self._params, limit=1,
-                              url_domain=self.url_domain, proxies=self.proxies))
+                              url_domain=self.url_domain, proxies=self.proxies, session=self.session))
 
     if data:
       self._data = data
@@ -77,7 +77,7 @@ class Gallery(object):
   def thumbnail(self):
     return Image(None, image_id=self.thumbnail_id,
                  search_params=self._params,
-                 url_domain=self.url_domain, proxies=self.proxies)
+                 url_domain=self.url_domain, proxies=self.proxies, session=self.session)
   
   def images(self, sf="created_at", sd="desc", limit=50,
              faves="", upvotes="", uploads="", watched="",
@@ -86,4 +86,4 @@ class Gallery(object):
                   q=(f"gallery_id:{self.id}",), sf=sf, sd=sd, limit=limit,
                   faves=faves, upvotes=upvotes, uploads=uploads, watched=watched,
                   filter_id=filter_id, per_page=per_page, page=page,
-                  url_domain=self.url_domain, proxies=self.proxies)
\ No newline at end of file
+                  url_domain=self.url_domain, proxies=self.proxies, session=self.session)
\ No newline at end of file
@@ -39,13 +39,20 @@ __all__ = [
   "join_params",
   "set_limit",
   "set_distance",
+  "set_depth",
+  "keyset_field",
+  "keyset_position",
+  "keyset_query",
+  "quote_term",
   "slugging_tag",
   "destructive_slug"
 ]
 
 from .sort import sort
 from .user import user
+from .profiling import profiled
 
+@profiled("tags")
 def tags(q):
   if isinstance(q, str):
     q = q.split(',')
@@ -163,6 +170,7 @@ def user_option(option):
   else:
     return ""
 
+@profiled("format_params")
 def format_params(params):
   p = {}
 
@@ -200,6 +208,7 @@ def format_params_url_galleries(params):
 
   return p
 
+@profiled("join_params")
 def join_params(old_params, new_params):
   new_dict = {**old_params, **new_params}
 
@@ -228,6 +237,61 @@ def set_distance(distance):
     d = 0.25
   return d
 
+def set_depth(depth):
+  if depth:
+    d = int(depth)
+    if d < 0:
+      d = 0
+  else:
+    d = 0
+  return d
+
+# sorting method: field of image used in query and in JSON; floats (aspect_ratio,
+# wilson_score) aren't compared exactly, so they aren't available
+keyset_fields = {
+  "created_at": "created_at",
+  "updated_at": "updated_at",
+  "first_seen_at": "first_seen_at",
+  "faves": "faves",
+  "upvotes": "upvotes",
+  "downvotes": "downvotes",
+  "score": "score",
+  "width": "width",
+  "height": "height",
+  "comments": "comment_count",
+  "tag_count": "tag_count"
+}
+
+def keyset_field(sf):
+  if sf not in keyset_fields:
+    raise ValueError(f"keyset isn't available for sorting by {sf}")
+  else:
+    return sf
+
+def keyset_position(item, sf):
+  return (item[keyset_fields[sf]], item["id"])
+
+def keyset_query(sf, sd, position):
+  value, id_number = position
+  op = "gt" if sd == "asc" else "lt"
+  if sf == "created_at":
+    # ids grow with creation time, so id alone is the key
+    return f"id.{op}:{id_number}"
+  field = keyset_fields[sf]
+  return f"({field}.{op}:{value} || ({field}:{value}, id.{op}:{id_number}))"
+
+def quote_term(field, value):
+  """
+  Returns search term field:value in double quotes, so commas, parentheses
+  and other syntax characters of value are matched literally; Philomena
+  treats quotes as quoting only around the whole term. Numbers are returned
+  without quotes.
+  """
+  if isinstance(value, int):
+    return f"{field}:{value}"
+  term = f"{field}:{value}".replace("\\", "\\\\").replace('"', '\\"')
+  return f'"{term}"'
+
 def slugging_tag(tag):
   slug = tag.strip().lower()
   do_slug = False
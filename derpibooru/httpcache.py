@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2014, Joshua Stone
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import os
+import sqlite3
+from hashlib import sha256
+from json import dumps, loads
+from threading import local, Lock
+from time import time
+from urllib.parse import urlencode, urlsplit
+from zlib import compress, decompress
+
+from requests.structures import CaseInsensitiveDict
+
+from .transport import Response
+
+__all__ = [
+  "HTTPCache",
+  "CachedResponse",
+  "default_max_age",
+  "set_http_cache"
+]
+
+# Seconds responses are used without revalidation by first part of API path
+default_max_age = {
+  "search": 300,
+  "images": 3600,
+  "comments": 3600,
+  "posts": 3600,
+  "tags": 86400,
+  "filters": 86400,
+  "profiles": 3600,
+  "forums": 86400
+}
+
+class CachedResponse(Response):
+  """
+  Response read from cache.
+  """
+  from_cache = True
+
+class HTTPCache(object):
+  """
+  HTTPCache() keeps successful GET responses compressed in SQLite database
+  at path, keyed by URL with sorted parameters (API key is hashed with them).
+  Responses are used without requests for max_age seconds set by first part
+  of API path, e.g. HTTPCache("cache.db", max_age={"search": 3600}); then
+  they are revalidated with ETag or Last-Modified if server sent them, or
+  requested again.
+
+  Database can be shared by threads and processes on one host.
+  """
+  def __init__(self, path, max_age={}, default=0, timeout=30):
+    self.path = path
+    self.max_age = {**default_max_age, **max_age}
+    self.default = default
+    self.timeout = timeout
+    self.hits = 0
+    self.revalidated = 0
+    self.misses = 0
+    self._local = local()
+    self._lock = Lock()
+    with self._connection() as connection:
+      connection.execute("CREATE TABLE IF NOT EXISTS responses ("
+                         "key TEXT PRIMARY KEY, status INTEGER, headers TEXT, body BLOB, "
+                         "etag TEXT, last_modified TEXT, expires REAL)")
+
+  @property
+  def stats(self):
+    """
+    Returns counters of fresh hits, revalidated responses and misses.
+    """
+    return {"hits": self.hits, "revalidated": self.revalidated, "misses": self.misses}
+
+  def _connection(self):
+    # sqlite connections can't be shared by threads or inherited by forks
+    connection = getattr(self._local, "connection", None)
+    if connection is None or self._local.pid != os.getpid():
+      connection = sqlite3.connect(self.path, timeout=self.timeout)
+      connection.execute("PRAGMA journal_mode=WAL")
+      self._local.connection, self._local.pid = connection, os.getpid()
+    return connection
+
+  def _count(self, counter):
+    with self._lock:
+      setattr(self, counter, getattr(self, counter) + 1)
+
+  def key(self, url, params=None):
+    query = urlencode(sorted((str(name), str(value)) for name, value in (params or {}).items()))
+    return sha256(f"{url}?{query}".encode("utf-8")).hexdigest()
+
+  def expires(self, url):
+    path = urlsplit(url).path.split("/api/v1/json/", 1)
+    endpoint = path[1].split("/", 1)[0] if len(path) == 2 else ""
+    return time() + self.max_age.get(endpoint, self.default)
+
+  def load(self, key):
+    row = self._connection().execute("SELECT status, headers, body, etag, last_modified, expires "
+                                     "FROM responses WHERE key = ?", (key,)).fetchone()
+    if row:
+      status, headers, body, etag, last_modified, expires = row
+      return {"status": status, "headers": CaseInsensitiveDict(loads(headers)), "content": decompress(body),
+              "etag": etag, "last_modified": last_modified, "expires": expires}
+
+  def store(self, key, response, expires):
+    headers = CaseInsensitiveDict(response.headers)
+    with self._connection() as connection:
+      connection.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                         (key, response.status_code, dumps(dict(headers)), compress(response.content),
+                          headers.get("ETag"), headers.get("Last-Modified"), expires))
+
+  def touch(self, key, expires):
+    with self._connection() as connection:
+      connection.execute("UPDATE responses SET expires = ? WHERE key = ?", (expires, key))
+
+  def get(self, send, url, params=None, headers=None, **kwargs):
+    """
+    Returns cached response or one requested with send(method, url, ...).
+    """
+    key = self.key(url, params)
+    cached = self.load(key)
+    if cached and cached["expires"] > time():
+      self._count("hits")
+      return CachedResponse(cached["status"], cached["headers"], cached["content"], url)
+
+    headers = dict(headers or {})
+    if cached and cached["etag"]:
+      headers["If-None-Match"] = cached["etag"]
+    if cached and cached["last_modified"]:
+      headers["If-Modified-Since"] = cached["last_modified"]
+    response = send("GET", url, params=params, headers=headers, **kwargs)
+
+    if cached and response.status_code == 304:
+      self._count("revalidated")
+      self.touch(key, self.expires(url))
+      return CachedResponse(cached["status"], cached["headers"], cached["content"], url)
+    self._count("misses")
+    if response.status_code == 200:
+      self.store(key, response, self.expires(url))
+    return response
+
+  def purge(self):
+    """
+    Deletes expired responses which can't be revalidated.
+    """
+    with self._connection() as connection:
+      connection.execute("DELETE FROM responses WHERE expires <= ? "
+                         "AND etag IS NULL AND last_modified IS NULL", (time(),))
+
+  def clear(self):
+    """
+    Deletes all responses; counters are kept.
+    """
+    with self._connection() as connection:
+      connection.execute("DELETE FROM responses")
+
+def set_http_cache(http_cache):
+  """
+  Returns given HTTPCache(), a new one for path, or None.
+  """
+  if isinstance(http_cache, (str, os.PathLike)):
+    return HTTPCache(http_cache)
+  else:
+    return http_cache
@@ -24,29 +24,47 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-from .request import get_image_data, get_image_faves, request as request_image
+from .request import get_image_data, get_image_faves, get_images_by_ids, invalidate_data, \
+                     request as request_image
 from .comments import Comments
-from .tags import Tags
 from .filters import system_filters
+from .categories import TagCategories
 from .helpers import url_abs
+from .profiling import profiled
+from .record import Record
 
 __all__ = [
   "Image"
 ]
 
-class Image(object):
+class Image(Record):
   """
-  This class provides a thin wrapper around JSON data, mapping each value to
-  its own property. Once instantiated the data is immutable so as to reflect
-  the stateless nature of a REST API.
+  This class provides a thin wrapper around JSON data, resolving each value as
+  its own attribute on access. Once instantiated the data is immutable so as
+  to reflect the stateless nature of a REST API.
   For getting image by id field data should be None and image_id contains id.
   For getting current featured image field data should be None and image_id="featured"
   API key need for checking my:***
+  categories is TagCategories() shared between images for artists, species,
+  characters and spoiler.
+  interactions is dict of upvoted, downvoted, faved, uploaded and watched
+  values already requested for this image.
+  With vocabulary (TagVocabulary()) tags and tag_ids are kept as arrays of
+  numbers and tags are decoded to names when read.
   """
+  __slots__ = ("proxies", "session", "url_domain", "key", "_params", "_categories", "_interactions",
+               "_vocabulary")
+
+  @profiled("Image.__init__")
   def __init__(self, data, image_id=None, key="", search_params={},
-               url_domain="https://derpibooru.org", proxies={}):
+               url_domain="https://derpibooru.org", proxies={}, session=None, categories=None,
+               interactions=None, vocabulary=None):
     self.proxies = proxies
+    self.session = session
     self.url_domain = url_domain
+    self._categories = categories
+    self._interactions = interactions
+    self._vocabulary = vocabulary
     # key needed for checking my:***
     if key:
       self.key = key if key else search_params['key']
@@ -58,19 +76,36 @@ class Image(object):
 
     # Set image_id="featured" for get current featured image
     if data is None and image_id:
-      self._data = data = get_image_data(image_id, url_domain=url_domain, proxies=proxies)
+      self._data = data = get_image_data(image_id, url_domain=url_domain, proxies=proxies, session=session)
     else:
       self._data = data
-
-    for field, body in data.items():
-      if not hasattr(self, field):
-        setattr(self, field, body) 
+    if vocabulary is not None and data is not None:
+      vocabulary.encode_image(data)
 
   def __str__(self):
     return f"Image({self.id})"
 
+  @classmethod
+  def many(cls, ids, key="", filter_id=system_filters["everything"], missing=None,
+           workers=4, url_domain="https://derpibooru.org", proxies={}, session=None):
+    """
+    Yields Image() for every id in the same order, requesting 50 images with
+    one search query. Duplicate images are replaced by images they are
+    duplicate of. Ids of not found images are appended to missing list if given.
+    """
+    params = {"key": key, "filter_id": filter_id}
+    for id_number, data in get_images_by_ids(ids, params, url_domain=url_domain, proxies=proxies,
+                                             session=session, workers=workers):
+      if data is None:
+        if missing is not None:
+          missing.append(id_number)
+        continue
+      yield cls(data, key=key, url_domain=url_domain, proxies=proxies, session=session)
+
   @property
   def tags(self):
+    if self._vocabulary is not None:
+      return self._vocabulary.decode(self.data["tags"])
     return self.data["tags"]
 
   @property
@@ -124,7 +159,7 @@ class Image(object):
       if self.faves > 0:
         self._data[faved_by] = get_image_faves(self.id,
                                                url_domain=self.url_domain,
-                                               proxies=self.proxies)
+                                               proxies=self.proxies, session=self.session)
       else:
         self._data[faved_by] = []
 
@@ -133,7 +168,7 @@ class Image(object):
   def comments(self):
     # filter_id used to get comments for any image
     return Comments(filter_id=system_filters["everything"], 
-                    url_domain=self.url_domain, proxies=self.proxies
+                    url_domain=self.url_domain, proxies=self.proxies, session=self.session
                    ).image_id(self.id)
        
   @property
@@ -145,23 +180,32 @@ class Image(object):
     return self._data
 
   def update(self):
-    data = get_image_data(self.id, url_domain=self.url_domain, proxies=self.proxies)
+    invalidate_data("images", self.id, url_domain=self.url_domain, session=self.session)
+    data = get_image_data(self.id, url_domain=self.url_domain, proxies=self.proxies, session=self.session)
 
     if data:
+      if self._vocabulary is not None:
+        self._vocabulary.encode_image(data)
       self._data = data
 
+  @property
+  def categories(self):
+    """
+    Returns TagCategories() used for artists, species, characters and spoiler.
+    """
+    if self._categories is None:
+      self._categories = TagCategories(url_domain=self.url_domain, proxies=self.proxies,
+                                       session=self.session)
+    return self._categories
+
   @property
   def artists(self):
-    self_tag_list = '(' + ' || '.join(f"name:{tag}" for tag in self.tags) + ')'
-    art_tag_list = '(category:origin, namespace:?* || name:artist needed || name:anonymous artist || name:kotobukiya)'
-    tags = Tags(q=(self_tag_list,art_tag_list,), per_page=50, 
-                limit=len(self_tag_list), url_domain=self.url_domain, proxies=self.proxies)
-    for tag in tags:
-      yield tag.name_in_namespace
+    for tag in self.categories.artists(self.tags):
+      yield tag
 
   @property
   def rating(self):
-    #all_ratings = {tag.name for tag in Tags(q={"category:rating"}, url_domain=self.url_domain, proxies=self.proxies)}
+    #all_ratings = {tag.name for tag in Tags(q={"category:rating"}, url_domain=self.url_domain, proxies=self.proxies, session=self.session)}
     all_ratings = {"safe","suggestive","questionable","explicit",
                    "semi-grimdark","grimdark","grotesque"}
     rating_tags = list(set(self.tags).intersection(all_ratings))
@@ -169,48 +213,17 @@ class Image(object):
 
   @property
   def species(self):
-    self_tag_list = '(' + ' || '.join(f"name:{tag}" for tag in self.tags) + ')'
-    sp_tag_list = '(category:species || name:humanized || name:anthro centaur || name:bat alicorn)'
-    tags = Tags(q=(self_tag_list,sp_tag_list,),
-                per_page=50, limit=len(self_tag_list),
-                url_domain=self.url_domain, proxies=self.proxies)
-    for tag in tags:
-      yield tag.name_in_namespace
+    for tag in self.categories.species(self.tags):
+      yield tag
 
   @property
   def characters(self):
-    self_tag_list = '(' + ' || '.join(f"name:{tag}" for tag in self.tags) + ')'
-    ch_tag_list = '(category:character || category:oc)'
-    tags = Tags(q=(self_tag_list,ch_tag_list,"-name:oc","-name:oc only"),
-                per_page=50, limit=len(self_tag_list),
-                url_domain=self.url_domain, proxies=self.proxies)
-    for tag in tags:
-      yield tag.name_in_namespace
+    for tag in self.categories.characters(self.tags):
+      yield tag
 
   @property
   def spoiler(self):
-    spoiler_tags = []
-    self_tag_list = '(' + ' || '.join(f"name:{tag}" for tag in self.tags) + ')'
-    sp_tag_list = '(category:spoiler || category:content-official)'
-    tags = Tags(q=(self_tag_list,sp_tag_list,),
-                per_page=50, limit=len(self_tag_list),
-                url_domain=self.url_domain, proxies=self.proxies)
-    aliases = []
-    for tag in tags:
-      if tag.category == "spoiler" and tag.name != "leak":
-        spoiler_tags.append(tag.name_in_namespace)
-      elif tag.category == "content-official" and tag.aliases:
-        aliases.extend(tag.aliases)
-      elif tag.category == "content-official":
-        spoiler_tags.append(tag.name_in_namespace)
-    if aliases:
-      aliases_str = ' || '.join(f"slug:{tag}" for tag in set(aliases))
-      tags = Tags(q=(aliases_str,), per_page=50, limit=len(aliases),
-                  url_domain=self.url_domain, proxies=self.proxies)
-      for tag in tags:
-        if tag.category == "spoiler" and tag.name != "leak":
-          spoiler_tags.append(tag.name_in_namespace)
-    for tag in sorted(set(spoiler_tags)):
+    for tag in self.categories.spoiler(self.tags):
       yield tag
 
   @property
@@ -225,9 +238,11 @@ class Image(object):
     """
     Checking image in my:upvotes.
     """
+    if self._interactions is not None:
+      return self._interactions["upvoted"]
     images = request_image({'key': self.key, 'filter_id': system_filters["everything"],
                             'per_page': 1, 'q': (f'id:{self.id}','my:upvotes')},
-                           url_domain=self.url_domain, proxies=self.proxies)
+                           url_domain=self.url_domain, proxies=self.proxies, session=self.session)
     for img in images:
       return True
     return False
@@ -237,9 +252,11 @@ class Image(object):
     """
     Checking image in my:downvotes.
     """
+    if self._interactions is not None:
+      return self._interactions["downvoted"]
     images = request_image({'key': self.key, 'filter_id': system_filters["everything"],
                             'per_page': 1, 'q': (f'id:{self.id}','my:downvotes')},
-                           url_domain=self.url_domain, proxies=self.proxies)
+                           url_domain=self.url_domain, proxies=self.proxies, session=self.session)
     for img in images:
       return True
     return False
@@ -249,9 +266,11 @@ class Image(object):
     """
     Checking image in my:uploads.
     """
+    if self._interactions is not None:
+      return self._interactions["uploaded"]
     images = request_image({'key': self.key, 'filter_id': system_filters["everything"],
                             'per_page': 1, 'q': (f'id:{self.id}','my:uploads')},
-                           url_domain=self.url_domain, proxies=self.proxies)
+                           url_domain=self.url_domain, proxies=self.proxies, session=self.session)
     for img in images:
       return True
     return False
@@ -261,9 +280,11 @@ class Image(object):
     """
     Checking image in my:faves.
     """
+    if self._interactions is not None:
+      return self._interactions["faved"]
     images = request_image({'key': self.key, 'filter_id': system_filters["everything"],
                             'per_page': 1, 'q': (f'id:{self.id}','my:faves')},
-                           url_domain=self.url_domain, proxies=self.proxies)
+                           url_domain=self.url_domain, proxies=self.proxies, session=self.session)
     for img in images:
       return True
     return False
@@ -271,11 +292,13 @@ class Image(object):
   @property
   def watched(self):
     """
-    Checking image in my:watches.
+    Checking image in my:watched.
     """
+    if self._interactions is not None:
+      return self._interactions["watched"]
     images = request_image({'key': self.key, 'filter_id': system_filters["everything"],
-                            'per_page': 1, 'q': (f'id:{self.id}','my:faves')},
-                           url_domain=self.url_domain, proxies=self.proxies)
+                            'per_page': 1, 'q': (f'id:{self.id}','my:watched')},
+                           url_domain=self.url_domain, proxies=self.proxies, session=self.session)
     for img in images:
       return True
     return False
@@ -286,12 +309,13 @@ class Image(object):
     """
     parameters = {**self._params, 'per_page': 1, 'sf': 'created_at'}
     parameters['q'].add(f'id.lt:{self.id}')
-    data = request_image(parameters, url_domain=self.url_domain, proxies=self.proxies)
+    data = request_image(parameters, url_domain=self.url_domain, proxies=self.proxies, session=self.session)
     try:
       return Image(next(data),
                    search_params={**self._params,
                                   'key': self.key if self.key else self._params['key']},
-                   url_domain=self.url_domain, proxies=self.proxies)
+                   url_domain=self.url_domain, proxies=self.proxies, session=self.session,
+                   vocabulary=self._vocabulary)
     except StopIteration:
       return self
   
@@ -302,11 +326,12 @@ class Image(object):
     parameters = {**self._params, 'per_page': 1, 'sf': 'created_at'}
     parameters['q'].add(f'id.gt:{self.id}')
     parameters['sd'] = 'desc' if self._params['sd']=='asc' else 'asc'
-    data = request_image(parameters, url_domain=self.url_domain, proxies=self.proxies)
+    data = request_image(parameters, url_domain=self.url_domain, proxies=self.proxies, session=self.session)
     try:
       return Image(next(data),
                    search_params={**self._params,
                                   'key': self.key if self.key else self._params['key']},
-                   url_domain=self.url_domain, proxies=self.proxies)
+                   url_domain=self.url_domain, proxies=self.proxies, session=self.session,
+                   vocabulary=self._vocabulary)
     except StopIteration:
       return self
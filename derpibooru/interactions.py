@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2014, Joshua Stone
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+
+from .request import request_page
+from .filters import system_filters
+from .helpers import format_params
+
+__all__ = [
+  "interaction_lists",
+  "request_interactions",
+  "with_interactions"
+]
+
+# Image property and my:*** list it's checked in
+interaction_lists = {
+  "upvoted": "upvotes",
+  "downvoted": "downvotes",
+  "faved": "faves",
+  "uploaded": "uploads",
+  "watched": "watched"
+}
+
+def request_interactions(ids, key, url_domain="https://derpibooru.org", proxies={}, session=None):
+  """
+  Returns dict of image id and dict of interactions (upvoted, downvoted,
+  faved, uploaded, watched) for up to 50 ids, with one query per my:*** list.
+  """
+  ids = list(ids)
+  search = f"{url_domain}/api/v1/json/search/images"
+  id_list = "(" + " || ".join(f"id:{id_number}" for id_number in ids) + ")"
+
+  def request_list(my_list):
+    p = format_params({"key": key, "filter_id": system_filters["everything"],
+                       "q": (id_list, f"my:{my_list}")})
+    p.update({"per_page": 50, "page": 1})
+    data = request_page(search, p, "images", proxies=proxies, session=session)
+    return {image["id"] for image in data["images"]} if data else set()
+
+  with ThreadPoolExecutor(max_workers=len(interaction_lists)) as pool:
+    found = dict(zip(interaction_lists, pool.map(request_list, interaction_lists.values())))
+
+  return {id_number: {name: id_number in found[name] for name in interaction_lists}
+          for id_number in ids}
+
+def with_interactions(images, key, interactions, per_page=50,
+                      url_domain="https://derpibooru.org", proxies={}, session=None):
+  """
+  Yields image data by pages; before the first image of every page
+  interactions dict is replaced by interactions of the page's images.
+  """
+  images = iter(images)
+  while True:
+    page = list(islice(images, min(per_page or 25, 50)))
+    if not page:
+      return
+    interactions.clear()
+    interactions.update(request_interactions((image["id"] for image in page), key,
+                                             url_domain=url_domain, proxies=proxies, session=session))
+    for image in page:
+      yield image
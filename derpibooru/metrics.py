@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2014, Joshua Stone
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from bisect import bisect_left
+from json import dump
+from threading import Lock
+from urllib.parse import urlsplit
+
+__all__ = [
+  "RequestEvent",
+  "Metrics",
+  "endpoint_template"
+]
+
+# Name of id placeholder after collection in path
+placeholders = {
+  "images": "{id}",
+  "comments": "{id}",
+  "posts": "{id}",
+  "profiles": "{id}",
+  "filters": "{id}",
+  "galleries": "{id}",
+  "tags": "{slug}",
+  "forums": "{forum}",
+  "topics": "{topic}"
+}
+
+def endpoint_template(url):
+  """
+  Returns path of url without API prefix and with ids replaced, e.g.
+  "search/images", "images/{id}" or "forums/{forum}/topics/{topic}/posts".
+  """
+  path = urlsplit(url).path.split("/api/v1/json/", 1)[-1].strip("/")
+  parts = path.split("/")
+  for position in range(1, len(parts)):
+    previous = parts[position - 1]
+    if previous in placeholders and (position < 2 or parts[position - 2] != "search"):
+      parts[position] = placeholders[previous]
+  return "/".join(parts)
+
+class RequestEvent(object):
+  """
+  RequestEvent() is passed to hooks of Session() on start and end of every
+  request. At end status, latency (seconds), bytes of response, retries,
+  cache ("hit", "revalidated", "miss" or None without cache) and error
+  (exception or None) are set; coalesced is True if response of the same
+  request made by another thread was used.
+  """
+  def __init__(self, method, url, endpoint=None):
+    self.method = method
+    self.url = url
+    self.endpoint = endpoint if endpoint is not None else endpoint_template(url)
+    self.status = None
+    self.latency = None
+    self.bytes = 0
+    self.attempts = 0
+    self.cache = None
+    self.coalesced = False
+    self.error = None
+
+  @property
+  def retries(self):
+    return max(self.attempts - 1, 0)
+
+  def __repr__(self):
+    return (f"RequestEvent({self.method} {self.endpoint}, status={self.status}, "
+            f"latency={self.latency}, bytes={self.bytes}, retries={self.retries}, cache={self.cache})")
+
+# Upper bounds of latency histogram buckets: 1 ms to about 2 minutes
+buckets = [0.001 * 1.25 ** power for power in range(54)]
+
+class EndpointMetrics(object):
+  def __init__(self):
+    self.requests = 0
+    self.errors = 0
+    self.statuses = {}
+    self.bytes = 0
+    self.retries = 0
+    self.cache = {}
+    self.coalesced = 0
+    self.latency = 0.0
+    self.histogram = [0] * (len(buckets) + 1)
+
+  def record(self, event):
+    self.requests += 1
+    self.errors += event.error is not None
+    self.statuses[event.status] = self.statuses.get(event.status, 0) + 1
+    self.bytes += event.bytes
+    self.retries += event.retries
+    if event.cache:
+      self.cache[event.cache] = self.cache.get(event.cache, 0) + 1
+    self.coalesced += event.coalesced
+    self.latency += event.latency
+    self.histogram[bisect_left(buckets, event.latency)] += 1
+
+  def percentile(self, percent):
+    """
+    Returns upper bound of histogram bucket with given percentile of latency.
+    """
+    rank, count = self.requests * percent / 100, 0
+    for position, bucket_count in enumerate(self.histogram):
+      count += bucket_count
+      if count >= rank and count:
+        return buckets[position] if position < len(buckets) else float("inf")
+    return None
+
+  def summary(self):
+    return {
+      "requests": self.requests,
+      "errors": self.errors,
+      "statuses": {str(status): count for status, count in self.statuses.items()},
+      "bytes": self.bytes,
+      "retries": self.retries,
+      "cache": dict(self.cache),
+      "coalesced": self.coalesced,
+      "latency_mean": self.latency / self.requests if self.requests else None,
+      "latency_p50": self.percentile(50),
+      "latency_p90": self.percentile(90),
+      "latency_p99": self.percentile(99),
+      "histogram": {f"{bound:.4f}": count for bound, count in zip(buckets + [float("inf")], self.histogram)
+                    if count}
+    }
+
+class Metrics(object):
+  """
+  Metrics() collects RequestEvent() of Session(metrics=Metrics()) by endpoint
+  template: requests, errors, statuses, bytes, retries, cache use and latency
+  histogram with percentiles. Latency percentiles are upper bounds of
+  histogram buckets growing by 25 %.
+  """
+  def __init__(self):
+    self._endpoints = {}
+    self._lock = Lock()
+
+  def __call__(self, event):
+    self.record(event)
+
+  def record(self, event):
+    with self._lock:
+      metrics = self._endpoints.get(event.endpoint)
+      if metrics is None:
+        metrics = self._endpoints[event.endpoint] = EndpointMetrics()
+      metrics.record(event)
+
+  def snapshot(self):
+    """
+    Returns dict of summaries by endpoint template.
+    """
+    with self._lock:
+      return {endpoint: metrics.summary() for endpoint, metrics in sorted(self._endpoints.items())}
+
+  def dump(self, path):
+    """
+    Writes snapshot() to JSON file.
+    """
+    with open(path, "w", encoding="utf-8") as output:
+      dump(self.snapshot(), output, indent=2)
+
+  def report(self):
+    """
+    Returns snapshot() as text table.
+    """
+    lines = [f"{'endpoint':<40} {'requests':>8} {'errors':>6} {'retries':>7} {'cached':>6} "
+             f"{'MB':>8} {'mean':>7} {'p50':>7} {'p90':>7} {'p99':>7}"]
+    for endpoint, summary in self.snapshot().items():
+      cached = summary["cache"].get("hit", 0) + summary["cache"].get("revalidated", 0)
+      lines.append(f"{endpoint:<40} {summary['requests']:>8} {summary['errors']:>6} "
+                   f"{summary['retries']:>7} {cached:>6} {summary['bytes'] / 2 ** 20:>8.2f} "
+                   f"{summary['latency_mean']:>7.3f} {summary['latency_p50']:>7.3f} "
+                   f"{summary['latency_p90']:>7.3f} {summary['latency_p99']:>7.3f}")
+    return "\n".join(lines)
+
+  def reset(self):
+    with self._lock:
+      self._endpoints.clear()
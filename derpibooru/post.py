@@ -24,31 +24,31 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-from .request import get_post_data
+from .request import get_post_data, invalidate_data
+from .record import Record
 
 __all__ = [
   "Post"
 ]
 
-class Post(object):
+class Post(Record):
   """
-  This class provides a thin wrapper around JSON data, mapping each value to
-  its own property. Once instantiated the data is immutable so as to reflect
-  the stateless nature of a REST API.
+  This class provides a thin wrapper around JSON data, resolving each value as
+  its own attribute on access. Once instantiated the data is immutable so as
+  to reflect the stateless nature of a REST API.
   """
-  def __init__(self, data, post_id=None, url_domain="https://derpibooru.org", proxies={}):
+  __slots__ = ("proxies", "session", "url_domain")
+
+  def __init__(self, data, post_id=None, url_domain="https://derpibooru.org", proxies={}, session=None):
     self.proxies = proxies
+    self.session = session
     self.url_domain = url_domain
 
     if data is None and post_id:
-      self._data = data = get_post_data(post_id, url_domain=url_domain, proxies=proxies)
+      self._data = data = get_post_data(post_id, url_domain=url_domain, proxies=proxies, session=session)
     else:
       self._data = data
 
-    for field, body in data.items():
-      if not hasattr(self, field):
-        setattr(self, field, body) 
-
   def __str__(self):
     if self.author:
       return '''Post({}: "{}")'''.format(self.id,
@@ -64,7 +64,8 @@ class Post(object):
     return self._data
 
   def update(self):
-    data = get_post_data(self.id, url_domain=self.url_domain, proxies=self.proxies)
+    invalidate_data("posts", self.id, url_domain=self.url_domain, session=self.session)
+    data = get_post_data(self.id, url_domain=self.url_domain, proxies=self.proxies, session=self.session)
 
     if data:
       self._data = data
\ No newline at end of file
@@ -43,9 +43,10 @@ class PostImage(object):
   """
   def __init__(self, key="", image_url="", description="", 
                tag_input=set(), source_url="",
-               url_domain="https://derpibooru.org", proxies={}):
+               url_domain="https://derpibooru.org", proxies={}, session=None):
 
     self.proxies = proxies
+    self.session = session
     self.url_domain = url_domain
     self._params = {
       "key": api_key(key),
@@ -74,7 +75,8 @@ class PostImage(object):
     """
     params = join_params(self.parameters, {"key": key,
                                            "url_domain": self.url_domain,
-                                           "proxies": self.proxies}
+                                           "proxies": self.proxies,
+                                           "session": self.session}
                         )
 
     return self.__class__(**params)
@@ -85,7 +87,8 @@ class PostImage(object):
     """
     params = join_params(self.parameters, {"image_url": image_url,
                                            "url_domain": self.url_domain,
-                                           "proxies": self.proxies}
+                                           "proxies": self.proxies,
+                                           "session": self.session}
                         )
 
     return self.__class__(**params)
@@ -99,7 +102,8 @@ class PostImage(object):
     """
     params = join_params(self.parameters, {"description": description,
                                            "url_domain": self.url_domain,
-                                           "proxies": self.proxies}
+                                           "proxies": self.proxies,
+                                           "session": self.session}
                         )
 
     return self.__class__(**params)
@@ -110,7 +114,8 @@ class PostImage(object):
     """
     params = join_params(self.parameters, {"tag_input": tags,
                                            "url_domain": self.url_domain,
-                                           "proxies": self.proxies}
+                                           "proxies": self.proxies,
+                                           "session": self.session}
                         )
 
     return self.__class__(**params)
@@ -121,7 +126,8 @@ class PostImage(object):
     """
     params = join_params(self.parameters, {"source_url": source_url,
                                            "url_domain": self.url_domain,
-                                           "proxies": self.proxies}
+                                           "proxies": self.proxies,
+                                           "session": self.session}
                         )
 
     return self.__class__(**params)
@@ -154,12 +160,12 @@ class PostImage(object):
         duplicates = self.check_duplicate()
         if duplicates:
           raise DuplicateError(self.parameters, duplicates)
-      response = post_image(**self.parameters, url_domain=self.url_domain, proxies=self.proxies)
+      response = post_image(**self.parameters, url_domain=self.url_domain, proxies=self.proxies, session=self.session)
       if "errors" in response:
         raise ImageError(response["errors"])
       else:
         return Image(response["image"], key=self.parameters['key'],
-                     url_domain=self.url_domain, proxies=self.proxies)
+                     url_domain=self.url_domain, proxies=self.proxies, session=self.session)
     else:
       raise PostError(self.parameters)
 
@@ -209,7 +215,7 @@ class PostImage(object):
     """
     query = ' || '.join(f"name:{tag}" for tag in self.parameters['tag_input'])
     tags = Tags(q=(query,), per_page=50, limit=len(self.parameters['tag_input']),
-                url_domain=self.url_domain, proxies=self.proxies)
+                url_domain=self.url_domain, proxies=self.proxies, session=self.session)
     tags_count = {tag.name: (tag.allias_parent().images if tag.allias_parent() else tag.images) 
                   for tag in tags}
     num_tags = {tag_name:(tags_count[tag_name] if tag_name in tags_count else 0) 
@@ -218,7 +224,7 @@ class PostImage(object):
     for tag_name in num_tags:
       if num_tags[tag_name]==0:
         ft = list(Tags(q=(f"name:{tag_name}~1.0",), per_page=50, limit=1,
-                       url_domain=self.url_domain, proxies=self.proxies))
+                       url_domain=self.url_domain, proxies=self.proxies, session=self.session))
         if ft:
           fix_tags[tag_name] = ft[0].name
         else:
@@ -233,7 +239,7 @@ class PostImage(object):
     """
     query = ' || '.join(f"name:{tag}" for tag in self.parameters['tag_input'])
     tags = Tags(q=(query,), per_page=50, limit=len(self.parameters['tag_input']),
-                url_domain=self.url_domain, proxies=self.proxies)
+                url_domain=self.url_domain, proxies=self.proxies, session=self.session)
     dnp_tags = {tag.name:tag.dnp_entries for tag in tags if tag.dnp_entries}
     return dnp_tags
 
@@ -243,7 +249,7 @@ class PostImage(object):
     """
     reverse = tuple(Search(reverse_url=self.parameters['image_url'],
                           distance=0.25,
-                          url_domain=self.url_domain, proxies=self.proxies))
+                          url_domain=self.url_domain, proxies=self.proxies, session=self.session))
     if reverse:
       return reverse
     return False
@@ -255,7 +261,8 @@ class PostImage(object):
     new_tags = self.parameters['tag_input'].union(tags)
     params = join_params(self.parameters, {"tag_input": new_tags,
                                            "url_domain": self.url_domain,
-                                           "proxies": self.proxies}
+                                           "proxies": self.proxies,
+                                           "session": self.session}
                         )
 
     return self.__class__(**params)
@@ -267,7 +274,8 @@ class PostImage(object):
     new_tags = self.parameters['tag_input'].difference(tags)
     params = join_params(self.parameters, {"tag_input": new_tags,
                                            "url_domain": self.url_domain,
-                                           "proxies": self.proxies}
+                                           "proxies": self.proxies,
+                                           "session": self.session}
                         )
 
     return self.__class__(**params)
@@ -26,26 +26,31 @@
 
 from .request import get_posts, url_search_posts
 from .post import Post
-from .helpers import tags, join_params, set_limit
+from .helpers import tags, join_params, set_limit, set_depth
+from .checkpoint import Checkpoint, Resumable, set_checkpoint
 
 __all__ = [
   "SearchPosts"
 ]
 
-class SearchPosts(object):
+class SearchPosts(Resumable):
   """
   All properties are read-only, and every method returns a new instance of
   SearchPosts() to avoid mutating state in ongoing search queries. This makes object
   interactions predictable as well as making versioning of searches relatively
   easy.
   """
+  checkpoint_name = "SearchPosts"
+
   def __init__(self, q={"created_at.gte:1 week ago",}, limit=50,
-               per_page=25, page=1, url_domain="https://derpibooru.org", proxies={}):
+               per_page=25, page=1, url_domain="https://derpibooru.org", proxies={}, session=None,
+               prefetch=0, parallel=0, checkpoint=None, skip=0, count=0):
     """
     By default initializes an instance of Posts with the parameters to get
     the first 25 posts on Derpibooru's posts search page.
     """
     self.proxies = proxies
+    self.session = session
     self.url_domain = url_domain
     self._params = {
       "q": tags(q),
@@ -53,8 +58,14 @@ class SearchPosts(object):
       "page": set_limit(page)
     }      
     self._limit = set_limit(limit)
-    self._search = get_posts(self._params, self._limit,
-                             url_domain=self.url_domain, proxies=self.proxies)
+    self._prefetch = set_depth(prefetch)
+    self._parallel = set_depth(parallel)
+    self._checkpoint = set_checkpoint(checkpoint)
+    self._skip, self._skipped = set_depth(skip), 0
+    self._yielded, self._count, self._last = 0, set_depth(count), None
+    self._search = get_posts(self._params, self._limit + self._skip if self._limit else self._limit,
+                             url_domain=self.url_domain, proxies=self.proxies, session=self.session,
+                             prefetch=self._prefetch, parallel=self._parallel)
   
   def __iter__(self):
     """
@@ -88,7 +99,13 @@ class SearchPosts(object):
     params = join_params(self.parameters,
                          {"q": q, "limit": self._limit,
                           "url_domain": self.url_domain,
-                          "proxies": self.proxies}
+                          "proxies": self.proxies,
+                          "session": self.session,
+                          "prefetch": self._prefetch,
+                          "parallel": self._parallel,
+                          "checkpoint": self._checkpoint,
+                          "skip": self._skip,
+                          "count": self._count}
                         )
 
     return self.__class__(**params)
@@ -100,7 +117,65 @@ class SearchPosts(object):
     """
     params = join_params(self.parameters, {"limit": limit,
                                            "url_domain": self.url_domain,
-                                           "proxies": self.proxies})
+                                           "proxies": self.proxies,
+                                           "session": self.session,
+                                           "prefetch": self._prefetch,
+                                           "parallel": self._parallel,
+                                           "checkpoint": self._checkpoint,
+                                           "skip": self._skip,
+                                           "count": self._count})
+
+    return self.__class__(**params)
+
+  def prefetch(self, depth):
+    """
+    Set number of next pages of posts requested in background while current
+    page is iterated, or set to 0 to request pages on demand; default 0.
+    """
+    params = join_params(self.parameters, {"limit": self._limit,
+                                           "url_domain": self.url_domain,
+                                           "proxies": self.proxies,
+                                           "session": self.session,
+                                           "prefetch": depth,
+                                           "parallel": self._parallel,
+                                           "checkpoint": self._checkpoint,
+                                           "skip": self._skip,
+                                           "count": self._count})
+
+    return self.__class__(**params)
+
+  def parallel(self, workers):
+    """
+    Set number of threads requesting pages of posts concurrently, planned
+    by total count from first page, or set to 0 to request pages one by one;
+    default 0. Session pool size should be not less than workers.
+    """
+    params = join_params(self.parameters, {"limit": self._limit,
+                                           "url_domain": self.url_domain,
+                                           "proxies": self.proxies,
+                                           "session": self.session,
+                                           "prefetch": self._prefetch,
+                                           "parallel": workers,
+                                           "checkpoint": self._checkpoint,
+                                           "skip": self._skip,
+                                           "count": self._count})
+
+    return self.__class__(**params)
+
+  def checkpoint(self, path, every=100):
+    """
+    Save position of iteration to file every N posts, so it can be continued
+    by SearchPosts.resume(path) after crash or restart.
+    """
+    params = join_params(self.parameters, {"limit": self._limit,
+                                           "url_domain": self.url_domain,
+                                           "proxies": self.proxies,
+                                           "session": self.session,
+                                           "prefetch": self._prefetch,
+                                           "parallel": self._parallel,
+                                           "checkpoint": Checkpoint(path, every),
+                                           "skip": self._skip,
+                                           "count": self._count})
 
     return self.__class__(**params)
 
@@ -112,7 +187,13 @@ class SearchPosts(object):
      params = join_params(self.parameters,
                           {"q": query, "limit": self._limit,
                            "url_domain": self.url_domain,
-                           "proxies": self.proxies}
+                           "proxies": self.proxies,
+                           "session": self.session,
+                           "prefetch": self._prefetch,
+                           "parallel": self._parallel,
+                           "checkpoint": self._checkpoint,
+                           "skip": self._skip,
+                           "count": self._count}
                          )
 
      return self.__class__(**params)
@@ -125,7 +206,13 @@ class SearchPosts(object):
      params = join_params(self.parameters,
                           {"q": query, "limit": self._limit,
                            "url_domain": self.url_domain,
-                           "proxies": self.proxies}
+                           "proxies": self.proxies,
+                           "session": self.session,
+                           "prefetch": self._prefetch,
+                           "parallel": self._parallel,
+                           "checkpoint": self._checkpoint,
+                           "skip": self._skip,
+                           "count": self._count}
                          )
 
      return self.__class__(**params)
@@ -138,7 +225,13 @@ class SearchPosts(object):
                          {"page": set_limit(page),
                           "limit": self._limit,
                           "url_domain": self.url_domain,
-                          "proxies": self.proxies
+                          "proxies": self.proxies,
+                          "session": self.session,
+                          "prefetch": self._prefetch,
+                          "parallel": self._parallel,
+                          "checkpoint": self._checkpoint,
+                          "skip": self._skip,
+                          "count": self._count
                          }
                         )
 
@@ -153,7 +246,13 @@ class SearchPosts(object):
                          {"per_page": set_limit(limit),
                           "limit": self._limit,
                           "url_domain": self.url_domain,
-                          "proxies": self.proxies
+                          "proxies": self.proxies,
+                          "session": self.session,
+                          "prefetch": self._prefetch,
+                          "parallel": self._parallel,
+                          "checkpoint": self._checkpoint,
+                          "skip": self._skip,
+                          "count": self._count
                          }
                         )
 
@@ -163,4 +262,4 @@ class SearchPosts(object):
     """
     Returns a result wrapped in a new instance of Post().
     """
-    return Post(next(self._search), url_domain=self.url_domain, proxies=self.proxies)
\ No newline at end of file
+    return Post(self._next_result(), url_domain=self.url_domain, proxies=self.proxies, session=self.session)
\ No newline at end of file
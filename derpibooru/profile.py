@@ -24,27 +24,28 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-from .request import get_user_data, get_user_id_by_name
+from .request import get_user_data, get_user_id_by_name, invalidate_data
 from .tag import Tag
 from .comments import Comments
 from .search import Search
 from .galleries import Galleries
 from .posts import SearchPosts
+from .record import Record
 
 __all__ = [
   "Profile"
 ]
 
-class Profile(object):
-  def __init__(self, user_id, username="", url_domain="https://derpibooru.org", proxies={}):
+class Profile(Record):
+  __slots__ = ("proxies", "session", "url_domain")
+
+  def __init__(self, user_id, username="", url_domain="https://derpibooru.org", proxies={}, session=None):
     self.proxies = proxies
+    self.session = session
     self.url_domain = url_domain
     if user_id is None:
-      user_id = get_user_id_by_name(username, url_domain=url_domain, proxies=proxies)
-    self._data = get_user_data(user_id, url_domain=url_domain, proxies=proxies)
-    for field, body in self.data.items():
-      if not hasattr(self, field):
-        setattr(self, field, body)
+      user_id = get_user_id_by_name(username, url_domain=url_domain, proxies=proxies, session=session)
+    self._data = get_user_data(user_id, url_domain=url_domain, proxies=proxies, session=session)
 
   def __str__(self):
     return f'''Profile({self.name})'''
@@ -58,7 +59,8 @@ class Profile(object):
     return f"{self.url_domain}/profiles/{self.slug}"
 
   def update(self):
-    data = get_user_data(self.id, url_domain=self.url_domain, proxies=self.proxies)
+    invalidate_data("profiles", self.id, url_domain=self.url_domain, session=self.session)
+    data = get_user_data(self.id, url_domain=self.url_domain, proxies=self.proxies, session=self.session)
 
     if data:
       self._data = data
@@ -69,47 +71,46 @@ class Profile(object):
 
   def links(self):
     for link_data in self.data['links']:
-      yield Link(link_data, url_domain=self.url_domain, proxies=self.proxies)
+      yield Link(link_data, url_domain=self.url_domain, proxies=self.proxies, session=self.session)
 
   def comments(self, key="", limit=50, filter_id="", per_page=25, page=1):
     return Comments(user_id=self.id, key=key, limit=limit, filter_id=filter_id,
                     per_page=per_page, page=page,
-                    url_domain=self.url_domain, proxies=self.proxies)
+                    url_domain=self.url_domain, proxies=self.proxies, session=self.session)
 
   def uploads(self, key="", sf="created_at", sd="desc", limit=50,
               filter_id="", per_page=25, page=1):
     return Search(q=(f"uploader_id:{self.id}",), key=key, sf=sf, sd=sd,
                   limit=limit, filter_id=filter_id, per_page=per_page,
-                  page=page, url_domain=self.url_domain, proxies=self.proxies)
+                  page=page, url_domain=self.url_domain, proxies=self.proxies, session=self.session)
 
   def favorites(self, key="", sf="created_at", sd="desc", limit=50,
                 filter_id="", per_page=25, page=1):
     return Search(q=(f"faved_by_id:{self.id}",), key=key, sf=sf, sd=sd,
                   limit=limit, filter_id=filter_id, per_page=per_page,
-                  page=page, url_domain=self.url_domain, proxies=self.proxies)
+                  page=page, url_domain=self.url_domain, proxies=self.proxies, session=self.session)
 
   def artworks(self, key="", sf="created_at", sd="desc", limit=50,
                filter_id="", per_page=25, page=1):
     artist_tags = {link.tag.name for link in self.links()}
     return Search(q=artist_tags, key=key, sf=sf, sd=sd,
                   limit=limit, filter_id=filter_id, per_page=per_page,
-                  page=page, url_domain=self.url_domain, proxies=self.proxies)
+                  page=page, url_domain=self.url_domain, proxies=self.proxies, session=self.session)
 
   def galleries(self, key="", limit=50, per_page=25, page=1):
     return Galleries(self, key=key, q=(f"user:{self.name}",), limit=limit,
                      per_page=per_page, page=page,
-                     url_domain=self.url_domain, proxies=self.proxies)
+                     url_domain=self.url_domain, proxies=self.proxies, session=self.session)
 
   def posts(self, limit=50, per_page=25, page=1):
     return SearchPosts(q={f"user_id:{self.id}",}, limit=limit, per_page=per_page,
-                       page=page, url_domain=self.url_domain, proxies=self.proxies)
+                       page=page, url_domain=self.url_domain, proxies=self.proxies, session=self.session)
+
+class Award(Record):
+  __slots__ = ()
 
-class Award(object):
   def __init__(self, data):
     self._data = data
-    for field, body in self.data.items():
-      if not hasattr(self, field):
-        setattr(self, field, body)
 
   def __str__(self):
     return f'''Badge({self.title})'''
@@ -118,13 +119,14 @@ class Award(object):
   def data(self):
     return self._data
 
-class Link(object):
-  def __init__(self, data, url_domain="https://derpibooru.org", proxies={}):
+class Link(Record):
+  __slots__ = ("proxies", "session", "url_domain")
+
+  def __init__(self, data, url_domain="https://derpibooru.org", proxies={}, session=None):
     self.proxies = proxies
+    self.session = session
+    self.url_domain = url_domain
     self._data = data
-    for field, body in self.data.items():
-      if not hasattr(self, field):
-        setattr(self, field, body)
 
   def __str__(self):
     return f'''Link({self.title})'''
@@ -136,5 +138,5 @@ class Link(object):
   @property
   def tag(self):
     return Tag(None, tag_id=self.data["tag_id"],
-               url_domain=self.url_domain, proxies=self.proxies)
+               url_domain=self.url_domain, proxies=self.proxies, session=self.session)
 
@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2014, Joshua Stone
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import time
+from atexit import register
+from functools import wraps
+from os import environ
+from sys import stderr
+from threading import Lock, local
+
+__all__ = [
+  "Profiler",
+  "profile",
+  "profiled",
+  "measure"
+]
+
+# CPU time of current thread, so time of other threads isn't counted
+cpu_time = getattr(time, "thread_time", time.process_time)
+
+# Profiler() which records profiled functions or None
+active = None
+
+class Profiler(object):
+  """
+  Profiler() records calls, cumulative and own (without profiled calls made
+  inside) wall and CPU time of profiled functions of the library.
+  Functions marked as I/O (HTTP requests) are reported separately:
+  their wall time is split into CPU time of HTTP client and waiting.
+  """
+  def __init__(self):
+    self.stats = {}
+    self.started = time.perf_counter()
+    self.elapsed = None
+    self._lock = Lock()
+    self._local = local()
+
+  def call(self, name, io, func, *args, **kwargs):
+    stack = getattr(self._local, "stack", None)
+    if stack is None:
+      stack = self._local.stack = []
+    frame = [0.0, 0.0]
+    stack.append(frame)
+    wall, cpu = time.perf_counter(), cpu_time()
+    try:
+      return func(*args, **kwargs)
+    finally:
+      wall, cpu = time.perf_counter() - wall, cpu_time() - cpu
+      stack.pop()
+      if stack:
+        stack[-1][0] += wall
+        stack[-1][1] += cpu
+      with self._lock:
+        entry = self.stats.get(name)
+        if entry is None:
+          entry = self.stats[name] = {"io": io, "calls": 0, "wall": 0.0, "cpu": 0.0,
+                                      "own_wall": 0.0, "own_cpu": 0.0}
+        entry["calls"] += 1
+        entry["wall"] += wall
+        entry["cpu"] += cpu
+        entry["own_wall"] += wall - frame[0]
+        entry["own_cpu"] += cpu - frame[1]
+
+  def stop(self):
+    self.elapsed = time.perf_counter() - self.started
+
+  def summary(self):
+    """
+    Returns own CPU time of library, CPU time of HTTP client, time waiting
+    for network and total wall time of profiling.
+    """
+    with self._lock:
+      stats = list(self.stats.values())
+    elapsed = self.elapsed if self.elapsed is not None else time.perf_counter() - self.started
+    return {
+      "library_cpu": sum(entry["own_cpu"] for entry in stats if not entry["io"]),
+      "client_cpu": sum(entry["own_cpu"] for entry in stats if entry["io"]),
+      "io_wait": sum(entry["own_wall"] - entry["own_cpu"] for entry in stats if entry["io"]),
+      "elapsed": elapsed
+    }
+
+  def report(self):
+    """
+    Returns table of profiled functions sorted by own time and summary of
+    CPU versus I/O.
+    """
+    with self._lock:
+      stats = sorted(self.stats.items(), key=lambda item: -item[1]["own_wall"])
+    lines = [f"{'function':<24} {'calls':>9} {'total':>9} {'own':>9} {'own cpu':>9} {'per call':>10}"]
+    for name, entry in stats:
+      lines.append(f"{name:<24} {entry['calls']:>9} {entry['wall']:>9.3f} {entry['own_wall']:>9.3f} "
+                   f"{entry['own_cpu']:>9.3f} {entry['wall'] / entry['calls'] * 1e6:>8.1f}us")
+    summary = self.summary()
+    lines.append("")
+    lines.append(f"library CPU {summary['library_cpu']:.3f}s, HTTP client CPU {summary['client_cpu']:.3f}s, "
+                 f"waiting for network {summary['io_wait']:.3f}s of {summary['elapsed']:.3f}s")
+    return "\n".join(lines)
+
+def profiled(name, io=False):
+  """
+  Decorator recording calls of function by active profiler.
+  """
+  def decorator(func):
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+      if active is None:
+        return func(*args, **kwargs)
+      return active.call(name, io, func, *args, **kwargs)
+    return wrapper
+  return decorator
+
+def measure(name, io, func, *args, **kwargs):
+  """
+  Calls func recording it by active profiler.
+  """
+  if active is None:
+    return func(*args, **kwargs)
+  return active.call(name, io, func, *args, **kwargs)
+
+class profile(object):
+  """
+  Context manager profiling hot paths of the library, e.g.
+  with derpibooru.profile(): ...
+  The report is written to output (stderr by default, None for no output)
+  at exit. Setting DERPIBOORU_PROFILE environment variable profiles the
+  whole run and writes the report at exit of interpreter.
+  """
+  def __init__(self, output=stderr):
+    self.output = output
+    self.profiler = Profiler()
+
+  def __enter__(self):
+    global active
+    self.previous, active = active, self.profiler
+    return self.profiler
+
+  def __exit__(self, *exc_info):
+    global active
+    active = self.previous
+    self.profiler.stop()
+    if self.output is not None:
+      print(self.profiler.report(), file=self.output)
+
+if environ.get("DERPIBOORU_PROFILE"):
+  run_profile = profile()
+  run_profile.__enter__()
+  register(run_profile.__exit__)
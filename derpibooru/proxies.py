@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2014, Joshua Stone
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from threading import Lock
+from time import monotonic
+
+__all__ = [
+  "ProxyPool"
+]
+
+class Proxy(object):
+  """
+  Health of one proxy.
+  """
+  def __init__(self, proxies):
+    self.proxies = proxies
+    self.inflight = 0
+    self.requests = 0
+    self.errors = 0
+    self.failures = 0
+    self.latency = None
+    self.evicted = 0.0
+
+  @property
+  def stats(self):
+    return {"inflight": self.inflight, "requests": self.requests, "errors": self.errors,
+            "latency": self.latency, "evicted": self.evicted > monotonic()}
+
+class ProxyPool(object):
+  """
+  ProxyPool() can be passed as proxies to Search(), Image(), Tags() and other
+  classes instead of one proxies dict. Every request takes a proxy from the
+  list round-robin or the least loaded one (fewest requests in flight, then
+  lowest latency), so concurrent pages are spread over proxies.
+
+  Proxy is an URL for both http and https or a requests-like proxies dict.
+  After failures failed requests in a row (connection error or one of
+  statuses) proxy isn't used for eviction seconds; if every proxy is
+  evicted, the one returning first is used.
+  """
+  def __init__(self, proxies, strategy="round-robin", failures=3, eviction=60,
+               statuses=(403, 407, 429, 500, 502, 503, 504)):
+    if strategy not in ("round-robin", "least-loaded"):
+      raise ValueError(strategy)
+    self.strategy = strategy
+    self.failures = failures
+    self.eviction = eviction
+    self.statuses = set(statuses)
+    self._proxies = [Proxy(proxy if isinstance(proxy, dict) else {"http": proxy, "https": proxy})
+                     for proxy in proxies]
+    if not self._proxies:
+      raise ValueError(proxies)
+    self._next = 0
+    self._lock = Lock()
+
+  def __len__(self):
+    return len(self._proxies)
+
+  @property
+  def stats(self):
+    """
+    Returns requests in flight, requests, errors, average latency and
+    eviction state for every proxy.
+    """
+    with self._lock:
+      return [{**proxy.proxies, **proxy.stats} for proxy in self._proxies]
+
+  def _choose(self):
+    now = monotonic()
+    healthy = [proxy for proxy in self._proxies if proxy.evicted <= now]
+    if not healthy:
+      return min(self._proxies, key=lambda proxy: proxy.evicted)
+    if self.strategy == "least-loaded":
+      return min(healthy, key=lambda proxy: (proxy.inflight, proxy.latency or 0))
+    self._next = (self._next + 1) % len(healthy)
+    return healthy[self._next]
+
+  def acquire(self, url):
+    """
+    Returns token (Proxy(), start time) for request to url; proxies dict of
+    request is token[0].proxies. Token is given back to release() or cancel().
+    """
+    with self._lock:
+      proxy = self._choose()
+      proxy.inflight += 1
+      proxy.requests += 1
+    return proxy, monotonic()
+
+  def cancel(self, token):
+    """
+    Releases proxy of request which was cancelled without result.
+    """
+    with self._lock:
+      token[0].inflight -= 1
+
+  def release(self, token, status_code=None):
+    """
+    Takes result of request: status_code, or None for failed connection.
+    """
+    proxy, started = token
+    latency = monotonic() - started
+    with self._lock:
+      proxy.inflight -= 1
+      if status_code is None or status_code in self.statuses:
+        proxy.errors += 1
+        proxy.failures += 1
+        if proxy.failures >= self.failures:
+          proxy.evicted, proxy.failures = monotonic() + self.eviction, 0
+      else:
+        proxy.failures = 0
+        proxy.latency = latency if proxy.latency is None else 0.9 * proxy.latency + 0.1 * latency
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2014, Joshua Stone
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import os
+from json import dumps, loads
+from threading import Lock
+from time import sleep, time
+from urllib.parse import urlsplit
+
+try:
+  import fcntl
+except ImportError:
+  fcntl = None
+
+__all__ = [
+  "RateLimiter",
+  "url_domain_of"
+]
+
+def url_domain_of(url):
+  """
+  Returns scheme and host of url, e.g. "https://derpibooru.org".
+  """
+  parts = urlsplit(url)
+  return f"{parts.scheme}://{parts.netloc}"
+
+class Bucket(object):
+  """
+  Token bucket kept in memory of process.
+  """
+  def __init__(self, rate, burst):
+    self.rate = rate
+    self.burst = burst
+    self._tokens, self._updated = burst, time()
+    self._lock = Lock()
+
+  def reserve(self):
+    with self._lock:
+      self._tokens, self._updated, wait = take(self._tokens, self._updated, self.rate, self.burst)
+      return wait
+
+class FileBucket(Bucket):
+  """
+  Token bucket kept in file, so it's shared by processes on one host.
+  """
+  def __init__(self, rate, burst, path):
+    if fcntl is None:
+      raise OSError("file rate limiter needs fcntl")
+    super().__init__(rate, burst)
+    self.path = path
+
+  def reserve(self):
+    with self._lock, open(os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644), "r+") as state:
+      fcntl.flock(state, fcntl.LOCK_EX)
+      saved = state.read()
+      tokens, updated = loads(saved) if saved else (self.burst, time())
+      tokens, updated, wait = take(tokens, updated, self.rate, self.burst)
+      state.seek(0)
+      state.truncate()
+      state.write(dumps([tokens, updated]))
+      return wait
+
+def take(tokens, updated, rate, burst):
+  """
+  Takes one token; returns new state and seconds to wait for the token.
+  Tokens can go below zero, so waiting requests are queued in order.
+  """
+  now = time()
+  tokens = min(burst, tokens + (now - updated) * rate) - 1
+  return tokens, now, max(-tokens / rate, 0)
+
+class RateLimiter(object):
+  """
+  RateLimiter() lets through rate requests per second with bursts of up to
+  burst requests for every booru, e.g.
+  RateLimiter(rates={"https://derpibooru.org": (5, 10)}).
+  rate and burst are used for boorus not listed in rates; rate=None means
+  no limit.
+
+  With path (a directory), state of every booru is kept in a file there, so
+  processes on one host share the limit.
+  """
+  def __init__(self, rate=None, burst=1, rates={}, path=None):
+    self.rate = rate
+    self.burst = burst
+    self.path = path
+    self.waited = 0.0
+    self._rates = {}
+    self._buckets = {}
+    self._lock = Lock()
+    for url_domain, (domain_rate, domain_burst) in rates.items():
+      self.set_rate(url_domain, domain_rate, domain_burst)
+
+  def set_rate(self, url_domain, rate, burst=1):
+    """
+    Set requests per second and burst for requests to url_domain.
+    """
+    url_domain = url_domain.rstrip("/")
+    with self._lock:
+      self._rates[url_domain] = (rate, burst)
+      self._buckets.pop(url_domain, None)
+
+  def _bucket(self, url_domain):
+    with self._lock:
+      bucket = self._buckets.get(url_domain)
+      if bucket is None:
+        rate, burst = self._rates.get(url_domain, (self.rate, self.burst))
+        if not rate:
+          return None
+        if self.path:
+          name = url_domain.replace("://", "_").replace(":", "_").replace("/", "_")
+          bucket = FileBucket(rate, burst, os.path.join(self.path, f"{name}.bucket"))
+        else:
+          bucket = Bucket(rate, burst)
+        self._buckets[url_domain] = bucket
+      return bucket
+
+  def reserve(self, url):
+    """
+    Takes a token for request to url; returns seconds to wait before it.
+    """
+    bucket = self._bucket(url_domain_of(url))
+    if bucket is None:
+      return 0
+    wait = bucket.reserve()
+    with self._lock:
+      self.waited += wait
+    return wait
+
+  def acquire(self, url):
+    """
+    Blocks until request to url is allowed.
+    """
+    wait = self.reserve(url)
+    if wait > 0:
+      sleep(wait)
@@ -24,16 +24,27 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-from requests import get, post, codes
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from math import ceil
+from queue import Queue, Full
+from threading import Thread, Event
+from requests import codes
 from urllib.parse import urlencode
-from .helpers import format_params, format_params_url_galleries, slugging_tag
+from .helpers import format_params, format_params_url_galleries, slugging_tag, \
+                     keyset_position, keyset_query, quote_term
+from .session import get_session
+from .cache import cached, cache_key
+from .metrics import endpoint_template
 
 __all__ = [
-  "url", "request", "get_images", "get_image_data", "get_image_faves",
+  "invalidate_data",
+  "url", "request", "get_images", "get_image_data", "get_images_by_ids", "get_image_faves",
   "url_related", "request_related", "get_related",
   "post_image",
   "url_comments", "request_comments", "get_comments", "get_comment_data",
-  "url_tags", "request_tags", "get_tags", "get_tag_data",
+  "url_tags", "request_tags", "get_tags", "get_tag_data", "get_tags_by_names",
   "get_user_id_by_name", "get_user_data",
   "request_filters",
   "get_filters", "get_filter_data",
@@ -44,27 +55,224 @@ __all__ = [
   "url_posts", "request_posts", "get_posts", "get_post_data"
 ]
 
-def request_content(search, p, items_name, post_request=False, proxies={}):
+def request_page(search, p, items_name, post_request=False, proxies={}, session=None):
   if post_request:
-    request = post(search, params=p, proxies=proxies)
+    request = get_session(session).post(search, params=p, proxies=proxies)
   else:
-    request = get(search, params=p, proxies=proxies)
+    request = get_session(session).get(search, params=p, proxies=proxies)
+  if request.status_code == codes.ok:
+    return request.json()
+
+def fetch_page(search, p, items_name, post_request=False, proxies={}, session=None, parent=None):
+  """
+  Returns data of page and its span, which is child of parent span if
+  tracing is on.
+  """
+  tracer = getattr(get_session(session), "tracer", None)
+  if tracer is None or parent is None:
+    return request_page(search, p, items_name, post_request=post_request,
+                        proxies=proxies, session=session), None
+  with tracer.span("page", parent, page=p.get("page", 1)) as span:
+    data = request_page(search, p, items_name, post_request=post_request,
+                        proxies=proxies, session=session)
+    span.set(items=len(data[items_name]) if data is not None else None)
+  return data, span
+
+def request_pages(search, p, items_name, post_request=False, proxies={}, session=None, limit=None,
+                  parent=None):
+  """
+  Yields lists of items with span of their page until a short page, an error
+  or enough items for limit.
+  """
+  p = dict(p)
+  data, span = fetch_page(search, p, items_name, post_request=post_request,
+                          proxies=proxies, session=session, parent=parent)
   if "per_page" not in p:
     p["per_page"] = 50
-  while request.status_code == codes.ok:
-    items, item_count = request.json()[items_name], 0
-    for item in items:
-      yield item
-      item_count += 1
-    if item_count < p["per_page"]:
+  item_count = 0
+  while data is not None:
+    items = data[items_name]
+    yield items, span
+    item_count += len(items)
+    if len(items) < p["per_page"] or (limit is not None and item_count >= limit):
       break
-    p["page"] += 1
-    request = get(search, params=p, proxies=proxies)
+    p["page"] = p.get("page", 1) + 1
+    data, span = fetch_page(search, p, items_name, post_request=post_request,
+                            proxies=proxies, session=session, parent=parent)
+
+def parallel_pages(search, p, items_name, post_request=False, proxies={}, session=None,
+                   limit=None, workers=4, parent=None):
+  """
+  Reads total from first page and requests the rest of pages needed for
+  limit concurrently, at most 2*workers pages ahead of consumer.
+  Pages are yielded in order.
+  """
+  p = dict(p)
+  data, span = fetch_page(search, p, items_name, post_request=post_request,
+                          proxies=proxies, session=session, parent=parent)
+  if data is None:
+    return
+  items = data[items_name]
+  yield items, span
+  if "per_page" not in p or len(items) < p["per_page"]:
+    return
+  per_page, first_page = p["per_page"], p.get("page", 1)
+  if limit is not None:
+    limit -= len(items)
+    if limit <= 0:
+      return
+  if "total" not in data:
+    # Without total pages can't be planned, so the rest is walked sequentially
+    for page in request_pages(search, {**p, "page": first_page + 1}, items_name,
+                              post_request=post_request, proxies=proxies,
+                              session=session, limit=limit, parent=parent):
+      yield page
+    return
+
+  last_page = ceil(data["total"] / per_page)
+  if limit is not None:
+    last_page = min(last_page, first_page + ceil(limit / per_page))
+  pages = iter(range(first_page + 1, last_page + 1))
+  pool = ThreadPoolExecutor(max_workers=workers)
+
+  def submit(page):
+    return pool.submit(fetch_page, search, {**p, "page": page}, items_name,
+                       post_request=post_request, proxies=proxies, session=session, parent=parent)
+
+  pending = deque(submit(page) for page in islice(pages, 2 * workers))
+  try:
+    while pending:
+      data, span = pending.popleft().result()
+      if data is None:
+        break
+      items = data[items_name]
+      yield items, span
+      if len(items) < per_page:
+        break
+      for page in islice(pages, 1):
+        pending.append(submit(page))
+  finally:
+    for future in pending:
+      future.cancel()
+    pool.shutdown(wait=False)
+
+def keyset_pages(search, p, items_name, keyset, after=None, proxies={}, session=None, limit=None,
+                 parent=None):
+  """
+  Yields lists of items page by page. Every next page is selected by sort
+  value and id of the last item (keyset) instead of page number, so deep pages
+  cost the same and results don't shift when new items are added.
+  """
+  p = dict(p)
+  q, sd = p.get("q", "*"), p.get("sd", "desc")
+  if "per_page" not in p:
+    p["per_page"] = 50
+  item_count = 0
+  while True:
+    if after is not None:
+      p["q"], p["page"] = f"({q}),{keyset_query(keyset, sd, after)}", 1
+    data, span = fetch_page(search, p, items_name, proxies=proxies, session=session, parent=parent)
+    if data is None or not data[items_name]:
+      break
+    items = data[items_name]
+    yield items, span
+    item_count += len(items)
+    if len(items) < p["per_page"] or (limit is not None and item_count >= limit):
+      break
+    after = keyset_position(items[-1], keyset)
+
+def prefetch_pages(pages, depth):
+  """
+  Iterates pages in background thread, keeping up to depth pages ready
+  while current page is processed by consumer.
+  """
+  queue, stop = Queue(maxsize=depth), Event()
+
+  def put(entry):
+    while not stop.is_set():
+      try:
+        queue.put(entry, timeout=0.1)
+        return True
+      except Full:
+        pass
+    return False
+
+  def fetch():
+    try:
+      for page in pages:
+        if not put((page, None)):
+          return
+    except Exception as error:
+      put((None, error))
+      return
+    put((None, None))
+
+  Thread(target=fetch, daemon=True).start()
+  try:
+    while True:
+      page, error = queue.get()
+      if error is not None:
+        raise error
+      if page is None:
+        break
+      yield page
+  finally:
+    stop.set()
+
+def request_content(search, p, items_name, post_request=False, proxies={}, session=None,
+                    limit=None, prefetch=0, parallel=0, keyset=None, after=None):
+  """
+  With prefetch > 0 next pages are requested in background while current
+  page is iterated. With parallel > 0 pages are requested concurrently
+  by that number of threads. With keyset set to sorting method pages are
+  selected by position of last item, starting after given position.
+  With tracer of session iteration is traced with child span for every page;
+  span of page is current while its items are processed by consumer, so
+  requests made for them are children of it.
+  """
+  tracer = getattr(get_session(session), "tracer", None)
+  iteration = None
+  if tracer is not None:
+    iteration = tracer.start(f"iterate {endpoint_template(search)}", limit=limit,
+                             prefetch=prefetch, parallel=parallel, keyset=keyset)
+  if keyset:
+    pages = keyset_pages(search, p, items_name, keyset, after=after,
+                         proxies=proxies, session=session, limit=limit, parent=iteration)
+  elif parallel:
+    pages = parallel_pages(search, p, items_name, post_request=post_request, proxies=proxies,
+                           session=session, limit=limit, workers=parallel, parent=iteration)
+  else:
+    pages = request_pages(search, p, items_name, post_request=post_request,
+                          proxies=proxies, session=session, limit=limit, parent=iteration)
+  if prefetch:
+    pages = prefetch_pages(pages, prefetch)
+  if iteration is None:
+    for items, span in pages:
+      for item in items:
+        yield item
+    return
+
+  error, item_count = None, 0
+  try:
+    for items, span in pages:
+      for item in items:
+        item_count += 1
+        previous = tracer.activate(span)
+        try:
+          yield item
+        finally:
+          tracer.deactivate(span, previous)
+  except Exception as exception:
+    error = exception
+    raise
+  finally:
+    iteration.set(items=item_count)
+    tracer.end(iteration, error)
 
 def get_content(request_func, *request_args, limit=50, **request_kwargs):
   if limit is not None:
     if limit > 0:
-      r = request_func(*request_args, **request_kwargs)
+      r = request_func(*request_args, limit=limit, **request_kwargs)
       for index, content_item in enumerate(r, start=1):
         yield content_item
         if index >= limit:
@@ -79,7 +287,8 @@ def url(params, url_domain="https://derpibooru.org"):
   url = f"{url_domain}/search?{urlencode(p)}"
   return url
 
-def request(params, url_domain="https://derpibooru.org", proxies={}):
+def request(params, url_domain="https://derpibooru.org", proxies={}, session=None,
+            limit=None, prefetch=0, parallel=0, keyset=False, after=None):
   if "reverse_url" in params and params["reverse_url"]:
     search, p = f"{url_domain}/api/v1/json/search/reverse", format_params(params)
     p = {i:p[i] for i in p if i in ('url','distance')}
@@ -88,31 +297,129 @@ def request(params, url_domain="https://derpibooru.org", proxies={}):
     search, p = f"{url_domain}/api/v1/json/search/images", format_params(params)
     p = {i:p[i] for i in p if i not in ('url','distance')}
     post_request = False
-  for image in request_content(search, p, "images", post_request=post_request, proxies=proxies):
+  keyset = params["sf"] if keyset and not post_request else None
+  for image in request_content(search, p, "images", post_request=post_request, proxies=proxies, session=session,
+                               limit=limit, prefetch=prefetch, parallel=parallel,
+                               keyset=keyset, after=after):
     yield image
 
-def get_images(params, limit=50, url_domain="https://derpibooru.org", proxies={}):
-  for image in get_content(request, params, limit=limit, url_domain=url_domain, proxies=proxies):
+def get_images(params, limit=50, url_domain="https://derpibooru.org", proxies={}, session=None,
+               prefetch=0, parallel=0, keyset=False, after=None):
+  for image in get_content(request, params, limit=limit, url_domain=url_domain, proxies=proxies, session=session,
+                           prefetch=prefetch, parallel=parallel, keyset=keyset, after=after):
     yield image
 
-def get_image_data(id_number, url_domain="https://derpibooru.org", proxies={}):
+def invalidate_data(endpoint, *ids, url_domain="https://derpibooru.org", session=None):
+  """
+  Drops object kept by cache of session, so next get_***_data requests it.
+  """
+  cache = get_session(session).cache
+  if cache is not None:
+    cache.invalidate(cache_key(url_domain, endpoint, *ids))
+
+@cached("images", get_session)
+def get_image_data(id_number, url_domain="https://derpibooru.org", proxies={}, session=None):
   '''id_number can be "featured"'''
   url = f"{url_domain}/api/v1/json/images/{id_number}"
 
-  request = get(url, proxies=proxies)
+  request = get_session(session).get(url, proxies=proxies)
 
   if request.status_code == codes.ok:
     data = request.json()
 
     if data["image"]["duplicate_of"]:
-      return get_image_data(data["image"]["duplicate_of"], url_domain=url_domain, proxies=proxies)
+      return get_image_data(data["image"]["duplicate_of"], url_domain=url_domain, proxies=proxies, session=session)
     else:
       return data["image"]
 
-def get_image_faves(id_number, url_domain="https://derpibooru.org", proxies={}):
+def request_images_by_ids(ids, params, url_domain="https://derpibooru.org", proxies={}, session=None,
+                          resolve_missing=True):
+  """
+  Returns dict of image data by id for up to 50 ids requested with one
+  search query. Duplicates are replaced with images they are duplicate of;
+  images not found by search are requested one by one if resolve_missing.
+  """
+  ids = list(ids)
+  search = f"{url_domain}/api/v1/json/search/images"
+  p = format_params({**params, "q": (" || ".join(f"id:{id_number}" for id_number in ids),)})
+  p.update({"per_page": 50, "page": 1})
+  data = request_page(search, p, "images", proxies=proxies, session=session)
+  found = {image["id"]: image for image in data["images"]} if data else {}
+
+  duplicates = {id_number: image["duplicate_of"] for id_number, image in found.items()
+                if image.get("duplicate_of")}
+  if duplicates:
+    originals = request_images_by_ids(set(duplicates.values()), params, url_domain=url_domain,
+                                      proxies=proxies, session=session,
+                                      resolve_missing=resolve_missing)
+    for id_number, original_id in duplicates.items():
+      if original_id in originals:
+        found[id_number] = originals[original_id]
+      else:
+        del found[id_number]
+
+  if resolve_missing:
+    for id_number in ids:
+      if id_number not in found:
+        image = get_image_data(id_number, url_domain=url_domain, proxies=proxies, session=session)
+        if image:
+          found[id_number] = image
+  return found
+
+def request_batches(request_func, keys, workers=4, failed=None, **kwargs):
+  """
+  Yields pairs of key and data (None if not found) in order of keys. Unique
+  keys are packed by 50 and passed to request_func, which returns dict of
+  data by key (None if request failed); chunks are requested concurrently.
+  Keys of failed chunks are appended to failed list if given.
+  """
+  keys = list(keys)
+  unique_keys = list(dict.fromkeys(keys))
+  chunks = iter([unique_keys[i:i + 50] for i in range(0, len(unique_keys), 50)])
+  workers = max(workers, 1)
+  pool = ThreadPoolExecutor(max_workers=workers)
+
+  def submit(chunk):
+    return chunk, pool.submit(request_func, chunk, **kwargs)
+
+  pending = deque(submit(chunk) for chunk in islice(chunks, 2 * workers))
+  found, resolved, position = {}, set(), 0
+  try:
+    while pending:
+      chunk, future = pending.popleft()
+      data = future.result()
+      if data is None:
+        data = {}
+        if failed is not None:
+          failed.extend(chunk)
+      found.update(data)
+      resolved.update(chunk)
+      for chunk in islice(chunks, 1):
+        pending.append(submit(chunk))
+      while position < len(keys) and keys[position] in resolved:
+        yield keys[position], found.get(keys[position])
+        position += 1
+  finally:
+    for chunk, future in pending:
+      future.cancel()
+    pool.shutdown(wait=False)
+
+def get_images_by_ids(ids, params, url_domain="https://derpibooru.org", proxies={}, session=None,
+                      workers=4, resolve_missing=True):
+  """
+  Yields pairs of id and image data (None for missing image) in order of ids.
+  Ids are packed by 50 into search queries, which are sent concurrently.
+  """
+  ids = [int(id_number) for id_number in ids]
+  for id_number, image in request_batches(request_images_by_ids, ids, workers=workers, params=params,
+                                          url_domain=url_domain, proxies=proxies, session=session,
+                                          resolve_missing=resolve_missing):
+    yield id_number, image
+
+def get_image_faves(id_number, url_domain="https://derpibooru.org", proxies={}, session=None):
   url = f"{url_domain}/images/{id_number}/favorites"
 
-  request = get(url, proxies=proxies)
+  request = get_session(session).get(url, proxies=proxies)
 
   if request.status_code == codes.ok:
     data = request.text.rsplit('</h5>',1)[-1].strip()
@@ -127,9 +434,10 @@ def url_related(id_number, params, url_domain="https://derpibooru.org"):
   url = f"{url_domain}/images/{id_number}/related?{urlencode(p)}"
   return url
 
-def request_related(id_number, params, url_domain="https://derpibooru.org", proxies={}):
+def request_related(id_number, params, url_domain="https://derpibooru.org", proxies={}, session=None,
+                    limit=None, prefetch=0, parallel=0):
   search, p = f"{url_domain}/images/{id_number}/related", format_params(params)
-  request = get(search, params=p, proxies=proxies)
+  request = get_session(session).get(search, params=p, proxies=proxies)
 
   # It should be temporary solution, until related returns to API
   if request.status_code == codes.ok:
@@ -139,16 +447,19 @@ def request_related(id_number, params, url_domain="https://derpibooru.org", prox
   params['sd'] = "desc"
   search, p = f"{url_domain}/api/v1/json/search/images", format_params(params)
 
-  for image in request_content(search, p, "images", proxies=proxies):
+  for image in request_content(search, p, "images", proxies=proxies, session=session,
+                               limit=limit, prefetch=prefetch, parallel=parallel):
     yield image
 
-def get_related(id_number, params, limit=50, url_domain="https://derpibooru.org", proxies={}):
+def get_related(id_number, params, limit=50, url_domain="https://derpibooru.org", proxies={}, session=None,
+                prefetch=0, parallel=0):
   for image in get_content(request_related, id_number, params,
-                           limit=limit, url_domain=url_domain, proxies=proxies):
+                           limit=limit, url_domain=url_domain, proxies=proxies, session=session,
+                           prefetch=prefetch, parallel=parallel):
     yield image
 
 def post_image(key, image_url, description="", tag_input="", source_url="",
-               url_domain="https://derpibooru.org", proxies={}):
+               url_domain="https://derpibooru.org", proxies={}, session=None):
   '''
   You must provide the direct link to the image in the image_url parameter.
   Abuse of the endpoint will result in a ban.
@@ -160,7 +471,7 @@ def post_image(key, image_url, description="", tag_input="", source_url="",
                    },
           "url": image_url
          }
-  request = post(search, params={"key": key}, json=json, proxies=proxies)
+  request = get_session(session).post(search, params={"key": key}, json=json, proxies=proxies)
   if request.status_code == codes.ok:
     data = request.json()
     return data
@@ -172,20 +483,25 @@ def url_comments(params, url_domain="https://derpibooru.org"):
   url = f"{url_domain}/comments?{urlencode(p)}"
   return url
 
-def request_comments(params, url_domain="https://derpibooru.org", proxies={}):
+def request_comments(params, url_domain="https://derpibooru.org", proxies={}, session=None,
+                     limit=None, prefetch=0, parallel=0):
   search, p = f"{url_domain}/api/v1/json/search/comments", format_params(params)
-  for comment in request_content(search, p, "comments", proxies=proxies):
+  for comment in request_content(search, p, "comments", proxies=proxies, session=session,
+                                 limit=limit, prefetch=prefetch, parallel=parallel):
     yield comment
 
-def get_comments(params, limit=50, url_domain="https://derpibooru.org", proxies={}):
+def get_comments(params, limit=50, url_domain="https://derpibooru.org", proxies={}, session=None,
+                 prefetch=0, parallel=0):
   for comment in get_content(request_comments, params,
-                             limit=limit, url_domain=url_domain, proxies=proxies):
+                             limit=limit, url_domain=url_domain, proxies=proxies, session=session,
+                             prefetch=prefetch, parallel=parallel):
     yield comment
 
-def get_comment_data(id_number, url_domain="https://derpibooru.org", proxies={}):
+@cached("comments", get_session)
+def get_comment_data(id_number, url_domain="https://derpibooru.org", proxies={}, session=None):
   url = f"{url_domain}/api/v1/json/comments/{id_number}"
 
-  request = get(url, proxies=proxies)
+  request = get_session(session).get(url, proxies=proxies)
 
   if request.status_code == codes.ok:
     data = request.json()
@@ -199,59 +515,97 @@ def url_tags(params, url_domain="https://derpibooru.org"):
   url = f"{url_domain}/tags?{urlencode(p)}"
   return url
 
-def request_tags(params, url_domain="https://derpibooru.org", proxies={}):
+def request_tags(params, url_domain="https://derpibooru.org", proxies={}, session=None,
+                 limit=None, prefetch=0, parallel=0):
   search, p = f"{url_domain}/api/v1/json/search/tags", format_params(params)
-  for tag in request_content(search, p, "tags", proxies=proxies):
+  for tag in request_content(search, p, "tags", proxies=proxies, session=session,
+                             limit=limit, prefetch=prefetch, parallel=parallel):
     yield tag
 
-def get_tags(params, limit=50, url_domain="https://derpibooru.org", proxies={}):
-  for tag in get_content(request_tags, params, limit=limit, url_domain=url_domain, proxies=proxies):
+def get_tags(params, limit=50, url_domain="https://derpibooru.org", proxies={}, session=None,
+             prefetch=0, parallel=0):
+  for tag in get_content(request_tags, params, limit=limit, url_domain=url_domain, proxies=proxies, session=session,
+                         prefetch=prefetch, parallel=parallel):
     yield tag
 
-def get_tag_data(tag, url_domain="https://derpibooru.org", proxies={}):
+@cached("tags", get_session)
+def get_tag_data(tag, url_domain="https://derpibooru.org", proxies={}, session=None):
   url = f"{url_domain}/api/v1/json/tags/{tag}"
 
-  request = get(url, proxies=proxies)
+  request = get_session(session).get(url, proxies=proxies)
 
   if request.status_code == codes.ok:
     data = request.json()
 
     return data["tag"]
 
-def get_user_id_by_name(username, url_domain="https://derpibooru.org", proxies={}):
+def request_tags_by_names(names, field="slug", url_domain="https://derpibooru.org", proxies={},
+                          session=None):
+  """
+  Returns dict of tag data by field value (slug, name or id) for up to 50
+  tags requested with one search query, or None if request failed.
+  """
+  names = list(names)
+  search = f"{url_domain}/api/v1/json/search/tags"
+  query = " || ".join(quote_term(field, name) for name in names)
+  p = {"q": query, "per_page": 50, "page": 1}
+  data = request_page(search, p, "tags", proxies=proxies, session=session)
+  return {tag[field]: tag for tag in data["tags"]} if data is not None else None
+
+def get_tags_by_names(names, field="slug", url_domain="https://derpibooru.org", proxies={}, session=None,
+                      workers=4, failed=None):
+  """
+  Yields pairs of slug (name or id) and tag data (None for missing tag) in
+  order of names. Names are packed by 50 into search queries; names of
+  failed queries are appended to failed list if given.
+  """
+  if field == "id":
+    names = [int(name) for name in names]
+  for name, tag in request_batches(request_tags_by_names, names, workers=workers, failed=failed,
+                                   field=field, url_domain=url_domain, proxies=proxies,
+                                   session=session):
+    yield name, tag
+
+def get_user_id_by_name(username, url_domain="https://derpibooru.org", proxies={}, session=None):
   url = f"{url_domain}/profiles/{slugging_tag(username)}"
 
-  request = get(url, proxies=proxies)
+  request = get_session(session).get(url, proxies=proxies)
 
   profile_data = request.text
   user_id = profile_data.split("/conversations?with=",1)[-1].split('">',1)[0]
   return user_id
 
-def get_user_data(user_id, url_domain="https://derpibooru.org", proxies={}):
+@cached("profiles", get_session)
+def get_user_data(user_id, url_domain="https://derpibooru.org", proxies={}, session=None):
   url = f"{url_domain}/api/v1/json/profiles/{user_id}"
 
-  request = get(url, proxies=proxies)
+  request = get_session(session).get(url, proxies=proxies)
 
   if request.status_code == codes.ok:
     data = request.json()
 
     return data["user"]
 
-def request_filters(filter_id, params, url_domain="https://derpibooru.org", proxies={}):
+def request_filters(filter_id, params, url_domain="https://derpibooru.org", proxies={}, session=None,
+                    limit=None, prefetch=0, parallel=0):
   '''filter_id can be "system"'''
   search, p = f"{url_domain}/api/v1/json/filters/{filter_id}", format_params(params)
-  for filter_item in request_content(search, p, "filters", proxies=proxies):
+  for filter_item in request_content(search, p, "filters", proxies=proxies, session=session,
+                                     limit=limit, prefetch=prefetch, parallel=parallel):
     yield filter_item
 
-def get_filters(filter_id, params, url_domain="https://derpibooru.org", limit=50, proxies={}):
+def get_filters(filter_id, params, url_domain="https://derpibooru.org", limit=50, proxies={}, session=None,
+                prefetch=0, parallel=0):
   for filter_item in get_content(request_filters, filter_id, params,
-                                 limit=limit, url_domain=url_domain, proxies=proxies):
+                                 limit=limit, url_domain=url_domain, proxies=proxies, session=session,
+                                 prefetch=prefetch, parallel=parallel):
     yield filter_item
 
-def get_filter_data(filter_id, url_domain="https://derpibooru.org", proxies={}):
+@cached("filters", get_session)
+def get_filter_data(filter_id, url_domain="https://derpibooru.org", proxies={}, session=None):
   url = f"{url_domain}/api/v1/json/filters/{filter_id}"
 
-  request = get(url, proxies=proxies)
+  request = get_session(session).get(url, proxies=proxies)
 
   if request.status_code == codes.ok:
     data = request.json()
@@ -263,28 +617,37 @@ def url_galleries(params, url_domain="https://derpibooru.org"):
   url = f"{url_domain}/galleries?{urlencode(p)}"
   return url
 
-def request_galleries(params, url_domain="https://derpibooru.org", proxies={}):
+def request_galleries(params, url_domain="https://derpibooru.org", proxies={}, session=None,
+                      limit=None, prefetch=0, parallel=0):
   search, p = f"{url_domain}/api/v1/json/search/galleries", format_params(params)
-  for gallery in request_content(search, p, "galleries", proxies=proxies):
+  for gallery in request_content(search, p, "galleries", proxies=proxies, session=session,
+                                 limit=limit, prefetch=prefetch, parallel=parallel):
     yield gallery
 
-def get_galleries(params, limit=50, url_domain="https://derpibooru.org", proxies={}):
-  for gallery in get_content(request_galleries, params, limit=limit, url_domain=url_domain, proxies=proxies):
+def get_galleries(params, limit=50, url_domain="https://derpibooru.org", proxies={}, session=None,
+                  prefetch=0, parallel=0):
+  for gallery in get_content(request_galleries, params, limit=limit, url_domain=url_domain, proxies=proxies, session=session,
+                             prefetch=prefetch, parallel=parallel):
     yield gallery
 
-def request_forums(params, url_domain="https://derpibooru.org", proxies={}):
+def request_forums(params, url_domain="https://derpibooru.org", proxies={}, session=None,
+                   limit=None, prefetch=0, parallel=0):
   search, p = f"{url_domain}/api/v1/json/forums", format_params(params)
-  for forum in request_content(search, p, "forums", proxies=proxies):
+  for forum in request_content(search, p, "forums", proxies=proxies, session=session,
+                               limit=limit, prefetch=prefetch, parallel=parallel):
     yield forum
 
-def get_forums(params, limit=50, url_domain="https://derpibooru.org", proxies={}):
-  for forum in get_content(request_forums, params, limit=limit, url_domain=url_domain, proxies=proxies):
+def get_forums(params, limit=50, url_domain="https://derpibooru.org", proxies={}, session=None,
+               prefetch=0, parallel=0):
+  for forum in get_content(request_forums, params, limit=limit, url_domain=url_domain, proxies=proxies, session=session,
+                           prefetch=prefetch, parallel=parallel):
     yield forum
 
-def get_forum_data(short_name, url_domain="https://derpibooru.org", proxies={}):
+@cached("forums", get_session)
+def get_forum_data(short_name, url_domain="https://derpibooru.org", proxies={}, session=None):
   url = f"{url_domain}/api/v1/json/forums/{short_name}"
 
-  request = get(url, proxies=proxies)
+  request = get_session(session).get(url, proxies=proxies)
 
   if request.status_code == codes.ok:
     data = request.json()
@@ -295,20 +658,25 @@ def url_topics(forum_short_name, params, url_domain="https://derpibooru.org"):
   url = f"{url_domain}/forums/{forum_short_name}?{urlencode(p)}"
   return url
 
-def request_topics(forum_short_name, params, url_domain="https://derpibooru.org", proxies={}):
+def request_topics(forum_short_name, params, url_domain="https://derpibooru.org", proxies={}, session=None,
+                   limit=None, prefetch=0, parallel=0):
   search, p = f"{url_domain}/api/v1/json/forums/{forum_short_name}/topics", format_params(params)
-  for topic in request_content(search, p, "topics", proxies=proxies):
+  for topic in request_content(search, p, "topics", proxies=proxies, session=session,
+                               limit=limit, prefetch=prefetch, parallel=parallel):
     yield topic
 
-def get_topics(forum_short_name, params, limit=50, url_domain="https://derpibooru.org", proxies={}):
+def get_topics(forum_short_name, params, limit=50, url_domain="https://derpibooru.org", proxies={}, session=None,
+               prefetch=0, parallel=0):
   for topic in get_content(request_topics, forum_short_name, params,
-                           limit=limit, url_domain=url_domain, proxies=proxies):
+                           limit=limit, url_domain=url_domain, proxies=proxies, session=session,
+                           prefetch=prefetch, parallel=parallel):
     yield topic
 
-def get_topic_data(forum_short_name, topic_slug, url_domain="https://derpibooru.org", proxies={}):
+@cached("topics", get_session)
+def get_topic_data(forum_short_name, topic_slug, url_domain="https://derpibooru.org", proxies={}, session=None):
   url = f"{url_domain}/api/v1/json/forums/{forum_short_name}/topics/{topic_slug}"
 
-  request = get(url, proxies=proxies)
+  request = get_session(session).get(url, proxies=proxies)
 
   if request.status_code == codes.ok:
     data = request.json()
@@ -332,24 +700,29 @@ def url_posts(forum_short_name, topic_slug, params, url_domain="https://derpiboo
   url = f"{url_domain}/forums/{forum_short_name}/topics/{topic_slug}?{urlencode(p)}"
   return url
 
-def request_posts(params, forum_short_name="", topic_slug="", url_domain="https://derpibooru.org", proxies={}):
+def request_posts(params, forum_short_name="", topic_slug="", url_domain="https://derpibooru.org", proxies={}, session=None,
+                  limit=None, prefetch=0, parallel=0):
   if forum_short_name and topic_slug:
     search, p = f"{url_domain}/api/v1/json/forums/{forum_short_name}/topics/{topic_slug}/posts", format_params(params)
   else:
     search, p = f"{url_domain}/api/v1/json/search/posts", format_params(params)
-  for post in request_content(search, p, "posts", proxies=proxies):
+  for post in request_content(search, p, "posts", proxies=proxies, session=session,
+                              limit=limit, prefetch=prefetch, parallel=parallel):
     yield post
 
-def get_posts(params, forum_short_name="", topic_slug="", limit=50, url_domain="https://derpibooru.org", proxies={}):
+def get_posts(params, forum_short_name="", topic_slug="", limit=50, url_domain="https://derpibooru.org", proxies={}, session=None,
+              prefetch=0, parallel=0):
   for post in get_content(request_posts, params,
                           limit=limit, forum_short_name=forum_short_name,
-                          topic_slug=topic_slug, url_domain=url_domain, proxies=proxies):
+                          topic_slug=topic_slug, url_domain=url_domain, proxies=proxies, session=session,
+                          prefetch=prefetch, parallel=parallel):
     yield post
 
-def get_post_data(id_number, url_domain="https://derpibooru.org", proxies={}):
+@cached("posts", get_session)
+def get_post_data(id_number, url_domain="https://derpibooru.org", proxies={}, session=None):
   url = f"{url_domain}/api/v1/json/posts/{id_number}"
 
-  request = get(url, proxies=proxies)
+  request = get_session(session).get(url, proxies=proxies)
 
   if request.status_code == codes.ok:
     data = request.json()
@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2014, Joshua Stone
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from email.utils import parsedate_to_datetime
+from random import random
+from threading import Lock
+from time import time
+
+from requests.exceptions import ConnectionError, Timeout, ChunkedEncodingError
+
+__all__ = [
+  "Retry",
+  "RetryError",
+  "set_retry"
+]
+
+class Retry(object):
+  """
+  Retry() sends request again after response with one of statuses or one of
+  exceptions, up to attempts times in total. Pause grows twice with every
+  attempt from backoff up to max_backoff seconds and is extended by random
+  part of up to jitter of itself; Retry-After header of response is used
+  instead if it's present.
+
+  When all attempts fail, the last exception is raised, and RetryError() is
+  raised for status if raise_errors, so partial results aren't mistaken for
+  complete ones. Only methods are retried (not POST by default, since
+  uploading is not idempotent).
+  """
+  def __init__(self, attempts=5, backoff=0.5, max_backoff=60, jitter=0.5,
+               statuses=(429, 500, 502, 503, 504),
+               exceptions=(ConnectionError, Timeout, ChunkedEncodingError),
+               methods=("GET",), raise_errors=True):
+    self.attempts = attempts
+    self.backoff = backoff
+    self.max_backoff = max_backoff
+    self.jitter = jitter
+    self.statuses = set(statuses)
+    self.exceptions = tuple(exceptions)
+    self.methods = set(methods)
+    self.raise_errors = raise_errors
+    self.retries = 0
+    self.give_ups = 0
+    self._lock = Lock()
+
+  @property
+  def stats(self):
+    """
+    Returns counters of retried requests and requests which failed every attempt.
+    """
+    return {"retries": self.retries, "give_ups": self.give_ups}
+
+  def retry_after(self, response):
+    value = response.headers.get("Retry-After") if response is not None else None
+    if not value:
+      return None
+    try:
+      return max(float(value), 0)
+    except ValueError:
+      try:
+        return max(parsedate_to_datetime(value).timestamp() - time(), 0)
+      except (TypeError, ValueError):
+        return None
+
+  def delay(self, method, url, attempt, response=None, error=None):
+    """
+    Returns seconds to wait before next attempt, or None if response should
+    be returned. Raises error (or RetryError()) when all attempts failed.
+    """
+    if method.upper() not in self.methods:
+      failed = False
+    elif error is not None:
+      failed = isinstance(error, self.exceptions)
+    else:
+      failed = response.status_code in self.statuses
+    if not failed:
+      if error is not None:
+        raise error
+      return None
+
+    if attempt >= self.attempts:
+      with self._lock:
+        self.give_ups += 1
+      if error is not None:
+        raise error
+      if self.raise_errors:
+        raise RetryError(url, response.status_code, attempt)
+      return None
+
+    with self._lock:
+      self.retries += 1
+    wait = self.retry_after(response)
+    if wait is None:
+      wait = min(self.backoff * 2 ** (attempt - 1), self.max_backoff)
+      wait += wait * self.jitter * random()
+    return wait
+
+class RetryError(Exception):
+  """
+  Every attempt of request returned retryable status.
+  """
+  def __init__(self, url, status_code, attempts):
+    self.url = url
+    self.status_code = status_code
+    self.attempts = attempts
+
+  def __str__(self):
+    return f"{self.url} returned {self.status_code} after {self.attempts} attempts"
+
+def set_retry(retry):
+  """
+  Returns given Retry(), a new one for True, or None.
+  """
+  if retry is True:
+    return Retry()
+  elif retry is False:
+    return None
+  else:
+    return retry
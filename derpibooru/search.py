@@ -26,15 +26,22 @@
 
 from .request import get_images, url, get_related, url_related
 from .image import Image
+from .filters import system_filters
 from .helpers import tags, api_key, sort_format, join_params, user_option, set_limit, \
-                     validate_filter, set_distance
+                     validate_filter, set_distance, set_depth, keyset_field, \
+                     keyset_position
+from .categories import with_categories, set_categories
+from .interactions import with_interactions
+from .vocabulary import set_vocabulary
+from .checkpoint import Checkpoint, Resumable, set_checkpoint
+from .profiling import profiled
 
 __all__ = [
   "Search",
   "Related"
 ]
 
-class Search(object):
+class Search(Resumable):
   """
   Search() is the primary interface for interacting with Derpibooru's REST API.
 
@@ -43,17 +50,30 @@ class Search(object):
   interactions predictable as well as making versioning of searches relatively
   easy.
   """
+  checkpoint_name = "Search"
+
   def __init__(self, key="", q=set(), sf="created_at", sd="desc",
                limit=50, faves="", upvotes="", uploads="", watched="",
                filter_id="", per_page=25, page=1,
                reverse_url="", distance=0.25,
-               url_domain="https://derpibooru.org", proxies={}):
+               url_domain="https://derpibooru.org", proxies={}, session=None,
+               prefetch=0, parallel=0, keyset=False, after=None,
+               checkpoint=None, skip=0, count=0, categories=None, interactions=False, vocabulary=None):
     """
     By default initializes an instance of Search with the parameters to get
     the first 25 images on Derpibooru's front page.
     For reverse searching by image use reverse_url field.
+    skip is number of images omitted from start of the first page and count
+    is number of images returned before resume().
+    categories is TagCategories() (or True for a new one) which resolves tags
+    of every page at once for artists, species, characters and spoiler.
+    interactions requests upvoted, downvoted, faved, uploaded and watched
+    for every page at once (API key is needed).
+    vocabulary is TagVocabulary() (or True for a new one) which keeps tags of
+    images as arrays of numbers.
     """
     self.proxies = proxies
+    self.session = session
     self.url_domain = url_domain
     self._params = {
       "key": api_key(key),
@@ -97,8 +117,29 @@ class Search(object):
          self._params["q"].add("-my:watched")
       
     self._limit = set_limit(limit)
-    self._search = get_images(self._params, self._limit,
-                              url_domain=self.url_domain, proxies=self.proxies)
+    self._prefetch = set_depth(prefetch)
+    self._parallel = set_depth(parallel)
+    self._keyset = bool(keyset)
+    if self._keyset:
+      keyset_field(self._params["sf"])
+    self._after = tuple(after) if after else None
+    self._checkpoint = set_checkpoint(checkpoint)
+    self._skip, self._skipped = set_depth(skip), 0
+    self._yielded, self._count, self._last = 0, set_depth(count), None
+    self._search = get_images(self._params, self._limit + self._skip if self._limit else self._limit,
+                              url_domain=self.url_domain, proxies=self.proxies, session=self.session,
+                              prefetch=self._prefetch, parallel=self._parallel,
+                              keyset=self._keyset, after=self._after)
+    self._categories = set_categories(categories, url_domain=self.url_domain, proxies=self.proxies,
+                                      session=self.session)
+    if self._categories is not None:
+      self._search = with_categories(self._search, self._categories, self._params["per_page"])
+    self._interactions, self._page_interactions = bool(interactions), {}
+    if self._interactions and self._params["key"]:
+      self._search = with_interactions(self._search, self._params["key"], self._page_interactions,
+                                       self._params["per_page"], url_domain=self.url_domain,
+                                       proxies=self.proxies, session=self.session)
+    self._vocabulary = set_vocabulary(vocabulary)
   
   def __iter__(self):
     """
@@ -133,7 +174,18 @@ class Search(object):
     params = join_params(self.parameters, {"key": key,
                                            "limit": self._limit,
                                            "url_domain": self.url_domain,
-                                           "proxies": self.proxies}
+                                           "proxies": self.proxies,
+                                           "session": self.session,
+                                           "prefetch": self._prefetch,
+                                           "parallel": self._parallel,
+                                           "keyset": self._keyset,
+                                           "after": self._after,
+                                           "checkpoint": self._checkpoint,
+                                           "skip": self._skip,
+                                           "count": self._count,
+                                           "categories": self._categories,
+                                           "interactions": self._interactions,
+                                           "vocabulary": self._vocabulary}
                         )
 
     return self.__class__(**params)
@@ -145,7 +197,18 @@ class Search(object):
     params = join_params(self.parameters, {"q": q,
                                            "limit": self._limit,
                                            "url_domain": self.url_domain,
-                                           "proxies": self.proxies}
+                                           "proxies": self.proxies,
+                                           "session": self.session,
+                                           "prefetch": self._prefetch,
+                                           "parallel": self._parallel,
+                                           "keyset": self._keyset,
+                                           "after": self._after,
+                                           "checkpoint": self._checkpoint,
+                                           "skip": self._skip,
+                                           "count": self._count,
+                                           "categories": self._categories,
+                                           "interactions": self._interactions,
+                                           "vocabulary": self._vocabulary}
                         )
 
     return self.__class__(**params)
@@ -159,7 +222,18 @@ class Search(object):
     params = join_params(self.parameters, {"sf": sf,
                                            "limit": self._limit,
                                            "url_domain": self.url_domain,
-                                           "proxies": self.proxies}
+                                           "proxies": self.proxies,
+                                           "session": self.session,
+                                           "prefetch": self._prefetch,
+                                           "parallel": self._parallel,
+                                           "keyset": self._keyset,
+                                           "after": self._after,
+                                           "checkpoint": self._checkpoint,
+                                           "skip": self._skip,
+                                           "count": self._count,
+                                           "categories": self._categories,
+                                           "interactions": self._interactions,
+                                           "vocabulary": self._vocabulary}
                         )
 
     return self.__class__(**params)
@@ -171,7 +245,18 @@ class Search(object):
     params = join_params(self.parameters, {"sd": "desc",
                                            "limit": self._limit,
                                            "url_domain": self.url_domain,
-                                           "proxies": self.proxies}
+                                           "proxies": self.proxies,
+                                           "session": self.session,
+                                           "prefetch": self._prefetch,
+                                           "parallel": self._parallel,
+                                           "keyset": self._keyset,
+                                           "after": self._after,
+                                           "checkpoint": self._checkpoint,
+                                           "skip": self._skip,
+                                           "count": self._count,
+                                           "categories": self._categories,
+                                           "interactions": self._interactions,
+                                           "vocabulary": self._vocabulary}
                         )
 
     return self.__class__(**params)
@@ -183,7 +268,18 @@ class Search(object):
     params = join_params(self.parameters, {"sd": sd,
                                            "limit": self._limit,
                                            "url_domain": self.url_domain,
-                                           "proxies": self.proxies}
+                                           "proxies": self.proxies,
+                                           "session": self.session,
+                                           "prefetch": self._prefetch,
+                                           "parallel": self._parallel,
+                                           "keyset": self._keyset,
+                                           "after": self._after,
+                                           "checkpoint": self._checkpoint,
+                                           "skip": self._skip,
+                                           "count": self._count,
+                                           "categories": self._categories,
+                                           "interactions": self._interactions,
+                                           "vocabulary": self._vocabulary}
                         )
 
     return self.__class__(**params)
@@ -195,10 +291,223 @@ class Search(object):
     """
     params = join_params(self.parameters, {"limit": limit,
                                            "url_domain": self.url_domain,
-                                           "proxies": self.proxies})
+                                           "proxies": self.proxies,
+                                           "session": self.session,
+                                           "prefetch": self._prefetch,
+                                           "parallel": self._parallel,
+                                           "keyset": self._keyset,
+                                           "after": self._after,
+                                           "checkpoint": self._checkpoint,
+                                           "skip": self._skip,
+                                           "count": self._count,
+                                           "categories": self._categories,
+                                           "interactions": self._interactions,
+                                           "vocabulary": self._vocabulary})
+
+    return self.__class__(**params)
+
+  def prefetch(self, depth):
+    """
+    Set number of next pages of images requested in background while current
+    page is iterated, or set to 0 to request pages on demand; default 0.
+    """
+    params = join_params(self.parameters, {"limit": self._limit,
+                                           "url_domain": self.url_domain,
+                                           "proxies": self.proxies,
+                                           "session": self.session,
+                                           "prefetch": depth,
+                                           "parallel": self._parallel,
+                                           "keyset": self._keyset,
+                                           "after": self._after,
+                                           "checkpoint": self._checkpoint,
+                                           "skip": self._skip,
+                                           "count": self._count,
+                                           "categories": self._categories,
+                                           "interactions": self._interactions,
+                                           "vocabulary": self._vocabulary})
+
+    return self.__class__(**params)
+
+  def parallel(self, workers):
+    """
+    Set number of threads requesting pages of images concurrently, planned
+    by total count from first page, or set to 0 to request pages one by one;
+    default 0. Session pool size should be not less than workers.
+    """
+    params = join_params(self.parameters, {"limit": self._limit,
+                                           "url_domain": self.url_domain,
+                                           "proxies": self.proxies,
+                                           "session": self.session,
+                                           "prefetch": self._prefetch,
+                                           "parallel": workers,
+                                           "keyset": self._keyset,
+                                           "after": self._after,
+                                           "checkpoint": self._checkpoint,
+                                           "skip": self._skip,
+                                           "count": self._count,
+                                           "categories": self._categories,
+                                           "interactions": self._interactions,
+                                           "vocabulary": self._vocabulary})
+
+    return self.__class__(**params)
+
+  def keyset(self, keyset=True):
+    """
+    Select every next page by sort value and id of the last image instead of
+    page number; deep pages cost the same and new images don't shift results.
+    Only integer and date sort fields are available in this mode; sorting
+    by random, relevance, aspect_ratio or wilson_score raises ValueError.
+    """
+    params = join_params(self.parameters, {"limit": self._limit,
+                                           "url_domain": self.url_domain,
+                                           "proxies": self.proxies,
+                                           "session": self.session,
+                                           "prefetch": self._prefetch,
+                                           "parallel": self._parallel,
+                                           "keyset": keyset,
+                                           "after": self._after,
+                                           "checkpoint": self._checkpoint,
+                                           "skip": self._skip,
+                                           "count": self._count,
+                                           "categories": self._categories,
+                                           "interactions": self._interactions,
+                                           "vocabulary": self._vocabulary})
 
     return self.__class__(**params)
 
+  def after(self, image):
+    """
+    Start keyset search after given Image() or (sort value, id) position.
+    """
+    if isinstance(image, Image):
+      position = keyset_position(image.data, self.parameters["sf"])
+    else:
+      position = image
+    params = join_params(self.parameters, {"limit": self._limit,
+                                           "url_domain": self.url_domain,
+                                           "proxies": self.proxies,
+                                           "session": self.session,
+                                           "prefetch": self._prefetch,
+                                           "parallel": self._parallel,
+                                           "keyset": True,
+                                           "after": position,
+                                           "checkpoint": self._checkpoint,
+                                           "skip": self._skip,
+                                           "count": self._count,
+                                           "categories": self._categories,
+                                           "interactions": self._interactions,
+                                           "vocabulary": self._vocabulary})
+
+    return self.__class__(**params)
+
+  def checkpoint(self, path, every=100):
+    """
+    Save position of iteration to file every N images, so it can be continued
+    by Search.resume(path) after crash or restart.
+    """
+    params = join_params(self.parameters, {"limit": self._limit,
+                                           "url_domain": self.url_domain,
+                                           "proxies": self.proxies,
+                                           "session": self.session,
+                                           "prefetch": self._prefetch,
+                                           "parallel": self._parallel,
+                                           "keyset": self._keyset,
+                                           "after": self._after,
+                                           "checkpoint": Checkpoint(path, every),
+                                           "skip": self._skip,
+                                           "count": self._count,
+                                           "categories": self._categories,
+                                           "interactions": self._interactions,
+                                           "vocabulary": self._vocabulary})
+
+    return self.__class__(**params)
+
+  def categories(self, categories=True):
+    """
+    Resolve tags of every page with one request per 50 unknown tags, so
+    artists, species, characters and spoiler of images are served from memory.
+    Takes TagCategories() to share it with other searches.
+    """
+    params = join_params(self.parameters, {"limit": self._limit,
+                                           "url_domain": self.url_domain,
+                                           "proxies": self.proxies,
+                                           "session": self.session,
+                                           "prefetch": self._prefetch,
+                                           "parallel": self._parallel,
+                                           "keyset": self._keyset,
+                                           "after": self._after,
+                                           "checkpoint": self._checkpoint,
+                                           "skip": self._skip,
+                                           "count": self._count,
+                                           "categories": categories,
+                                           "interactions": self._interactions,
+                                           "vocabulary": self._vocabulary})
+
+    return self.__class__(**params)
+
+  def with_interactions(self, key=""):
+    """
+    Request upvoted, downvoted, faved, uploaded and watched of every page with
+    one query per my:*** list instead of one query per image and property.
+    Takes a user's API key if it isn't set yet.
+    """
+    params = join_params(self.parameters, {"key": key if key else self.parameters["key"],
+                                           "limit": self._limit,
+                                           "url_domain": self.url_domain,
+                                           "proxies": self.proxies,
+                                           "session": self.session,
+                                           "prefetch": self._prefetch,
+                                           "parallel": self._parallel,
+                                           "keyset": self._keyset,
+                                           "after": self._after,
+                                           "checkpoint": self._checkpoint,
+                                           "skip": self._skip,
+                                           "count": self._count,
+                                           "categories": self._categories,
+                                           "interactions": True,
+                                           "vocabulary": self._vocabulary})
+
+    return self.__class__(**params)
+
+  def intern_tags(self, vocabulary=True):
+    """
+    Keep tags and tag_ids of images as arrays of numbers with tag names
+    stored once in TagVocabulary(); Image.tags decodes them when read.
+    Takes TagVocabulary() to share it with other searches.
+    """
+    params = join_params(self.parameters, {"limit": self._limit,
+                                           "url_domain": self.url_domain,
+                                           "proxies": self.proxies,
+                                           "session": self.session,
+                                           "prefetch": self._prefetch,
+                                           "parallel": self._parallel,
+                                           "keyset": self._keyset,
+                                           "after": self._after,
+                                           "checkpoint": self._checkpoint,
+                                           "skip": self._skip,
+                                           "count": self._count,
+                                           "categories": self._categories,
+                                           "interactions": self._interactions,
+                                           "vocabulary": vocabulary})
+
+    return self.__class__(**params)
+
+  def _position(self, parameters):
+    if self._keyset:
+      return parameters["page"], 0
+    return super()._position(parameters)
+
+  def _extra_state(self):
+    if self._keyset:
+      after = keyset_position(self._last, self._params["sf"]) if self._last else self._after
+    else:
+      after = None
+    return {"keyset": self._keyset, "after": after}
+
+  @classmethod
+  def _extra_params(cls, state):
+    return {"keyset": state["keyset"], "after": state["after"]}
+
   def filter(self, filter_id=""):
     """
     Takes a filter's ID to be used in the current search context. Filter IDs can
@@ -209,7 +518,18 @@ class Search(object):
     params = join_params(self.parameters, {"filter_id": validate_filter(filter_id),
                                            "limit": self._limit,
                                            "url_domain": self.url_domain,
-                                           "proxies": self.proxies}
+                                           "proxies": self.proxies,
+                                           "session": self.session,
+                                           "prefetch": self._prefetch,
+                                           "parallel": self._parallel,
+                                           "keyset": self._keyset,
+                                           "after": self._after,
+                                           "checkpoint": self._checkpoint,
+                                           "skip": self._skip,
+                                           "count": self._count,
+                                           "categories": self._categories,
+                                           "interactions": self._interactions,
+                                           "vocabulary": self._vocabulary}
                         )
 
     return self.__class__(**params)
@@ -288,7 +608,18 @@ class Search(object):
      params = join_params(self.parameters, {"q": query,
                                             "limit": self._limit,
                                             "url_domain": self.url_domain,
-                                            "proxies": self.proxies}
+                                            "proxies": self.proxies,
+                                            "session": self.session,
+                                            "prefetch": self._prefetch,
+                                            "parallel": self._parallel,
+                                            "keyset": self._keyset,
+                                            "after": self._after,
+                                            "checkpoint": self._checkpoint,
+                                            "skip": self._skip,
+                                            "count": self._count,
+                                            "categories": self._categories,
+                                            "interactions": self._interactions,
+                                            "vocabulary": self._vocabulary}
                          )
 
      return self.__class__(**params)
@@ -301,23 +632,45 @@ class Search(object):
      params = join_params(self.parameters, {"q": query,
                                             "limit": self._limit,
                                             "url_domain": self.url_domain,
-                                            "proxies": self.proxies}
+                                            "proxies": self.proxies,
+                                            "session": self.session,
+                                            "prefetch": self._prefetch,
+                                            "parallel": self._parallel,
+                                            "keyset": self._keyset,
+                                            "after": self._after,
+                                            "checkpoint": self._checkpoint,
+                                            "skip": self._skip,
+                                            "count": self._count,
+                                            "categories": self._categories,
+                                            "interactions": self._interactions,
+                                            "vocabulary": self._vocabulary}
                          )
 
      return self.__class__(**params)
 
+  def by_ids(self, ids, missing=None):
+    """
+    Returns images with given ids in the same order using the key and filter
+    of current search (everything filter if none). Ids of not found images
+    are appended to missing list if given.
+    """
+    filter_id = self.parameters["filter_id"] or system_filters["everything"]
+    return Image.many(ids, key=self.parameters["key"], filter_id=filter_id, missing=missing,
+                      workers=self._parallel or 4, url_domain=self.url_domain,
+                      proxies=self.proxies, session=self.session)
+
   def get_related(self,image):
     if isinstance(image,Image):
       return Related(image, key=self.parameters['key'], limit=self._limit,
                      filter_id=self.parameters['filter_id'],
                      per_page=self.parameters['per_page'],
-                     url_domain=self.url_domain, proxies=self.proxies)
+                     url_domain=self.url_domain, proxies=self.proxies, session=self.session)
     else:
-      return Related(Image(None, image_id=image, url_domain=self.url_domain, proxies=self.proxies),
+      return Related(Image(None, image_id=image, url_domain=self.url_domain, proxies=self.proxies, session=self.session),
                      key=self.parameters['key'], limit=self._limit,
                      filter_id=self.parameters['filter_id'],
                      per_page=self.parameters['per_page'],
-                     url_domain=self.url_domain, proxies=self.proxies)
+                     url_domain=self.url_domain, proxies=self.proxies, session=self.session)
 
   def get_page(self,page):
     """
@@ -326,7 +679,18 @@ class Search(object):
     params = join_params(self.parameters, {"page": set_limit(page),
                                            "limit": self._limit,
                                            "url_domain": self.url_domain,
-                                           "proxies": self.proxies}
+                                           "proxies": self.proxies,
+                                           "session": self.session,
+                                           "prefetch": self._prefetch,
+                                           "parallel": self._parallel,
+                                           "keyset": self._keyset,
+                                           "after": self._after,
+                                           "checkpoint": self._checkpoint,
+                                           "skip": self._skip,
+                                           "count": self._count,
+                                           "categories": self._categories,
+                                           "interactions": self._interactions,
+                                           "vocabulary": self._vocabulary}
                         )
 
     return self.__class__(**params)
@@ -339,7 +703,18 @@ class Search(object):
     params = join_params(self.parameters, {"per_page": set_limit(limit),
                                            "limit": self._limit,
                                            "url_domain": self.url_domain,
-                                           "proxies": self.proxies}
+                                           "proxies": self.proxies,
+                                           "session": self.session,
+                                           "prefetch": self._prefetch,
+                                           "parallel": self._parallel,
+                                           "keyset": self._keyset,
+                                           "after": self._after,
+                                           "checkpoint": self._checkpoint,
+                                           "skip": self._skip,
+                                           "count": self._count,
+                                           "categories": self._categories,
+                                           "interactions": self._interactions,
+                                           "vocabulary": self._vocabulary}
                         )
 
     return self.__class__(**params)
@@ -351,7 +726,18 @@ class Search(object):
     params = join_params(self.parameters, {"reverse_url": url,
                                            "limit": self._limit,
                                            "url_domain": self.url_domain,
-                                           "proxies": self.proxies}
+                                           "proxies": self.proxies,
+                                           "session": self.session,
+                                           "prefetch": self._prefetch,
+                                           "parallel": self._parallel,
+                                           "keyset": self._keyset,
+                                           "after": self._after,
+                                           "checkpoint": self._checkpoint,
+                                           "skip": self._skip,
+                                           "count": self._count,
+                                           "categories": self._categories,
+                                           "interactions": self._interactions,
+                                           "vocabulary": self._vocabulary}
                         )
 
     return self.__class__(**params)
@@ -363,17 +749,33 @@ class Search(object):
     params = join_params(self.parameters, {"distance": set_distance(distance),
                                            "limit": self._limit,
                                            "url_domain": self.url_domain,
-                                           "proxies": self.proxies}
+                                           "proxies": self.proxies,
+                                           "session": self.session,
+                                           "prefetch": self._prefetch,
+                                           "parallel": self._parallel,
+                                           "keyset": self._keyset,
+                                           "after": self._after,
+                                           "checkpoint": self._checkpoint,
+                                           "skip": self._skip,
+                                           "count": self._count,
+                                           "categories": self._categories,
+                                           "interactions": self._interactions,
+                                           "vocabulary": self._vocabulary}
                         )
 
     return self.__class__(**params)
 
+  @profiled("Search.__next__")
   def __next__(self):
     """
     Returns a result wrapped in a new instance of Image().
     """
-    return Image(next(self._search), search_params=self.parameters,
-                 url_domain=self.url_domain, proxies=self.proxies)
+    data = self._next_result()
+    return Image(data, search_params=self.parameters,
+                 url_domain=self.url_domain, proxies=self.proxies, session=self.session,
+                 categories=self._categories,
+                 interactions=self._page_interactions.get(data["id"]),
+                 vocabulary=self._vocabulary)
 
 class Related(Search):
   """
@@ -383,7 +785,8 @@ class Related(Search):
   """
   def __init__(self, image, key="", limit=50,
                filter_id="", per_page=25,
-               url_domain="https://derpibooru.org", proxies={}):
+               url_domain="https://derpibooru.org", proxies={}, session=None,
+               prefetch=0, parallel=0, categories=None, interactions=False, vocabulary=None):
     """
     By default initializes with the parameters to get the first 25 related images.
     """
@@ -391,6 +794,10 @@ class Related(Search):
       self.proxies = proxies
     else:
       self.proxies = image.proxies
+    if session is not None:
+      self.session = session
+    else:
+      self.session = image.session
     self.url_domain = url_domain
     self.image = image
     self._params = {
@@ -399,8 +806,24 @@ class Related(Search):
       "per_page": set_limit(per_page)
     }
     self._limit = set_limit(limit)
+    self._prefetch = set_depth(prefetch)
+    self._parallel = set_depth(parallel)
+    self._keyset, self._after = False, None
+    self._checkpoint, self._skip, self._skipped = None, 0, 0
+    self._yielded, self._count, self._last = 0, 0, None
     self._search = get_related(self.image.id, self._params, self._limit,
-                               url_domain=self.url_domain, proxies=self.proxies)
+                               url_domain=self.url_domain, proxies=self.proxies, session=self.session,
+                               prefetch=self._prefetch, parallel=self._parallel)
+    self._categories = set_categories(categories, url_domain=self.url_domain, proxies=self.proxies,
+                                      session=self.session)
+    if self._categories is not None:
+      self._search = with_categories(self._search, self._categories, self._params["per_page"])
+    self._interactions, self._page_interactions = bool(interactions), {}
+    if self._interactions and self._params["key"]:
+      self._search = with_interactions(self._search, self._params["key"], self._page_interactions,
+                                       self._params["per_page"], url_domain=self.url_domain,
+                                       proxies=self.proxies, session=self.session)
+    self._vocabulary = set_vocabulary(vocabulary)
 
   @property
   def url(self):
@@ -419,7 +842,18 @@ class Related(Search):
     params = join_params(self.parameters, {"q": q,
                                            "limit": self._limit,
                                            "url_domain": self.url_domain,
-                                           "proxies": self.proxies}
+                                           "proxies": self.proxies,
+                                           "session": self.session,
+                                           "prefetch": self._prefetch,
+                                           "parallel": self._parallel,
+                                           "keyset": self._keyset,
+                                           "after": self._after,
+                                           "checkpoint": self._checkpoint,
+                                           "skip": self._skip,
+                                           "count": self._count,
+                                           "categories": self._categories,
+                                           "interactions": self._interactions,
+                                           "vocabulary": self._vocabulary}
                         )
     return Search(**params)
 
@@ -466,7 +900,18 @@ class Related(Search):
     params = join_params(self.parameters, {"reverse_url": url,
                                            "limit": self._limit,
                                            "url_domain": self.url_domain,
-                                           "proxies": self.proxies}
+                                           "proxies": self.proxies,
+                                           "session": self.session,
+                                           "prefetch": self._prefetch,
+                                           "parallel": self._parallel,
+                                           "keyset": self._keyset,
+                                           "after": self._after,
+                                           "checkpoint": self._checkpoint,
+                                           "skip": self._skip,
+                                           "count": self._count,
+                                           "categories": self._categories,
+                                           "interactions": self._interactions,
+                                           "vocabulary": self._vocabulary}
                         )
 
     return Search(**params)
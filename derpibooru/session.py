@@ -0,0 +1,275 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2014, Joshua Stone
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from threading import local
+from time import perf_counter, sleep
+
+from .transport import RequestsTransport
+from .cache import set_cache
+from .httpcache import set_http_cache
+from .singleflight import SingleFlight, request_key
+from .retry import Retry, RetryError, set_retry
+from .breaker import set_breaker
+from .metrics import RequestEvent, placeholders
+from .tracing import trace
+from .profiling import measure
+
+__all__ = [
+  "Session",
+  "default_session",
+  "get_session"
+]
+
+class Session(object):
+  """
+  Session() owns keep-alive connection pools which are reused by every request
+  made with it, so consecutive pages and lookups skip TCP and TLS handshakes.
+
+  Pool size can be set for every booru separately, e.g.
+  Session(pool_sizes={"https://derpibooru.org": 20}).
+  Session() can be shared between threads and passed to Search(), Image(),
+  Tags() and other classes with session parameter.
+
+  Single objects requested by id are kept by cache, which is Cache() with
+  default settings for True; cache=None turns it off.
+  http_cache is HTTPCache() or path of its database, which keeps responses
+  on disk between runs and processes.
+  With coalesce, threads making the same GET request (URL and parameters,
+  API key included) at the same time share one response.
+  Every request sent to network waits for rate_limiter (RateLimiter()).
+  Failed requests are sent again by retry, which is Retry() with default
+  settings for True; retry=None turns it off.
+  Number of requests in flight to every booru is limited by concurrency
+  (AdaptiveConcurrency()) if it's given.
+  Requests to booru which keeps failing are stopped by breaker, which is
+  CircuitBreaker() with default settings for True; breaker=None turns it off.
+  Request counts for breaker once, by result of its last attempt.
+  timeout is (connect, read) seconds for every request.
+  proxies of every request can be ProxyPool(), which gives a proxy to it.
+  Requests are sent by transport, RequestsTransport() with the pool sizes
+  by default; HTTP2Transport() or another Transport() can be given instead.
+  Hooks added by add_hook("start" or "end", callback) are called with
+  RequestEvent() of every request; metrics (Metrics()) is added as end hook.
+  With tracer (Tracer()) every request is traced as child of current span.
+  """
+  def __init__(self, pool_connections=10, pool_maxsize=10, pool_sizes={}, cache=True,
+               http_cache=None, coalesce=True, rate_limiter=None, retry=True, concurrency=None,
+               breaker=True, timeout=(5, 30), transport=None, metrics=None,
+               tracer=None):
+    if transport is None:
+      transport = RequestsTransport(pool_connections, pool_maxsize, pool_sizes)
+    self.transport = transport
+    self.cache = set_cache(cache)
+    self.http_cache = set_http_cache(http_cache)
+    self.flights = SingleFlight() if coalesce else None
+    self.rate_limiter = rate_limiter
+    self.retry = Retry(exceptions=transport.errors) if retry is True else set_retry(retry)
+    self.concurrency = concurrency
+    self.breaker = set_breaker(breaker)
+    self.timeout = timeout
+    self.hooks = {"start": [], "end": []}
+    self.metrics = metrics
+    if metrics is not None:
+      self.add_hook("end", metrics)
+    self.tracer = tracer
+    self._local = local()
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, *exc_info):
+    self.close()
+
+  @property
+  def pool_sizes(self):
+    """
+    Returns pool sizes set for separate url_domain.
+    """
+    return self.transport.pool_sizes
+
+  def pool_size(self, url_domain, maxsize):
+    """
+    Set size of keep-alive connection pool for requests to url_domain.
+    """
+    self.transport.pool_size(url_domain, maxsize)
+
+  def add_hook(self, when, callback):
+    """
+    Calls callback(RequestEvent()) on "start" or "end" of every request.
+    """
+    self.hooks[when].append(callback)
+
+  def remove_hook(self, when, callback):
+    self.hooks[when].remove(callback)
+
+  def _emit(self, when, event):
+    for callback in self.hooks[when]:
+      callback(event)
+
+  def cache_hit(self, url_domain, endpoint):
+    """
+    Reports object served by cache of session as a request.
+    """
+    if not self.hooks["end"]:
+      return
+    if endpoint == "topics":
+      template = "forums/{forum}/topics/{topic}"
+    else:
+      template = f"{endpoint}/{placeholders.get(endpoint, '{id}')}"
+    event = RequestEvent("GET", f"{url_domain}/api/v1/json/{template}", template)
+    self._emit("start", event)
+    event.status, event.cache, event.latency = 200, "hit", 0.0
+    self._emit("end", event)
+
+  def _send_once(self, method, url, **kwargs):
+    event = getattr(self._local, "event", None)
+    if event is not None:
+      event.attempts += 1
+    if self.rate_limiter is not None:
+      self.rate_limiter.acquire(url)
+    token = self.concurrency.acquire(url) if self.concurrency is not None else None
+    pool = kwargs.get("proxies")
+    if hasattr(pool, "acquire"):
+      proxy = pool.acquire(url)
+      kwargs["proxies"] = proxy[0].proxies
+    else:
+      pool = None
+    kwargs.setdefault("timeout", self.timeout)
+    status_code, failed = None, False
+    try:
+      response = measure("http", True, self.transport.send, method, url, **kwargs)
+      status_code = response.status_code
+      return response
+    except self.transport.errors:
+      failed = True
+      raise
+    finally:
+      # Exceptions of caller (e.g. KeyboardInterrupt) say nothing about booru or proxy
+      if pool is not None and (failed or status_code is not None):
+        pool.release(proxy, status_code)
+      elif pool is not None:
+        pool.cancel(proxy)
+      if token is not None and (failed or status_code is not None):
+        self.concurrency.release(token, status_code)
+      elif token is not None:
+        self.concurrency.cancel(token)
+
+  def _attempts(self, method, url, **kwargs):
+    if self.retry is None:
+      return self._send_once(method, url, **kwargs)
+    attempt = 0
+    while True:
+      attempt += 1
+      try:
+        response = self._send_once(method, url, **kwargs)
+      except Exception as error:
+        wait = self.retry.delay(method, url, attempt, error=error)
+      else:
+        wait = self.retry.delay(method, url, attempt, response=response)
+        if wait is None:
+          return response
+      sleep(wait)
+
+  def _send(self, method, url, **kwargs):
+    if self.breaker is None:
+      return self._attempts(method, url, **kwargs)
+    self.breaker.before(url)
+    status_code, failed = None, False
+    try:
+      response = self._attempts(method, url, **kwargs)
+      status_code = response.status_code
+      return response
+    except RetryError as error:
+      status_code = error.status_code
+      raise
+    except self.transport.errors:
+      failed = True
+      raise
+    finally:
+      # Request counts once for breaker after all attempts; only failed
+      # connections and error statuses are failures
+      if failed or status_code is not None:
+        self.breaker.record(url, status_code)
+      else:
+        self.breaker.cancel(url)
+
+  def _get(self, url, **kwargs):
+    if self.http_cache is not None:
+      return self.http_cache.get(self._send, url, **kwargs)
+    return self._send("GET", url, **kwargs)
+
+  def _request(self, method, url, send, **kwargs):
+    if self.tracer is None and not self.hooks["start"] and not self.hooks["end"]:
+      return send(url, **kwargs)
+    event = RequestEvent(method, url)
+    self._emit("start", event)
+    with trace(self.tracer, f"{method} {event.endpoint}", url=url) as span:
+      self._local.event, started = event, perf_counter()
+      try:
+        response = send(url, **kwargs)
+        event.status, event.bytes = response.status_code, len(response.content)
+        if getattr(response, "from_cache", False):
+          event.cache = "revalidated" if event.attempts else "hit"
+        elif self.http_cache is not None and method == "GET":
+          event.cache = "miss"
+        event.coalesced = not event.attempts and not event.cache == "hit"
+        return response
+      except Exception as error:
+        event.error = error
+        raise
+      finally:
+        self._local.event, event.latency = None, perf_counter() - started
+        span.set(status=event.status, bytes=event.bytes, retries=event.retries,
+                 cache=event.cache, coalesced=event.coalesced)
+        self._emit("end", event)
+
+  def _coalesced_get(self, url, **kwargs):
+    if self.flights is not None:
+      return self.flights.do(request_key(url, kwargs.get("params")), self._get, url, **kwargs)
+    return self._get(url, **kwargs)
+
+  def _post(self, url, **kwargs):
+    return self._send("POST", url, **kwargs)
+
+  def get(self, url, **kwargs):
+    return self._request("GET", url, self._coalesced_get, **kwargs)
+
+  def post(self, url, **kwargs):
+    return self._request("POST", url, self._post, **kwargs)
+
+  def close(self):
+    """
+    Closes all pooled connections.
+    """
+    self.transport.close()
+
+default_session = Session()
+
+def get_session(session=None):
+  """
+  Returns given session or shared default one.
+  """
+  return session if session is not None else default_session
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2014, Joshua Stone
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from threading import Event, Lock
+
+__all__ = [
+  "SingleFlight",
+  "request_key"
+]
+
+def request_key(url, params=None):
+  """
+  Returns key of GET request; parameters order doesn't matter.
+  """
+  return url, tuple(sorted((str(name), str(value)) for name, value in (params or {}).items()))
+
+class Flight(object):
+  def __init__(self):
+    self.done = Event()
+    self.result = None
+    self.error = None
+
+class SingleFlight(object):
+  """
+  SingleFlight() runs only one call for the same key at a time; threads which
+  ask for the key while the call is in progress wait for it and receive its
+  result (or its exception) instead of making their own call.
+  """
+  def __init__(self):
+    self.shared = 0
+    self._flights = {}
+    self._lock = Lock()
+
+  def __len__(self):
+    return len(self._flights)
+
+  def do(self, key, func, *args, **kwargs):
+    with self._lock:
+      flight = self._flights.get(key)
+      leader = flight is None
+      if leader:
+        flight = self._flights[key] = Flight()
+      else:
+        self.shared += 1
+
+    if not leader:
+      flight.done.wait()
+      if flight.error is not None:
+        raise flight.error
+      return flight.result
+
+    try:
+      flight.result = func(*args, **kwargs)
+      return flight.result
+    except BaseException as error:
+      flight.error = error
+      raise
+    finally:
+      with self._lock:
+        del self._flights[key]
+      flight.done.set()
@@ -24,41 +24,58 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-from .request import get_tag_data, get_tags
+from .request import get_tag_data, get_tags, get_tags_by_names, invalidate_data
 from .helpers import slugging_tag
+from .record import Record
 
 __all__ = [
   "Tag"
 ]
 
-class Tag(object):
+class Tag(Record):
+  __slots__ = ("proxies", "session", "url_domain")
+
   def __init__(self, data, tag=None, slug=False, tag_id=None,
-               url_domain="https://derpibooru.org", proxies={}):
+               url_domain="https://derpibooru.org", proxies={}, session=None):
     """
     tag field is slug.
     """
     self.proxies = proxies
+    self.session = session
     self.url_domain = url_domain
     if data is None and (tag or tag_id):
       if tag:
         if slug:
-          self._data = data = get_tag_data(tag, url_domain=url_domain, proxies=proxies)
+          self._data = data = get_tag_data(tag, url_domain=url_domain, proxies=proxies, session=session)
         else:
           self._data = data = get_tag_data(slugging_tag(tag),
-                                           url_domain=url_domain, proxies=proxies)
+                                           url_domain=url_domain, proxies=proxies, session=session)
       elif tag_id:
           self._data = data = next(get_tags({"q": (f"id:{tag_id}",), "per_page":1},
-                                            limit=1, url_domain=url_domain, proxies=proxies)
+                                            limit=1, url_domain=url_domain, proxies=proxies, session=session)
                                   )
     else:
       self._data = data
-    for field, body in self.data.items():
-      if not hasattr(self, field):
-        setattr(self, field, body)
 
   def __str__(self):
     return f'''Tag({self.name})'''
 
+  @classmethod
+  def many(cls, names, field="slug", missing=None, workers=4,
+           url_domain="https://derpibooru.org", proxies={}, session=None):
+    """
+    Yields Tag() for every slug in the same order, requesting 50 tags with
+    one search query. field can be "slug", "name" or "id".
+    Not found names are appended to missing list if given.
+    """
+    for name, data in get_tags_by_names(names, field=field, url_domain=url_domain, proxies=proxies,
+                                        session=session, workers=workers):
+      if data is None:
+        if missing is not None:
+          missing.append(name)
+        continue
+      yield cls(data, url_domain=url_domain, proxies=proxies, session=session)
+
   @property
   def data(self):
     return self._data
@@ -71,7 +88,9 @@ class Tag(object):
     return f"{self.url_domain}/tags/{self.slug}"
 
   def update(self):
-    data = get_tag_data(self.id, url_domain=self.url_domain, proxies=self.proxies)
+    invalidate_data("tags", self.slug, url_domain=self.url_domain, session=self.session)
+    invalidate_data("tags", self.id, url_domain=self.url_domain, session=self.session)
+    data = get_tag_data(self.id, url_domain=self.url_domain, proxies=self.proxies, session=self.session)
 
     if data:
       self._data = data
@@ -82,19 +101,20 @@ class Tag(object):
     """
     if self.aliased_tag:
       return Tag(None, tag=self.aliased_tag, slug=True,
-                 url_domain=self.url_domain, proxies=self.proxies)
+                 url_domain=self.url_domain, proxies=self.proxies, session=self.session)
 
   def allias_children(self):
     """
     Return in generator all alliases tags.
     """
-    for tag in self.aliases:
-      yield Tag(None, tag=tag, slug=True, url_domain=self.url_domain, proxies=self.proxies)
+    for tag in Tag.many(self.aliases, url_domain=self.url_domain, proxies=self.proxies, session=self.session):
+      yield tag
 
   def implied(self):
-    for tag in self.implied_tags:
-      yield Tag(None, tag=tag, slug=True, url_domain=self.url_domain, proxies=self.proxies)
+    for tag in Tag.many(self.implied_tags, url_domain=self.url_domain, proxies=self.proxies, session=self.session):
+      yield tag
 
   def implied_by(self):
-    for tag in self.implied_by_tags:
-      yield Tag(None, tag=tag, slug=True, url_domain=self.url_domain, proxies=self.proxies)
\ No newline at end of file
+    for tag in Tag.many(self.implied_by_tags, url_domain=self.url_domain, proxies=self.proxies,
+                        session=self.session):
+      yield tag
\ No newline at end of file
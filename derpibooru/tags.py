@@ -26,7 +26,7 @@
 
 from .request import get_tags, url_tags
 from .tag import Tag
-from .helpers import tags, join_params, set_limit
+from .helpers import tags, join_params, set_limit, set_depth
 
 __all__ = [
   "Tags"
@@ -42,12 +42,14 @@ class Tags(object):
   easy.
   """
   def __init__(self, q=set(), limit=50, per_page=25, page=1,
-               url_domain="https://derpibooru.org", proxies={}):
+               url_domain="https://derpibooru.org", proxies={}, session=None,
+               prefetch=0, parallel=0):
     """
     By default initializes an instance of Tags with the parameters to get
     the first 25 comments on Derpibooru's tags page.
     """
     self.proxies = proxies
+    self.session = session
     self.url_domain = url_domain
     self._params = {
       "q": tags(q),
@@ -55,8 +57,11 @@ class Tags(object):
       "page": set_limit(page)
     }
     self._limit = set_limit(limit)
+    self._prefetch = set_depth(prefetch)
+    self._parallel = set_depth(parallel)
     self._search = get_tags(self._params, self._limit,
-                            url_domain=self.url_domain, proxies=self.proxies)
+                            url_domain=self.url_domain, proxies=self.proxies, session=self.session,
+                            prefetch=self._prefetch, parallel=self._parallel)
   
   def __iter__(self):
     """
@@ -90,7 +95,10 @@ class Tags(object):
     params = join_params(self.parameters, {"q": q,
                                            "limit": self._limit,
                                            "url_domain": self.url_domain,
-                                           "proxies": self.proxies}
+                                           "proxies": self.proxies,
+                                           "session": self.session,
+                                           "prefetch": self._prefetch,
+                                           "parallel": self._parallel}
                         )
 
     return self.__class__(**params)
@@ -102,7 +110,39 @@ class Tags(object):
     """
     params = join_params(self.parameters, {"limit": limit,
                                            "url_domain": self.url_domain,
-                                           "proxies": self.proxies})
+                                           "proxies": self.proxies,
+                                           "session": self.session,
+                                           "prefetch": self._prefetch,
+                                           "parallel": self._parallel})
+
+    return self.__class__(**params)
+
+  def prefetch(self, depth):
+    """
+    Set number of next pages of tags requested in background while current
+    page is iterated, or set to 0 to request pages on demand; default 0.
+    """
+    params = join_params(self.parameters, {"limit": self._limit,
+                                           "url_domain": self.url_domain,
+                                           "proxies": self.proxies,
+                                           "session": self.session,
+                                           "prefetch": depth,
+                                           "parallel": self._parallel})
+
+    return self.__class__(**params)
+
+  def parallel(self, workers):
+    """
+    Set number of threads requesting pages of tags concurrently, planned
+    by total count from first page, or set to 0 to request pages one by one;
+    default 0. Session pool size should be not less than workers.
+    """
+    params = join_params(self.parameters, {"limit": self._limit,
+                                           "url_domain": self.url_domain,
+                                           "proxies": self.proxies,
+                                           "session": self.session,
+                                           "prefetch": self._prefetch,
+                                           "parallel": workers})
 
     return self.__class__(**params)
 
@@ -114,7 +154,10 @@ class Tags(object):
      params = join_params(self.parameters, {"q": query,
                                            "limit": self._limit,
                                            "url_domain": self.url_domain,
-                                           "proxies": self.proxies}
+                                           "proxies": self.proxies,
+                                           "session": self.session,
+                                           "prefetch": self._prefetch,
+                                           "parallel": self._parallel}
                         )
 
      return self.__class__(**params)
@@ -127,7 +170,10 @@ class Tags(object):
      params = join_params(self.parameters, {"q": query,
                                            "limit": self._limit,
                                            "url_domain": self.url_domain,
-                                           "proxies": self.proxies}
+                                           "proxies": self.proxies,
+                                           "session": self.session,
+                                           "prefetch": self._prefetch,
+                                           "parallel": self._parallel}
                         )
 
      return self.__class__(**params)
@@ -139,7 +185,10 @@ class Tags(object):
     params = join_params(self.parameters, {"page": set_limit(page),
                                            "limit": self._limit,
                                            "url_domain": self.url_domain,
-                                           "proxies": self.proxies}
+                                           "proxies": self.proxies,
+                                           "session": self.session,
+                                           "prefetch": self._prefetch,
+                                           "parallel": self._parallel}
                         )
 
     return self.__class__(**params)
@@ -152,7 +201,10 @@ class Tags(object):
     params = join_params(self.parameters, {"per_page": set_limit(limit),
                                            "limit": self._limit,
                                            "url_domain": self.url_domain,
-                                           "proxies": self.proxies}
+                                           "proxies": self.proxies,
+                                           "session": self.session,
+                                           "prefetch": self._prefetch,
+                                           "parallel": self._parallel}
                         )
 
     return self.__class__(**params)
@@ -161,4 +213,4 @@ class Tags(object):
     """
     Returns a result wrapped in a new instance of Tag().
     """
-    return Tag(next(self._search), url_domain=self.url_domain, proxies=self.proxies)
+    return Tag(next(self._search), url_domain=self.url_domain, proxies=self.proxies, session=self.session)
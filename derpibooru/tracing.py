@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2014, Joshua Stone
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from json import dumps
+from secrets import token_hex
+from threading import Lock, local
+from time import perf_counter, time
+
+__all__ = [
+  "Span",
+  "Tracer",
+  "SpanExporter",
+  "JSONLinesExporter",
+  "MemoryExporter",
+  "trace"
+]
+
+class Span(object):
+  """
+  Span() is one timed operation: iteration of Search() or another listing,
+  request of one page or HTTP request. Spans of the same iteration share
+  trace_id and point to their parent by parent_id.
+  """
+  def __init__(self, name, parent=None, attributes={}):
+    self.name = name
+    self.trace_id = parent.trace_id if parent is not None else token_hex(16)
+    self.span_id = token_hex(8)
+    self.parent_id = parent.span_id if parent is not None else None
+    self.attributes = dict(attributes)
+    self.start = time()
+    self.duration = None
+    self.error = None
+    self._started = perf_counter()
+
+  def set(self, **attributes):
+    self.attributes.update(attributes)
+
+  def finish(self, error=None):
+    self.duration = perf_counter() - self._started
+    if error is not None:
+      self.error = f"{type(error).__name__}: {error}"
+
+  def to_dict(self):
+    return {
+      "trace_id": self.trace_id,
+      "span_id": self.span_id,
+      "parent_id": self.parent_id,
+      "name": self.name,
+      "start": self.start,
+      "duration": self.duration,
+      "attributes": self.attributes,
+      "error": self.error
+    }
+
+  def __repr__(self):
+    return f"Span({self.name}, duration={self.duration}, attributes={self.attributes})"
+
+class SpanExporter(object):
+  """
+  Base of exporters receiving every finished Span().
+  """
+  def export(self, span):
+    raise NotImplementedError
+
+  def close(self):
+    pass
+
+class JSONLinesExporter(SpanExporter):
+  """
+  Appends every finished span to file as one line of JSON.
+  """
+  def __init__(self, path):
+    self.path = path
+    self._file = open(path, "a", encoding="utf-8")
+    self._lock = Lock()
+
+  def export(self, span):
+    line = dumps(span.to_dict(), default=str)
+    with self._lock:
+      self._file.write(line + "\n")
+      self._file.flush()
+
+  def close(self):
+    with self._lock:
+      self._file.close()
+
+class MemoryExporter(SpanExporter):
+  """
+  Keeps finished spans in spans list.
+  """
+  def __init__(self):
+    self.spans = []
+    self._lock = Lock()
+
+  def export(self, span):
+    with self._lock:
+      self.spans.append(span)
+
+class Tracer(object):
+  """
+  Tracer() is given to Session(tracer=Tracer(exporter)). Every thread has its
+  current span, which is parent of spans started in this thread without
+  explicit parent.
+  """
+  def __init__(self, exporter):
+    self.exporter = exporter
+    self._local = local()
+
+  @property
+  def current(self):
+    return getattr(self._local, "span", None)
+
+  def activate(self, span):
+    """
+    Makes span current in this thread and returns previous current span.
+    """
+    previous, self._local.span = self.current, span
+    return previous
+
+  def deactivate(self, span, previous):
+    """
+    Restores previous current span if span is still current.
+    """
+    if self.current is span:
+      self._local.span = previous
+
+  def start(self, name, parent=None, **attributes):
+    return Span(name, parent if parent is not None else self.current, attributes)
+
+  def end(self, span, error=None):
+    span.finish(error)
+    self.exporter.export(span)
+
+  def span(self, name, parent=None, **attributes):
+    """
+    Returns context manager of new span which is current while it's active.
+    """
+    return ActiveSpan(self, self.start(name, parent, **attributes))
+
+  def close(self):
+    self.exporter.close()
+
+class ActiveSpan(object):
+  def __init__(self, tracer, span):
+    self.tracer = tracer
+    self.span = span
+
+  def __enter__(self):
+    self.previous = self.tracer.activate(self.span)
+    return self.span
+
+  def __exit__(self, exc_type, exc_value, traceback):
+    self.tracer.deactivate(self.span, self.previous)
+    self.tracer.end(self.span, exc_value)
+
+class NoSpan(object):
+  """
+  Stands for span when tracing is off.
+  """
+  def __enter__(self):
+    return self
+
+  def __exit__(self, *exc_info):
+    pass
+
+  def set(self, **attributes):
+    pass
+
+no_span = NoSpan()
+
+def trace(tracer, name, parent=None, **attributes):
+  """
+  Returns tracer.span() or context manager doing nothing without tracer.
+  """
+  if tracer is None:
+    return no_span
+  return tracer.span(name, parent, **attributes)
@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2014, Joshua Stone
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from json import loads
+from threading import Lock
+
+from requests import Session as HTTPSession
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ConnectionError, Timeout, ChunkedEncodingError
+from requests.structures import CaseInsensitiveDict
+
+from .profiling import profiled
+
+__all__ = [
+  "Response",
+  "Transport",
+  "RequestsTransport",
+  "HTTP2Transport"
+]
+
+class Response(object):
+  """
+  Response returned by transport: status_code, headers and content bytes,
+  with requests-like text and json().
+  """
+  from_cache = False
+
+  def __init__(self, status_code, headers, content, url=""):
+    self.status_code = status_code
+    self.headers = CaseInsensitiveDict(headers)
+    self.content = content
+    self.url = url
+
+  @property
+  def text(self):
+    return self.content.decode("utf-8", errors="replace")
+
+  @profiled("json")
+  def json(self):
+    return loads(self.content)
+
+class Transport(object):
+  """
+  Transport() sends one request and returns Response(). Every request of
+  Session() goes through its transport, so another HTTP client (or a local
+  stand-in for tests) is plugged in with Session(transport=...).
+  errors are exceptions of failed connection which are retried.
+  """
+  errors = ()
+
+  @property
+  def pool_sizes(self):
+    return {}
+
+  def pool_size(self, url_domain, maxsize):
+    """
+    Transports without pool for every booru ignore it.
+    """
+    pass
+
+  def send(self, method, url, params=None, headers=None, json=None, proxies=None, timeout=None):
+    raise NotImplementedError
+
+  def close(self):
+    pass
+
+class RequestsTransport(Transport):
+  """
+  Default transport built on requests with keep-alive connection pools;
+  pool size can be set for every booru separately.
+  """
+  errors = (ConnectionError, Timeout, ChunkedEncodingError)
+
+  def __init__(self, pool_connections=10, pool_maxsize=10, pool_sizes={}):
+    self.pool_connections = pool_connections
+    self.pool_maxsize = pool_maxsize
+    self._session = HTTPSession()
+    self._session.mount("https://", self._adapter(pool_maxsize))
+    self._session.mount("http://", self._adapter(pool_maxsize))
+    self._pool_sizes = {}
+    for url_domain, maxsize in pool_sizes.items():
+      self.pool_size(url_domain, maxsize)
+
+  def _adapter(self, maxsize):
+    return HTTPAdapter(pool_connections=self.pool_connections, pool_maxsize=maxsize)
+
+  @property
+  def pool_sizes(self):
+    return dict(self._pool_sizes)
+
+  def pool_size(self, url_domain, maxsize):
+    url_domain = url_domain.rstrip("/")
+    self._pool_sizes[url_domain] = maxsize
+    self._session.mount(f"{url_domain}/", self._adapter(maxsize))
+
+  def send(self, method, url, params=None, headers=None, json=None, proxies=None, timeout=None):
+    response = self._session.request(method, url, params=params, headers=headers, json=json,
+                                     proxies=proxies, timeout=timeout)
+    return Response(response.status_code, response.headers, response.content, response.url)
+
+  def close(self):
+    self._session.close()
+
+class HTTP2Transport(Transport):
+  """
+  Transport built on httpx with HTTP/2, so concurrent requests to a booru
+  are multiplexed over one connection. Needs httpx[http2] installed.
+  One client is kept for every proxy, since httpx sets proxy per client.
+  """
+  def __init__(self, max_connections=10):
+    try:
+      import httpx
+    except ImportError:
+      raise ImportError("HTTP2Transport needs httpx[http2]: pip install httpx[http2]")
+    self._httpx = httpx
+    self.errors = (httpx.TransportError,)
+    self.max_connections = max_connections
+    self._clients = {}
+    self._lock = Lock()
+
+  def _client(self, proxy):
+    with self._lock:
+      client = self._clients.get(proxy)
+      if client is None:
+        limits = self._httpx.Limits(max_connections=self.max_connections)
+        client = self._clients[proxy] = self._httpx.Client(http2=True, limits=limits, proxy=proxy)
+      return client
+
+  def send(self, method, url, params=None, headers=None, json=None, proxies=None, timeout=None):
+    proxy = proxies.get(url.split(":", 1)[0]) if proxies else None
+    if isinstance(timeout, tuple):
+      timeout = self._httpx.Timeout(timeout[1], connect=timeout[0])
+    response = self._client(proxy).request(method, url, params=params, headers=headers, json=json,
+                                           timeout=timeout)
+    return Response(response.status_code, response.headers, response.content, str(response.url))
+
+  def close(self):
+    with self._lock:
+      for client in self._clients.values():
+        client.close()
+      self._clients.clear()
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2014, Joshua Stone
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from array import array
+from threading import Lock
+
+__all__ = [
+  "TagVocabulary",
+  "set_vocabulary"
+]
+
+class TagVocabulary(object):
+  """
+  TagVocabulary() keeps every tag name once and numbers it. Images of
+  searches with it hold tags and tag_ids as array('I') instead of lists,
+  and tags are decoded to names when Image.tags is read. One instance can
+  be shared by many searches and threads.
+  """
+  def __init__(self):
+    self._codes = {}
+    self._names = []
+    self._lock = Lock()
+
+  def __len__(self):
+    return len(self._names)
+
+  def encode(self, names):
+    """
+    Returns array('I') of numbers of tag names, adding unknown names.
+    """
+    codes = self._codes
+    try:
+      return array("I", [codes[name] for name in names])
+    except KeyError:
+      pass
+    with self._lock:
+      for name in names:
+        if name not in codes:
+          # Name is added before its number, so decode() never misses it
+          self._names.append(name)
+          codes[name] = len(self._names) - 1
+    return array("I", [codes[name] for name in names])
+
+  def decode(self, codes):
+    """
+    Returns list of tag names for array of numbers.
+    """
+    names = self._names
+    return [names[code] for code in codes]
+
+  def encode_image(self, data):
+    """
+    Replaces tags and tag_ids lists of image data with arrays.
+    """
+    if isinstance(data.get("tags"), list):
+      data["tags"] = self.encode(data["tags"])
+    if isinstance(data.get("tag_ids"), list):
+      data["tag_ids"] = array("I", data["tag_ids"])
+    return data
+
+def set_vocabulary(vocabulary):
+  """
+  Returns given TagVocabulary(), a new one for True, or None.
+  """
+  if vocabulary is True:
+    return TagVocabulary()
+  elif vocabulary is False:
+    return None
+  else:
+    return vocabulary
@@ -13,8 +13,9 @@ setup(
   license = "Simplified BSD License",
   platforms = ["any"],
   packages = find_packages(),
-  python_requires='>=3.6',
+  python_requires='>=3.7',
   install_requires = ["requests"],
+  extras_require = {"aio": ["aiohttp"], "http2": ["httpx[http2]"]},
   include_package_data = True,
   #download_url = "https://github.com/joshua-stone/DerPyBooru/tarball/0.7.2",
   classifiers = [
@@ -0,0 +1,118 @@
+import asyncio
+
+from derpibooru import CircuitBreaker, ProxyPool, AdaptiveConcurrency
+from derpibooru.aio import AsyncSession, AsyncSearch
+
+class FakeResponse(object):
+  status = 200
+  headers = {}
+
+  def __init__(self, body):
+    self.body = body
+
+  async def read(self):
+    return self.body
+
+class FakeRequest(object):
+  def __init__(self, delay, body):
+    self.delay = delay
+    self.body = body
+
+  async def __aenter__(self):
+    await asyncio.sleep(self.delay)
+    return FakeResponse(self.body)
+
+  async def __aexit__(self, *exc_info):
+    pass
+
+class FakeClient(object):
+  """
+  Answers every request after delay without network.
+  """
+  closed = False
+
+  def __init__(self, delay, body):
+    self.delay = delay
+    self.body = body
+
+  def request(self, method, url, params=None, json=None, proxy=None):
+    return FakeRequest(self.delay, self.body)
+
+class FakeSession(AsyncSession):
+  def __init__(self, delay=0.0, body=b'{"images": [], "total": 0}', **kwargs):
+    super().__init__(**kwargs)
+    self.fake_client = FakeClient(delay, body)
+
+  def client(self):
+    return self.fake_client
+
+def cancel_requests(session, proxies={}):
+  async def main():
+    url = "https://derpibooru.org/api/v1/json/search/images"
+    tasks = [asyncio.ensure_future(session.get(url, proxies=proxies)) for _ in range(8)]
+    await asyncio.sleep(0.01)
+    for task in tasks:
+      task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+  asyncio.run(main())
+
+def test_cancelled_proxies():
+  """
+  Tests whether cancelled requests don't count as failures of proxies
+  """
+  pool = ProxyPool(["http://10.0.0.1:3128"], failures=3)
+  cancel_requests(FakeSession(delay=1), proxies=pool)
+
+  assert pool.stats[0]["inflight"] == 0
+  assert pool.stats[0]["errors"] == 0
+  assert not pool.stats[0]["evicted"]
+
+def test_cancelled_breaker():
+  """
+  Tests whether cancelled requests don't open circuit
+  """
+  breaker = CircuitBreaker(failures=2)
+  cancel_requests(FakeSession(delay=1, breaker=breaker))
+
+  assert breaker.states["https://derpibooru.org"] == "closed"
+
+def test_cancelled_probe():
+  """
+  Tests whether cancelled probe lets next probe through
+  """
+  breaker = CircuitBreaker(failures=1, reset=0)
+  breaker.record("https://derpibooru.org", None)
+  cancel_requests(FakeSession(delay=1, breaker=breaker))
+
+  assert breaker.states["https://derpibooru.org"] == "half-open"
+  breaker.before("https://derpibooru.org")
+
+def test_blocking_guard():
+  """
+  Tests whether images of AsyncSearch() don't make blocking requests inside event loop
+  """
+  body = b'{"images": [{"id": 1, "tags": []}], "total": 1}'
+
+  async def main():
+    images = [image async for image in AsyncSearch(session=FakeSession(body=body), limit=1)]
+    try:
+      images[0].update()
+    except RuntimeError:
+      pass
+    else:
+      assert False
+    return images
+  images = asyncio.run(main())
+
+  assert [image.id for image in images] == [1]
+
+def test_concurrency_rejected():
+  """
+  Tests whether AsyncSession() rejects blocking AdaptiveConcurrency()
+  """
+  try:
+    AsyncSession(concurrency=AdaptiveConcurrency())
+  except TypeError:
+    pass
+  else:
+    assert False
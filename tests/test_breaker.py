@@ -0,0 +1,117 @@
+from derpibooru import Session, Transport, Response, CircuitBreaker, CircuitOpenError, \
+                       AdaptiveConcurrency, ProxyPool, Retry, RetryError
+
+url = "https://derpibooru.org/api/v1/json/images/1"
+
+class StatusTransport(Transport):
+  """
+  Answers every request with status without network.
+  """
+  errors = (ConnectionError,)
+
+  def __init__(self, status_code=200, error=None):
+    self.status_code = status_code
+    self.error = error
+
+  def send(self, method, url, params=None, headers=None, json=None, proxies=None, timeout=None):
+    if self.error is not None:
+      raise self.error
+    return Response(self.status_code, {}, b"{}", url)
+
+def test_open():
+  """
+  Tests whether circuit is opened after 5xx responses and rejects requests
+  """
+  breaker = CircuitBreaker(failures=2, reset=60)
+  session = Session(transport=StatusTransport(503), retry=None, breaker=breaker)
+  session.get(url)
+  session.get(url)
+
+  try:
+    session.get(url)
+  except CircuitOpenError:
+    pass
+  else:
+    assert False
+
+def test_other_errors():
+  """
+  Tests whether exceptions which aren't connection errors don't count as failures
+  """
+  breaker = CircuitBreaker(failures=1)
+  session = Session(transport=StatusTransport(error=ValueError()), retry=None, breaker=breaker)
+
+  try:
+    session.get(url)
+  except ValueError:
+    pass
+  assert breaker.states["https://derpibooru.org"] == "closed"
+
+def test_rejected_slot():
+  """
+  Tests whether request rejected by open circuit frees its concurrency slot
+  """
+  breaker = CircuitBreaker(failures=1, reset=60)
+  concurrency = AdaptiveConcurrency(initial=1)
+  session = Session(transport=StatusTransport(503), retry=None, breaker=breaker,
+                    concurrency=concurrency)
+  session.get(url)
+
+  try:
+    session.get(url)
+  except CircuitOpenError:
+    pass
+  assert concurrency._domains["https://derpibooru.org"].inflight == 0
+
+def test_other_errors_slot():
+  """
+  Tests whether exceptions which aren't connection errors don't cut concurrency limit
+  """
+  concurrency = AdaptiveConcurrency(initial=4)
+  session = Session(transport=StatusTransport(error=ValueError()), retry=None, breaker=None,
+                    concurrency=concurrency)
+
+  try:
+    session.get(url)
+  except ValueError:
+    pass
+  assert concurrency.limits == {"https://derpibooru.org": 4}
+  assert concurrency._domains["https://derpibooru.org"].inflight == 0
+
+def test_other_errors_proxy():
+  """
+  Tests whether exceptions which aren't connection errors don't count as failures of proxies
+  """
+  pool = ProxyPool(["http://10.0.0.1:3128"], failures=1)
+  session = Session(transport=StatusTransport(error=ValueError()), retry=None, breaker=None)
+
+  try:
+    session.get(url, proxies=pool)
+  except ValueError:
+    pass
+  assert pool.stats[0]["inflight"] == 0
+  assert pool.stats[0]["errors"] == 0
+  assert not pool.stats[0]["evicted"]
+
+def test_retried_request():
+  """
+  Tests whether every attempts of one request count as one failure
+  """
+  breaker = CircuitBreaker(failures=2, reset=60)
+  transport = StatusTransport(503)
+  session = Session(transport=transport, retry=Retry(attempts=5, backoff=0, jitter=0),
+                    breaker=breaker)
+
+  try:
+    session.get(url)
+  except RetryError:
+    pass
+  else:
+    assert False
+  assert breaker.states["https://derpibooru.org"] == "closed"
+
+  try:
+    session.get(url)
+  except RetryError:
+    pass
+  assert breaker.states["https://derpibooru.org"] == "open"
@@ -0,0 +1,81 @@
+from json import dumps
+
+from derpibooru import Image, Cache, Session, Transport, Response, cache
+from derpibooru.request import get_image_data, invalidate_data
+
+class Clock(object):
+  def __init__(self):
+    self.now = 0.0
+
+  def __call__(self):
+    return self.now
+
+class ImageTransport(Transport):
+  """
+  Answers requests of single images with score equal to number of request.
+  """
+  def __init__(self):
+    self.requests = 0
+
+  def send(self, method, url, params=None, headers=None, json=None, proxies=None, timeout=None):
+    self.requests += 1
+    image = {"id": int(url.rsplit("/", 1)[1]), "duplicate_of": None, "score": self.requests}
+    return Response(200, {}, dumps({"image": image}).encode("utf-8"), url)
+
+def test_ttl(monkeypatch):
+  """
+  Tests whether objects expire after ttl of their endpoint
+  """
+  clock = Clock()
+  monkeypatch.setattr(cache, "monotonic", clock)
+  objects = Cache(ttl={"tags": 100}, default=10)
+  objects.set(("https://derpibooru.org", "tags", "1"), "tag")
+  objects.set(("https://derpibooru.org", "users", "1"), "user")
+  objects.set(("https://derpibooru.org", "images", "1"), "image")
+
+  clock.now = 11
+  assert objects.get(("https://derpibooru.org", "users", "1")) is None
+  assert objects.get(("https://derpibooru.org", "tags", "1")) == "tag"
+  assert objects.get(("https://derpibooru.org", "images", "1")) == "image"
+  clock.now = 61
+  assert objects.get(("https://derpibooru.org", "images", "1")) is None
+  assert objects.stats == {"hits": 2, "misses": 2, "size": 1}
+
+def test_maxsize():
+  """
+  Tests whether the least recently used object is dropped
+  """
+  objects = Cache(maxsize=2)
+  for number in range(3):
+    objects.set(("https://derpibooru.org", "images", str(number)), number)
+
+  assert len(objects) == 2
+  assert objects.get(("https://derpibooru.org", "images", "0")) is None
+
+def test_invalidate():
+  """
+  Tests whether invalidate_data() and update() request image again
+  """
+  transport = ImageTransport()
+  session = Session(transport=transport)
+
+  assert get_image_data(1, session=session)["score"] == 1
+  assert get_image_data(1, session=session)["score"] == 1
+  invalidate_data("images", 1, session=session)
+  assert get_image_data(1, session=session)["score"] == 2
+
+  image = Image(None, image_id=1, session=session)
+  image.update()
+  assert image.score == 3
+  assert transport.requests == 3
+
+def test_no_cache():
+  """
+  Tests whether session without cache requests every time
+  """
+  transport = ImageTransport()
+  session = Session(transport=transport, cache=False)
+  get_image_data(1, session=session)
+  get_image_data(1, session=session)
+
+  assert transport.requests == 2
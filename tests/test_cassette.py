@@ -0,0 +1,43 @@
+from json import dumps
+
+from derpibooru import Search, Session, Transport, Response, RecordingTransport, ReplayTransport, \
+                       CassetteError
+
+class PagesTransport(Transport):
+  """
+  Serves 120 images by pages without network.
+  """
+  def send(self, method, url, params=None, headers=None, json=None, proxies=None, timeout=None):
+    per_page, page = int(params["per_page"]), int(params["page"])
+    ids = range(120 - (page - 1) * per_page, max(120 - page * per_page, 0), -1)
+    body = {"images": [{"id": id_number, "tags": []} for id_number in ids], "total": 120}
+    return Response(200, {}, dumps(body).encode("utf-8"), url)
+
+def test_replay(tmp_path):
+  """
+  Tests whether replayed search returns the same images as recorded one
+  """
+  cassette = str(tmp_path / "cassette.jsonl")
+  session = Session(transport=RecordingTransport(cassette, PagesTransport()))
+  recorded = [image.id for image in Search(key="secret", session=session, per_page=50, limit=120)]
+
+  session = Session(transport=ReplayTransport(cassette))
+  replayed = [image.id for image in Search(key="secret", session=session, per_page=50, limit=120)]
+
+  assert replayed == recorded == list(range(120, 0, -1))
+  assert "secret" not in open(cassette).read()
+
+def test_not_recorded(tmp_path):
+  """
+  Tests whether request absent in cassette raises CassetteError
+  """
+  cassette = tmp_path / "cassette.jsonl"
+  cassette.write_text("")
+  session = Session(transport=ReplayTransport(str(cassette)))
+
+  try:
+    list(Search(session=session))
+  except CassetteError:
+    pass
+  else:
+    assert False
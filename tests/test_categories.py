@@ -0,0 +1,98 @@
+from json import dumps, loads
+from threading import Lock
+
+from derpibooru import Search, Session, Transport, Response, TagCategories
+
+class FlakyTransport(Transport):
+  """
+  Fails the first tag search and answers the next ones with one tag.
+  """
+  def __init__(self):
+    self.requests = 0
+
+  def send(self, method, url, params=None, headers=None, json=None, proxies=None, timeout=None):
+    self.requests += 1
+    if self.requests == 1:
+      return Response(500, {}, b"", url)
+    tag = {"id": 1, "name": "rarity", "slug": "rarity", "category": "character",
+           "namespace": None, "name_in_namespace": "rarity"}
+    body = {"tags": [tag], "total": 1}
+    return Response(200, {}, dumps(body).encode("utf-8"), url)
+
+def test_failed_request():
+  """
+  Tests whether tags of failed request aren't cached as missing
+  """
+  transport = FlakyTransport()
+  categories = TagCategories(session=Session(transport=transport, cache=False, retry=None,
+                                             breaker=None))
+
+  assert categories.characters(["rarity", "missing"]) == []
+  assert categories.characters(["rarity", "missing"]) == ["rarity"]
+  assert categories.characters(["rarity", "missing"]) == ["rarity"]
+  assert transport.requests == 2
+
+class BooruTransport(Transport):
+  """
+  Serves 50 images with artist, rating and one of 3 OC tags, tags searched by
+  quoted names and my:upvotes of even images; counts requests by kind.
+  """
+  categories = {"artist": "origin", "oc": "oc"}
+
+  def __init__(self):
+    self.requests = {"images": 0, "tags": 0, "interactions": 0}
+    self._lock = Lock()
+
+  def count(self, kind):
+    with self._lock:
+      self.requests[kind] += 1
+
+  def send(self, method, url, params=None, headers=None, json=None, proxies=None, timeout=None):
+    if url.endswith("/search/tags"):
+      self.count("tags")
+      names = [loads(term)[len("name:"):] for term in params["q"].split(" || ")]
+      tags = [{"id": number, "name": name, "slug": name,
+               "category": self.categories.get(name.split(":")[0], "rating"),
+               "namespace": name.split(":")[0] if ":" in name else None,
+               "name_in_namespace": name.split(":")[-1]} for number, name in enumerate(names)]
+      body = {"tags": tags, "total": len(tags)}
+    elif "my:" in params["q"]:
+      self.count("interactions")
+      ids = [int(term[3:]) for term in params["q"].split(")")[0].strip("(").split(" || ")]
+      upvoted = params["q"].endswith("my:upvotes")
+      body = {"images": [{"id": id_number} for id_number in ids if upvoted and id_number % 2 == 0]}
+    else:
+      self.count("images")
+      per_page, page = int(params["per_page"]), int(params["page"])
+      ids = range(50 - (page - 1) * per_page, max(50 - page * per_page, 0), -1)
+      images = [{"id": id_number, "tags": ["artist:foo", "safe", f"oc:{id_number % 3}"]}
+                for id_number in ids]
+      body = {"images": images, "total": 50}
+    return Response(200, {}, dumps(body).encode("utf-8"), url)
+
+def test_categories_requests():
+  """
+  Tests whether tags of search are resolved once for all pages and images
+  """
+  transport = BooruTransport()
+  categories = TagCategories(session=Session(transport=transport))
+  search = Search(session=Session(transport=transport), limit=50).categories(categories)
+
+  images = list(search)
+  assert [list(image.artists) for image in images] == [["foo"]] * 50
+  assert list(images[0].characters) == ["2"]
+  assert transport.requests == {"images": 2, "tags": 1, "interactions": 0}
+
+  list(Search(session=Session(transport=transport), limit=25).categories(categories))
+  assert transport.requests["tags"] == 1
+
+def test_interactions_requests():
+  """
+  Tests whether interactions are requested once per page and list
+  """
+  transport = BooruTransport()
+  search = Search(key="secret", session=Session(transport=transport), limit=50).with_interactions()
+
+  upvoted = [id_number % 2 == 0 for id_number in range(50, 0, -1)]
+  assert [image.upvoted for image in search] == upvoted
+  assert transport.requests == {"images": 2, "tags": 0, "interactions": 10}
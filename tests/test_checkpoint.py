@@ -0,0 +1,60 @@
+from itertools import islice
+from json import dumps
+
+from derpibooru import Search, Comments, Session, Transport, Response
+
+class PagesTransport(Transport):
+  """
+  Serves 120 images or comments by pages without network.
+  """
+  def send(self, method, url, params=None, headers=None, json=None, proxies=None, timeout=None):
+    per_page, page = int(params["per_page"]), int(params["page"])
+    ids = range(120 - (page - 1) * per_page, max(120 - page * per_page, 0), -1)
+    field = "comments" if "/comments" in url else "images"
+    body = {field: [{"id": id_number, "tags": []} for id_number in ids], "total": 120}
+    return Response(200, {}, dumps(body).encode("utf-8"), url)
+
+def crawl(search, number):
+  """
+  Takes number of results from search like interrupted crawl.
+  """
+  return [result.id for result in islice(search, number)]
+
+def test_resume(tmp_path):
+  """
+  Tests whether resumed search continues after the last saved result
+  """
+  path, session = str(tmp_path / "search.json"), Session(transport=PagesTransport())
+  search = Search(session=session, limit=None).checkpoint(path, every=10)
+  assert crawl(search, 35) == list(range(120, 85, -1))
+
+  resumed = Search.resume(path, session=session)
+  assert crawl(resumed, 5) == list(range(90, 85, -1))
+  assert resumed.state["count"] == 35
+
+def test_resume_chained(tmp_path):
+  """
+  Tests whether builders called after resume() keep position
+  """
+  path, session = str(tmp_path / "search.json"), Session(transport=PagesTransport())
+  crawl(Search(session=session, limit=None).checkpoint(path, every=10), 35)
+
+  for resumed in (Search.resume(path, session=session).limit(None),
+                  Search.resume(path, session=session).prefetch(2)):
+    assert crawl(resumed, 5) == list(range(90, 85, -1))
+    assert resumed.state["count"] == 35
+
+def test_resume_comments(tmp_path):
+  """
+  Tests whether Comments() shares checkpoint state with Search()
+  """
+  path, session = str(tmp_path / "comments.json"), Session(transport=PagesTransport())
+  crawl(Comments(session=session, limit=None).checkpoint(path, every=10), 35)
+
+  try:
+    Search.resume(path, session=session)
+  except ValueError:
+    pass
+  else:
+    assert False
+  assert crawl(Comments.resume(path, session=session).limit(None), 5) == list(range(90, 85, -1))
@@ -0,0 +1,40 @@
+from derpibooru import concurrency
+from derpibooru.concurrency import AdaptiveConcurrency
+
+class Clock(object):
+  def __init__(self):
+    self.now = 0.0
+
+  def __call__(self):
+    return self.now
+
+def respond(limiter, clock, latency, status_code=200):
+  token = limiter.acquire("https://derpibooru.org/api/v1/json/search/images")
+  clock.now += latency
+  limiter.release(token, status_code)
+
+def test_latency_shift(monkeypatch):
+  """
+  Tests whether limit recovers after lasting rise of latency
+  """
+  clock = Clock()
+  monkeypatch.setattr(concurrency, "monotonic", clock)
+  limiter = AdaptiveConcurrency(initial=4, minimum=1, maximum=32)
+
+  for _ in range(50):
+    respond(limiter, clock, 0.1)
+  before = limiter.limits["https://derpibooru.org"]
+  for _ in range(200):
+    respond(limiter, clock, 0.6)
+
+  assert limiter.limits["https://derpibooru.org"] > before
+
+def test_errors():
+  """
+  Tests whether limit is decreased after 503 responses
+  """
+  limiter = AdaptiveConcurrency(initial=8, minimum=1, maximum=32)
+  token = limiter.acquire("https://derpibooru.org/api/v1/json/search/images")
+  limiter.release(token, 503)
+
+  assert limiter.limits["https://derpibooru.org"] == 4
@@ -0,0 +1,52 @@
+from json import dumps
+
+from derpibooru import Search, HTTPCache, Session, Transport, Response
+
+class ETagTransport(Transport):
+  """
+  Answers with one page of images and ETag, or 304 if request has the same
+  ETag; keeps headers of requests.
+  """
+  etag = '"v1"'
+
+  def __init__(self):
+    self.headers = []
+
+  def send(self, method, url, params=None, headers=None, json=None, proxies=None, timeout=None):
+    self.headers.append(dict(headers or {}))
+    if (headers or {}).get("If-None-Match") == self.etag:
+      return Response(304, {"ETag": self.etag}, b"", url)
+    body = {"images": [{"id": 1, "tags": []}], "total": 1}
+    return Response(200, {"ETag": self.etag}, dumps(body).encode("utf-8"), url)
+
+def test_revalidation(tmp_path):
+  """
+  Tests whether expired response is revalidated with ETag and read from cache
+  """
+  transport = ETagTransport()
+  http_cache = HTTPCache(str(tmp_path / "cache.db"), max_age={"search": 0})
+  session = Session(transport=transport, http_cache=http_cache)
+
+  assert [image.id for image in Search(session=session)] == [1]
+  assert [image.id for image in Search(session=session)] == [1]
+  assert "If-None-Match" not in transport.headers[0]
+  assert transport.headers[1]["If-None-Match"] == '"v1"'
+  assert http_cache.stats == {"hits": 0, "revalidated": 1, "misses": 1}
+
+def test_fresh(tmp_path):
+  """
+  Tests whether fresh response is used without request and API key is hashed
+  """
+  transport = ETagTransport()
+  path = str(tmp_path / "cache.db")
+  http_cache = HTTPCache(path, max_age={"search": 3600})
+  session = Session(transport=transport, http_cache=http_cache)
+  list(Search(key="secret", session=session))
+  list(Search(key="secret", session=session))
+
+  assert len(transport.headers) == 1
+  assert http_cache.stats["hits"] == 1
+  assert b"secret" not in open(path, "rb").read()
+
+  list(Search(key="another", session=session))
+  assert len(transport.headers) == 2
@@ -0,0 +1,15 @@
+from derpibooru import Search
+
+def test_float_sort():
+  """
+  Tests whether keyset mode rejects sorting by float fields
+  """
+  for sf in ("wilson_score", "aspect_ratio", "random"):
+    try:
+      Search().sort_by(sf).keyset()
+    except ValueError:
+      pass
+    else:
+      assert False, sf
+
+  assert Search().sort_by("score").keyset().parameters["sf"] == "score"
@@ -0,0 +1,71 @@
+from json import dumps
+
+from derpibooru import Image, Tag, Session, Transport, Response
+
+class TagsTransport(Transport):
+  """
+  Answers tag searches with tags whose quoted terms are in query, and keeps queries.
+  """
+  tags = ["rarity", "twilight sparkle", "artist:foo, bar"]
+
+  def __init__(self):
+    self.queries = []
+
+  def send(self, method, url, params=None, headers=None, json=None, proxies=None, timeout=None):
+    self.queries.append(params["q"])
+    terms = params["q"].split(" || ")
+    found = [{"id": number, "slug": slug} for number, slug in enumerate(self.tags)
+             if dumps(f"slug:{slug}") in terms]
+    body = {"tags": found, "total": len(found)}
+    return Response(200, {}, dumps(body).encode("utf-8"), url)
+
+class ImagesTransport(Transport):
+  """
+  Answers searches by ids with images 3, 5 and duplicate 7 of 3; image 8 is
+  found only by id (e.g. hidden by filter). Keeps queries.
+  """
+  images = {3: {"id": 3, "duplicate_of": None}, 5: {"id": 5, "duplicate_of": None},
+            7: {"id": 7, "duplicate_of": 3}, 8: {"id": 8, "duplicate_of": None}}
+
+  def __init__(self):
+    self.queries = []
+
+  def send(self, method, url, params=None, headers=None, json=None, proxies=None, timeout=None):
+    if url.endswith("/search/images"):
+      self.queries.append(params["q"])
+      terms = params["q"].split(" || ")
+      found = [image for id_number, image in self.images.items()
+               if f"id:{id_number}" in terms and id_number != 8]
+      body = {"images": found, "total": len(found)}
+    else:
+      self.queries.append(url.rsplit("/", 1)[1])
+      image = self.images.get(int(url.rsplit("/", 1)[1]))
+      if image is None:
+        return Response(404, {}, b"", url)
+      body = {"image": image}
+    return Response(200, {}, dumps(body).encode("utf-8"), url)
+
+def test_images():
+  """
+  Tests whether Image.many() keeps order, replaces duplicates and reports missing images
+  """
+  transport, missing = ImagesTransport(), []
+  images = Image.many([5, 3, 7, 8, 5, 9], missing=missing,
+                      session=Session(transport=transport, cache=False))
+
+  assert [image.id for image in images] == [5, 3, 3, 8, 5]
+  assert missing == [9]
+  assert transport.queries == ["id:5 || id:3 || id:7 || id:8 || id:9", "id:3", "8", "9"]
+
+def test_tags_query():
+  """
+  Tests whether Tag.many() quotes whole terms and reports missing tags
+  """
+  transport, missing = TagsTransport(), []
+  names = ["artist:foo, bar", "rarity", 'say "hi"', "twilight sparkle"]
+  tags = Tag.many(names, missing=missing, session=Session(transport=transport, cache=False))
+
+  assert [tag.slug for tag in tags] == ["artist:foo, bar", "rarity", "twilight sparkle"]
+  assert missing == ['say "hi"']
+  assert transport.queries == ['"slug:artist:foo, bar" || "slug:rarity" || '
+                               '"slug:say \\"hi\\"" || "slug:twilight sparkle"']
@@ -0,0 +1,84 @@
+from json import dumps, load
+
+from derpibooru import Search, Session, Transport, Response, Retry, Metrics
+from derpibooru.metrics import endpoint_template
+from derpibooru.request import get_image_data
+
+class BooruTransport(Transport):
+  """
+  Serves 120 images by pages and single images; the first request of image
+  1 answers 503.
+  """
+  def __init__(self):
+    self.failed = False
+
+  def send(self, method, url, params=None, headers=None, json=None, proxies=None, timeout=None):
+    if url.endswith("/search/images"):
+      per_page, page = int(params["per_page"]), int(params["page"])
+      ids = range(120 - (page - 1) * per_page, max(120 - page * per_page, 0), -1)
+      body = {"images": [{"id": id_number, "tags": []} for id_number in ids], "total": 120}
+    else:
+      id_number = int(url.rsplit("/", 1)[1])
+      if id_number == 1 and not self.failed:
+        self.failed = True
+        return Response(503, {}, b"", url)
+      body = {"image": {"id": id_number, "duplicate_of": None}}
+    return Response(200, {}, dumps(body).encode("utf-8"), url)
+
+def test_endpoint_template():
+  """
+  Tests whether ids in paths are replaced by placeholders
+  """
+  api = "https://derpibooru.org/api/v1/json"
+
+  assert endpoint_template(f"{api}/search/images") == "search/images"
+  assert endpoint_template(f"{api}/images/1") == "images/{id}"
+  assert endpoint_template(f"{api}/tags/artist-colon-foo") == "tags/{slug}"
+  assert endpoint_template(f"{api}/forums/dis/topics/ask-me/posts") == \
+         "forums/{forum}/topics/{topic}/posts"
+
+def test_metrics(monkeypatch, tmp_path):
+  """
+  Tests whether requests, retries and cache hits are counted by endpoint
+  """
+  monkeypatch.setattr("derpibooru.session.sleep", lambda seconds: None)
+  metrics, started = Metrics(), []
+  session = Session(transport=BooruTransport(), metrics=metrics, retry=Retry(jitter=0))
+  session.add_hook("start", started.append)
+  list(Search(session=session, limit=30))
+  get_image_data(1, session=session)
+  get_image_data(1, session=session)
+
+  snapshot = metrics.snapshot()
+  assert list(snapshot) == ["images/{id}", "search/images"]
+  assert snapshot["search/images"]["requests"] == 2
+  assert snapshot["search/images"]["statuses"] == {"200": 2}
+  assert snapshot["images/{id}"]["requests"] == 2
+  assert snapshot["images/{id}"]["retries"] == 1
+  assert snapshot["images/{id}"]["cache"] == {"hit": 1}
+  assert sum(snapshot["search/images"]["histogram"].values()) == 2
+  assert [event.endpoint for event in started] == ["search/images"] * 2 + ["images/{id}"] * 2
+
+  metrics.dump(str(tmp_path / "metrics.json"))
+  assert load(open(tmp_path / "metrics.json"))["search/images"]["requests"] == 2
+  assert metrics.report().splitlines()[0].startswith("endpoint")
+
+def test_error_event():
+  """
+  Tests whether failed request is passed to end hooks with its error
+  """
+  class FailingTransport(Transport):
+    def send(self, method, url, params=None, headers=None, json=None, proxies=None, timeout=None):
+      raise ValueError("broken")
+
+  ended = []
+  session = Session(transport=FailingTransport(), retry=None)
+  session.add_hook("end", ended.append)
+  try:
+    session.get("https://derpibooru.org/api/v1/json/search/images")
+  except ValueError:
+    pass
+
+  assert len(ended) == 1
+  assert isinstance(ended[0].error, ValueError)
+  assert ended[0].status is None
@@ -0,0 +1,57 @@
+from io import StringIO
+from json import dumps
+
+from derpibooru import Search, Session, Transport, Response, Profiler, profile
+from derpibooru import profiling
+
+class PagesTransport(Transport):
+  """
+  Serves 120 images by pages without network.
+  """
+  def send(self, method, url, params=None, headers=None, json=None, proxies=None, timeout=None):
+    per_page, page = int(params["per_page"]), int(params["page"])
+    ids = range(120 - (page - 1) * per_page, max(120 - page * per_page, 0), -1)
+    body = {"images": [{"id": id_number, "tags": []} for id_number in ids], "total": 120}
+    return Response(200, {}, dumps(body).encode("utf-8"), url)
+
+def test_profile():
+  """
+  Tests whether profiled functions and HTTP requests are recorded while profiling
+  """
+  output = StringIO()
+  with profile(output=output) as profiler:
+    list(Search(session=Session(transport=PagesTransport()), limit=30))
+
+  assert isinstance(profiler, Profiler)
+  # the last call raises StopIteration
+  assert profiler.stats["Search.__next__"]["calls"] == 31
+  assert profiler.stats["Image.__init__"]["calls"] == 30
+  assert profiler.stats["http"]["calls"] == 2
+  assert profiler.stats["http"]["io"] and not profiler.stats["json"]["io"]
+  assert profiler.stats["json"]["calls"] == 2
+  for entry in profiler.stats.values():
+    assert 0 <= entry["own_wall"] <= entry["wall"]
+  assert set(profiler.summary()) == {"library_cpu", "client_cpu", "io_wait", "elapsed"}
+  assert "Search.__next__" in output.getvalue()
+  assert profiling.active is None
+
+def test_own_time():
+  """
+  Tests whether time of nested profiled calls isn't counted as own time of caller
+  """
+  @profiling.profiled("inner")
+  def inner():
+    sum(range(10000))
+
+  @profiling.profiled("outer")
+  def outer():
+    for _ in range(10):
+      inner()
+
+  with profile(output=None) as profiler:
+    outer()
+
+  outer_stats, inner_stats = profiler.stats["outer"], profiler.stats["inner"]
+  assert inner_stats["calls"] == 10
+  assert outer_stats["wall"] >= inner_stats["wall"]
+  assert abs(outer_stats["own_wall"] - (outer_stats["wall"] - inner_stats["wall"])) < 1e-3
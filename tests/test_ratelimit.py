@@ -0,0 +1,61 @@
+from derpibooru import RateLimiter, Session, Transport, Response, ratelimit
+
+class Clock(object):
+  def __init__(self):
+    self.now = 1000.0
+
+  def __call__(self):
+    return self.now
+
+class OkTransport(Transport):
+  def send(self, method, url, params=None, headers=None, json=None, proxies=None, timeout=None):
+    return Response(200, {}, b"{}", url)
+
+def test_burst(monkeypatch):
+  """
+  Tests whether requests after burst wait for their tokens in order
+  """
+  clock = Clock()
+  monkeypatch.setattr(ratelimit, "time", clock)
+  limiter = RateLimiter(rate=2, burst=2)
+  url = "https://derpibooru.org/api/v1/json/search/images"
+
+  assert [limiter.reserve(url) for _ in range(4)] == [0, 0, 0.5, 1.0]
+  clock.now += 2
+  assert limiter.reserve(url) == 0
+
+def test_boorus(monkeypatch):
+  """
+  Tests whether every booru has its own rate and unlisted ones aren't limited
+  """
+  monkeypatch.setattr(ratelimit, "time", Clock())
+  limiter = RateLimiter(rates={"https://derpibooru.org": (1, 1)})
+
+  url = "https://derpibooru.org/api/v1/json/images/1"
+  assert [limiter.reserve(url) for _ in range(2)] == [0, 1.0]
+  assert limiter.reserve("https://ponybooru.org/api/v1/json/images/1") == 0
+
+def test_session_waits(monkeypatch):
+  """
+  Tests whether session sleeps before requests above rate
+  """
+  clock, waits = Clock(), []
+  monkeypatch.setattr(ratelimit, "time", clock)
+  monkeypatch.setattr(ratelimit, "sleep", waits.append)
+  session = Session(transport=OkTransport(), rate_limiter=RateLimiter(rate=4), coalesce=False)
+  for page in range(3):
+    session.get("https://derpibooru.org/api/v1/json/search/images", params={"page": page})
+
+  assert waits == [0.25, 0.5]
+  assert session.rate_limiter.waited == 0.75
+
+def test_shared_file(monkeypatch, tmp_path):
+  """
+  Tests whether limiters with the same path share tokens like processes
+  """
+  monkeypatch.setattr(ratelimit, "time", Clock())
+  first = RateLimiter(rate=1, burst=1, path=str(tmp_path))
+  second = RateLimiter(rate=1, burst=1, path=str(tmp_path))
+  url = "https://derpibooru.org/api/v1/json/search/images"
+
+  assert [first.reserve(url), second.reserve(url), first.reserve(url)] == [0, 1.0, 2.0]
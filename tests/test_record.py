@@ -0,0 +1,63 @@
+import pickle
+from array import array
+
+from derpibooru import Image, Tag, Comment, TagVocabulary
+
+image_data = {"id": 1, "score": 10, "tags": ["safe", "rarity"], "tag_ids": [40482, 27141],
+              "url": "https://example.org/1.png"}
+
+def test_fields():
+  """
+  Tests whether fields of data are attributes and properties take precedence
+  """
+  image = Image(dict(image_data))
+
+  assert (image.id, image.score) == (1, 10)
+  assert image.url == "https://derpibooru.org/images/1"
+  assert image.data["url"] == "https://example.org/1.png"
+  assert "score" in dir(image) and "update" in dir(image)
+  try:
+    image.missing
+  except AttributeError as error:
+    assert "missing" in str(error)
+  else:
+    assert False
+  assert not hasattr(Image(None), "score")
+
+def test_slots():
+  """
+  Tests whether records keep no instance dict
+  """
+  for record in (Image(dict(image_data)), Tag({"id": 1, "name": "safe"}), Comment({"id": 1})):
+    assert not hasattr(record, "__dict__")
+    try:
+      record.anything = 1
+    except AttributeError:
+      pass
+    else:
+      assert False
+
+def test_pickle():
+  """
+  Tests whether records survive pickling with their data
+  """
+  image = pickle.loads(pickle.dumps(Image(dict(image_data), key="secret")))
+  tag = pickle.loads(pickle.dumps(Tag({"id": 1, "name": "safe", "slug": "safe"})))
+
+  assert (image.id, image.score, image.tags, image.key) == (1, 10, ["safe", "rarity"], "secret")
+  assert (tag.id, tag.name, tag.slug) == (1, "safe", "safe")
+
+def test_vocabulary():
+  """
+  Tests whether TagVocabulary() keeps tags as numbers and decodes them back
+  """
+  vocabulary = TagVocabulary()
+  first = Image(dict(image_data), vocabulary=vocabulary)
+  second = Image({**image_data, "id": 2, "tags": ["rarity", "solo"]}, vocabulary=vocabulary)
+
+  assert first.data["tags"] == array("I", [0, 1])
+  assert second.data["tags"] == array("I", [1, 2])
+  assert first.data["tag_ids"] == array("I", [40482, 27141])
+  assert (first.tags, second.tags) == (["safe", "rarity"], ["rarity", "solo"])
+  assert len(vocabulary) == 3
+  assert vocabulary.decode(vocabulary.encode(["solo", "safe"])) == ["solo", "safe"]
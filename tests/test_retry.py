@@ -0,0 +1,107 @@
+from email.utils import formatdate
+from time import time
+
+from derpibooru import Session, Transport, Response, Retry, RetryError
+
+url = "https://derpibooru.org/api/v1/json/search/images"
+
+class ScriptTransport(Transport):
+  """
+  Answers requests with statuses (or raises exceptions) of script in order,
+  repeating the last one.
+  """
+  errors = (ConnectionError,)
+
+  def __init__(self, *script):
+    self.script = list(script)
+    self.requests = 0
+
+  def send(self, method, url, params=None, headers=None, json=None, proxies=None, timeout=None):
+    self.requests += 1
+    answer = self.script[min(self.requests, len(self.script)) - 1]
+    if isinstance(answer, Exception):
+      raise answer
+    status_code, headers = answer if isinstance(answer, tuple) else (answer, {})
+    return Response(status_code, headers, b"{}", url)
+
+def session_of(transport, monkeypatch, **kwargs):
+  """
+  Returns session without breaker whose pauses are kept in its waits list.
+  """
+  session = Session(transport=transport, retry=Retry(jitter=0, **kwargs), breaker=None)
+  session.waits = []
+  monkeypatch.setattr("derpibooru.session.sleep", session.waits.append)
+  return session
+
+def test_retry_after():
+  """
+  Tests whether Retry-After is read as seconds or HTTP date
+  """
+  retry = Retry()
+
+  assert retry.retry_after(Response(429, {"Retry-After": "7"}, b"")) == 7.0
+  date = formatdate(time() + 60, usegmt=True)
+  assert 58 <= retry.retry_after(Response(429, {"Retry-After": date}, b"")) <= 60
+  assert retry.retry_after(Response(429, {"Retry-After": "soon"}, b"")) is None
+  assert retry.retry_after(Response(429, {}, b"")) is None
+
+def test_retry_after_wait(monkeypatch):
+  """
+  Tests whether session waits Retry-After seconds instead of backoff
+  """
+  transport = ScriptTransport((429, {"Retry-After": "7"}), 200)
+  session = session_of(transport, monkeypatch)
+
+  assert session.get(url).status_code == 200
+  assert session.waits == [7.0]
+  assert session.retry.stats == {"retries": 1, "give_ups": 0}
+
+def test_give_up(monkeypatch):
+  """
+  Tests whether RetryError is raised after all attempts with growing pauses
+  """
+  transport = ScriptTransport(503)
+  session = session_of(transport, monkeypatch, attempts=4, backoff=0.5)
+
+  try:
+    session.get(url)
+  except RetryError as error:
+    assert (error.status_code, error.attempts) == (503, 4)
+  else:
+    assert False
+  assert session.waits == [0.5, 1.0, 2.0]
+  assert transport.requests == 4
+  assert session.retry.stats == {"retries": 3, "give_ups": 1}
+
+def test_no_raise(monkeypatch):
+  """
+  Tests whether the last response is returned without raise_errors
+  """
+  session = session_of(ScriptTransport(503), monkeypatch, attempts=2, raise_errors=False)
+
+  assert session.get(url).status_code == 503
+
+def test_connection_error(monkeypatch):
+  """
+  Tests whether connection errors are retried and the last one is raised
+  """
+  transport = ScriptTransport(ConnectionError("first"), ConnectionError("last"))
+  session = session_of(transport, monkeypatch, attempts=3, exceptions=(ConnectionError,))
+
+  try:
+    session.get(url)
+  except ConnectionError as error:
+    assert str(error) == "last"
+  else:
+    assert False
+  assert transport.requests == 3
+
+def test_post(monkeypatch):
+  """
+  Tests whether POST isn't retried by default
+  """
+  transport = ScriptTransport(503, 200)
+  session = session_of(transport, monkeypatch)
+
+  assert session.post(url).status_code == 503
+  assert transport.requests == 1
@@ -0,0 +1,103 @@
+from json import dumps
+from threading import Lock
+
+from derpibooru import Search, Session, Transport, Response
+
+class ImagesTransport(Transport):
+  """
+  Serves 120 images by pages or by id.lt/id.gt keyset terms without network,
+  and keeps parameters of every request.
+  """
+  def __init__(self):
+    self.requests = []
+    self._lock = Lock()
+
+  def send(self, method, url, params=None, headers=None, json=None, proxies=None, timeout=None):
+    with self._lock:
+      self.requests.append(dict(params))
+    ids = list(range(120, 0, -1))
+    for term in params.get("q", "*").split(","):
+      if term.startswith("id.lt:"):
+        ids = [id_number for id_number in ids if id_number < int(term[6:])]
+      elif term.startswith("id.gt:"):
+        ids = [id_number for id_number in ids if id_number > int(term[6:])]
+    if params.get("sd") == "asc":
+      ids.reverse()
+    per_page, page = int(params["per_page"]), int(params.get("page", 1))
+    images = [{"id": id_number, "tags": [], "score": id_number,
+               "created_at": f"2020-01-01T00:{id_number // 60:02}:{id_number % 60:02}Z"}
+              for id_number in ids[(page - 1) * per_page:page * per_page]]
+    body = {"images": images, "total": len(ids)}
+    return Response(200, {}, dumps(body).encode("utf-8"), url)
+
+def test_session():
+  """
+  Tests whether search and its images use given session
+  """
+  transport = ImagesTransport()
+  session = Session(transport=transport)
+  images = list(Search(session=session, limit=30))
+
+  assert [image.id for image in images] == list(range(120, 90, -1))
+  assert all(image.session is session for image in images)
+  assert len(transport.requests) == 2
+
+def test_pool_sizes():
+  """
+  Tests whether pool sizes are kept for every booru
+  """
+  session = Session(pool_sizes={"https://derpibooru.org/": 20})
+  session.pool_size("https://ponybooru.org", 4)
+
+  assert session.pool_sizes == {"https://derpibooru.org": 20, "https://ponybooru.org": 4}
+
+def test_prefetch():
+  """
+  Tests whether prefetched pages keep order and limit
+  """
+  transport = ImagesTransport()
+  search = Search(session=Session(transport=transport), limit=70).prefetch(2)
+
+  assert [image.id for image in search] == list(range(120, 50, -1))
+  assert [request["page"] for request in transport.requests] == [1, 2, 3]
+
+def test_parallel():
+  """
+  Tests whether pages requested in parallel keep order and limit
+  """
+  transport = ImagesTransport()
+  search = Search(session=Session(transport=transport), limit=70).parallel(4)
+
+  assert [image.id for image in search] == list(range(120, 50, -1))
+  assert sorted(request["page"] for request in transport.requests) == [1, 2, 3]
+
+def test_keyset():
+  """
+  Tests whether keyset pages are selected by id of the last image
+  """
+  transport = ImagesTransport()
+  search = Search(session=Session(transport=transport), limit=None).keyset()
+
+  assert [image.id for image in search] == list(range(120, 0, -1))
+  assert [request["q"] for request in transport.requests[:3]] == \
+         ["*", "(*),id.lt:96", "(*),id.lt:71"]
+  assert all(request["page"] == 1 for request in transport.requests)
+
+def test_keyset_ascending():
+  """
+  Tests whether keyset search goes up with ascending sorting
+  """
+  transport = ImagesTransport()
+  search = Search(session=Session(transport=transport), limit=60).ascending().keyset()
+
+  assert [image.id for image in search] == list(range(1, 61))
+  assert transport.requests[1]["q"] == "(*),id.gt:25"
+
+def test_keyset_score():
+  """
+  Tests whether keyset query of score sorting compares score and then id
+  """
+  transport = ImagesTransport()
+  list(Search(session=Session(transport=transport), limit=30).sort_by("score").keyset())
+
+  assert transport.requests[1]["q"] == "(*),(score.lt:96 || (score:96, id.lt:96))"
@@ -0,0 +1,61 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event, Lock
+from time import sleep
+
+from derpibooru import Session, Transport, Response
+
+url = "https://derpibooru.org/api/v1/json/search/images"
+
+class SlowTransport(Transport):
+  """
+  Holds every request until release is set and counts requests.
+  """
+  def __init__(self):
+    self.requests = 0
+    self.release = Event()
+    self._lock = Lock()
+
+  def send(self, method, url, params=None, headers=None, json=None, proxies=None, timeout=None):
+    with self._lock:
+      self.requests += 1
+    self.release.wait(5)
+    return Response(200, {}, b'{"images": [], "total": 0}', url)
+
+def get_together(session, transport, params_list, ready):
+  """
+  Sends requests from threads and lets them through when ready() is true.
+  """
+  with ThreadPoolExecutor(max_workers=len(params_list)) as pool:
+    futures = [pool.submit(session.get, url, params=params) for params in params_list]
+    for _ in range(5000):
+      if ready():
+        break
+      sleep(0.001)
+    transport.release.set()
+    return [future.result() for future in futures]
+
+def test_coalesced():
+  """
+  Tests whether the same requests in flight share one response
+  """
+  transport = SlowTransport()
+  session = Session(transport=transport)
+  params_list = [{"q": "safe", "page": 1}, {"page": 1, "q": "safe"}] * 4
+  responses = get_together(session, transport, params_list, lambda: session.flights.shared == 7)
+
+  assert transport.requests == 1
+  assert len({id(response) for response in responses}) == 1
+  assert session.flights.shared == 7
+  assert len(session.flights) == 0
+
+def test_different():
+  """
+  Tests whether requests with other parameters aren't coalesced
+  """
+  transport = SlowTransport()
+  session = Session(transport=transport)
+  params_list = [{"q": "safe", "page": page} for page in range(1, 5)]
+  get_together(session, transport, params_list, lambda: len(session.flights) == 4)
+
+  assert transport.requests == 4
+  assert session.flights.shared == 0
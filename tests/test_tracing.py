@@ -0,0 +1,69 @@
+from json import dumps, loads
+
+from derpibooru import Search, Session, Transport, Response, Tracer, MemoryExporter, \
+                       JSONLinesExporter
+
+class PagesTransport(Transport):
+  """
+  Serves 120 images by pages without network.
+  """
+  def send(self, method, url, params=None, headers=None, json=None, proxies=None, timeout=None):
+    per_page, page = int(params["per_page"]), int(params["page"])
+    ids = range(120 - (page - 1) * per_page, max(120 - page * per_page, 0), -1)
+    body = {"images": [{"id": id_number, "tags": []} for id_number in ids], "total": 120}
+    return Response(200, {}, dumps(body).encode("utf-8"), url)
+
+def test_spans():
+  """
+  Tests whether iteration, its pages and their requests are nested spans
+  """
+  exporter = MemoryExporter()
+  session = Session(transport=PagesTransport(), tracer=Tracer(exporter))
+  list(Search(session=session, limit=30))
+
+  spans = {span.span_id: span for span in exporter.spans}
+  names = sorted(span.name for span in exporter.spans)
+  assert names == ["GET search/images"] * 2 + ["iterate search/images"] + ["page"] * 2
+  iteration = next(span for span in exporter.spans if span.parent_id is None)
+  assert iteration.attributes["items"] == 30
+  assert len({span.trace_id for span in exporter.spans}) == 1
+  for span in exporter.spans:
+    if span.name == "page":
+      assert span.parent_id == iteration.span_id
+      assert span.attributes["items"] == 25
+    elif span.name.startswith("GET"):
+      assert spans[span.parent_id].name == "page"
+      assert span.attributes["status"] == 200
+  assert all(span.duration is not None for span in exporter.spans)
+
+def test_current_span():
+  """
+  Tests whether requests made for an item are children of its page
+  """
+  exporter = MemoryExporter()
+  tracer = Tracer(exporter)
+  session = Session(transport=PagesTransport(), tracer=tracer)
+  for image in Search(session=session, limit=1):
+    with tracer.span("process", id=image.id) as span:
+      assert tracer.current is span
+
+  process = next(span for span in exporter.spans if span.name == "process")
+  page = next(span for span in exporter.spans if span.name == "page")
+  assert process.parent_id == page.span_id
+  assert tracer.current is None
+
+def test_error_span(tmp_path):
+  """
+  Tests whether error is kept by span and written by JSONLinesExporter()
+  """
+  path = tmp_path / "trace.jsonl"
+  tracer = Tracer(JSONLinesExporter(str(path)))
+  try:
+    with tracer.span("failing"):
+      raise ValueError("broken")
+  except ValueError:
+    pass
+  tracer.close()
+
+  spans = [loads(line) for line in path.read_text().splitlines()]
+  assert [(span["name"], span["error"]) for span in spans] == [("failing", "ValueError: broken")]
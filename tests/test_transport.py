@@ -0,0 +1,96 @@
+import sys
+from json import dumps, loads
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+from urllib.parse import urlsplit, parse_qsl
+
+import pytest
+
+from derpibooru import Search, Session, HTTP2Transport
+
+class Handler(BaseHTTPRequestHandler):
+  """
+  Answers with 3 images and echoes parameters and headers of request.
+  """
+  def log_message(self, *args):
+    pass
+
+  def do_GET(self):
+    body = dumps({"images": [{"id": id_number, "tags": []} for id_number in (3, 2, 1)], "total": 3,
+                  "params": dict(parse_qsl(urlsplit(self.path).query)),
+                  "header": self.headers.get("X-Test")}).encode("utf-8")
+    self.send_response(200)
+    self.send_header("Content-Type", "application/json")
+    self.send_header("ETag", '"v1"')
+    self.send_header("Content-Length", str(len(body)))
+    self.end_headers()
+    self.wfile.write(body)
+
+@pytest.fixture
+def url_domain():
+  server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+  Thread(target=server.serve_forever, daemon=True).start()
+  yield f"http://127.0.0.1:{server.server_port}"
+  server.shutdown()
+  server.server_close()
+
+def check_transport(transport, url_domain):
+  url = f"{url_domain}/api/v1/json/search/images"
+  response = transport.send("GET", url, params={"q": "safe", "page": 2},
+                            headers={"X-Test": "yes"}, timeout=(5, 30))
+
+  assert response.status_code == 200
+  assert response.headers["etag"] == '"v1"'
+  assert response.json()["params"] == {"q": "safe", "page": "2"}
+  assert response.json()["header"] == "yes"
+  assert loads(response.text)["total"] == 3
+  session = Session(transport=transport)
+  assert [image.id for image in Search(url_domain=url_domain, session=session)] == [3, 2, 1]
+
+def test_requests(url_domain):
+  """
+  Tests whether RequestsTransport() sends parameters and headers and reads response
+  """
+  with Session(pool_sizes={url_domain: 3}) as session:
+    check_transport(session.transport, url_domain)
+    assert session.pool_sizes == {url_domain: 3}
+
+def test_http2(url_domain):
+  """
+  Tests whether HTTP2Transport() sends parameters and headers and reads response
+  """
+  pytest.importorskip("httpx")
+  transport = HTTP2Transport()
+  try:
+    check_transport(transport, url_domain)
+    assert Session(transport=transport).retry.exceptions == transport.errors
+  finally:
+    transport.close()
+
+def test_http2_error():
+  """
+  Tests whether failed connection raises one of errors of HTTP2Transport()
+  """
+  pytest.importorskip("httpx")
+  transport = HTTP2Transport()
+  try:
+    transport.send("GET", "http://127.0.0.1:1/api/v1/json/search/images", timeout=(1, 1))
+  except transport.errors:
+    pass
+  else:
+    assert False
+  finally:
+    transport.close()
+
+def test_http2_missing(monkeypatch):
+  """
+  Tests whether HTTP2Transport() explains how to install httpx
+  """
+  monkeypatch.setitem(sys.modules, "httpx", None)
+
+  try:
+    HTTP2Transport()
+  except ImportError as error:
+    assert "httpx[http2]" in str(error)
+  else:
+    assert False